@@ -1,16 +1,32 @@
 from __future__ import annotations
-from typing import List, Tuple, Dict, Callable, Type, Set
+from typing import List, Tuple, Dict, Callable, Type, Set, Deque, TYPE_CHECKING
 import os
+import sys
 import tempfile
 import time
 import json
-from datetime import datetime
+from datetime import datetime, timezone
 import uuid
+import heapq
+import struct
+import bisect
+import queue
+import threading
+import secrets
+import sqlite3
+import asyncio
+import socket
+import logging
+from collections import OrderedDict, deque
 from abc import ABC, abstractmethod
+from enum import Enum
 import webbrowser
 from austin_heller_repo.socket_queued_message_framework import ClientServerMessage, Structure, StructureStateEnum, ClientServerMessageTypeEnum, ClientMessengerFactory, StructureFactory, StructureInfluence, StructureTransitionException, ClientMessenger
 from austin_heller_repo.client_authentication_manager import OpenidAuthenticationRequestClientAuthenticationClientServerMessage, AuthenticationResponseClientAuthenticationClientServerMessage, UrlNavigationNeededResponseClientAuthenticationClientServerMessage, UnexpectedAuthenticationRequestClientAuthenticationClientServerMessage, UnexpectedOpenidAuthenticationResponseClientAuthenticationClientServerMessage
 from austin_heller_repo.threading import Semaphore, start_thread
+if TYPE_CHECKING:
+	# only used in annotations, so numpy is not imported unless a client interest manager is built
+	from austin_heller_repo.spatial_index import ClientInterestManager
 
 
 class GameManagerStructureStateEnum(StructureStateEnum):
@@ -26,106 +42,126 @@ class GameManagerClientServerMessageTypeEnum(ClientServerMessageTypeEnum):
 	AuthenticationTimeoutError = "authentication_timeout_error"
 	ClientAlreadyAuthenticatedError = "client_already_authenticated_error"
 	ClientAuthenticationManagerError = "client_authentication_manager_error"
+	ServerBusyError = "server_busy_error"
+	Batch = "batch"
+	DatagramChannelBind = "datagram_channel_bind"
+	EntityInterestUpdate = "entity_interest_update"
 
 
-class GameManagerClientServerMessage(ClientServerMessage, ABC):
+class GameManagerClientServerMessageMeta(type(ClientServerMessage)):
 
-	def __init__(self):
-		super().__init__()
+	__client_server_message_class_per_client_server_message_type = {}  # type: Dict[ClientServerMessageTypeEnum, Type[ClientServerMessage]]
 
-		pass
+	def __new__(mcs, name: str, bases: Tuple[type, ...], namespace: Dict, *, client_server_message_type: ClientServerMessageTypeEnum = None, field_names: Tuple[str, ...] = (), default_value_per_field_name: Dict[str, object] = None, is_response: bool = None, is_structural_influence: bool = None, is_ordered: bool = None, **kwargs):
 
-	@classmethod
-	def get_client_server_message_type_class(cls) -> Type[ClientServerMessageTypeEnum]:
-		return GameManagerClientServerMessageTypeEnum
+		if client_server_message_type is not None:
+			# the declaration is added before the class is created so that the abstract methods are computed with it in place
+			namespace["client_server_message_field_names"] = field_names
+			namespace["client_server_message_attribute_name_per_field_name"] = {field_name: f"_{name.lstrip('_')}__{field_name}" for field_name in field_names}
+			namespace["client_server_message_default_value_per_field_name"] = {} if default_value_per_field_name is None else dict(default_value_per_field_name)
+			namespace["get_client_server_message_type"] = classmethod(mcs.__get_constant_method(value=client_server_message_type))
+		# a subclass may override only a flag, such as a game message that opts out of ordering with is_ordered=False
+		for function_name, value in [("is_response", is_response), ("is_structural_influence", is_structural_influence), ("is_ordered", is_ordered)]:
+			if value is not None:
+				namespace[function_name] = mcs.__get_constant_method(value=value)
 
+		client_server_message_class = super().__new__(mcs, name, bases, namespace, **kwargs)
 
-class GameManagerErrorGameManagerClientServerMessage(GameManagerClientServerMessage):
+		if client_server_message_type is not None:
+			mcs.__client_server_message_class_per_client_server_message_type[client_server_message_type] = client_server_message_class
 
-	def __init__(self, *, structure_state_name: str, client_server_message_json_string: str, destination_uuid: str):
-		super().__init__()
+		return client_server_message_class
 
-		self.__structure_state_name = structure_state_name
-		self.__client_server_message_json_string = client_server_message_json_string
-		self.__destination_uuid = destination_uuid
+	def __init__(cls, name: str, bases: Tuple[type, ...], namespace: Dict, **kwargs):
+		super().__init__(name, bases, namespace)
 
-	def get_structure_state(self) -> GameManagerStructureStateEnum:
-		return GameManagerStructureStateEnum(self.__structure_state_name)
+	@staticmethod
+	def __get_constant_method(*, value: object) -> Callable:
 
-	def get_client_server_message(self) -> GameManagerClientServerMessage:
-		return GameManagerClientServerMessage.parse_from_json(
-			json_object=json.loads(self.__client_server_message_json_string)
-		)
+		def constant_method(self_or_cls) -> object:
+			return value
+
+		return constant_method
 
 	@classmethod
-	def get_client_server_message_type(cls) -> ClientServerMessageTypeEnum:
-		return GameManagerClientServerMessageTypeEnum.GameManagerError
+	def get_client_server_message_class_per_client_server_message_type(mcs) -> Dict[ClientServerMessageTypeEnum, Type[ClientServerMessage]]:
+		return mcs.__client_server_message_class_per_client_server_message_type
+
+
+class GameManagerClientServerMessage(ClientServerMessage, ABC, metaclass=GameManagerClientServerMessageMeta):
+
+	client_server_message_field_names = ()  # type: Tuple[str, ...]
+	client_server_message_attribute_name_per_field_name = {}  # type: Dict[str, str]
+	client_server_message_default_value_per_field_name = {}  # type: Dict[str, object]
+
+	def __init__(self, **value_per_field_name):
+		super().__init__()
+
+		client_server_message_class = self.__class__
+		for field_name in value_per_field_name:
+			if field_name not in client_server_message_class.client_server_message_attribute_name_per_field_name:
+				raise TypeError(f"{client_server_message_class.__name__} has no field {field_name}.")
+		# each field is stored under the mangled name that the hand-written getters of its class read
+		for field_name, attribute_name in client_server_message_class.client_server_message_attribute_name_per_field_name.items():
+			if field_name in value_per_field_name:
+				setattr(self, attribute_name, value_per_field_name[field_name])
+			elif field_name in client_server_message_class.client_server_message_default_value_per_field_name:
+				setattr(self, attribute_name, client_server_message_class.client_server_message_default_value_per_field_name[field_name])
+			else:
+				raise TypeError(f"{client_server_message_class.__name__} is missing field {field_name}.")
 
 	def to_json(self) -> Dict:
 		json_object = super().to_json()
-		json_object["structure_state_name"] = self.__structure_state_name
-		json_object["client_server_message_json_string"] = self.__client_server_message_json_string
-		json_object["destination_uuid"] = self.__destination_uuid
+		for field_name, attribute_name in self.__class__.client_server_message_attribute_name_per_field_name.items():
+			json_object[field_name] = getattr(self, attribute_name)
 		return json_object
 
-	def is_response(self) -> bool:
-		return True
-
 	def get_destination_uuid(self) -> str:
-		return self.__destination_uuid
+		attribute_name = self.__class__.client_server_message_attribute_name_per_field_name.get("destination_uuid", None)
+		return None if attribute_name is None else getattr(self, attribute_name)
 
-	def is_structural_influence(self) -> bool:
-		return False
+	@classmethod
+	def get_client_server_message_type_class(cls) -> Type[ClientServerMessageTypeEnum]:
+		return GameManagerClientServerMessageTypeEnum
 
-	def is_ordered(self) -> bool:
-		return True
+	@classmethod
+	def get_client_server_message_class(cls, *, client_server_message_type: ClientServerMessageTypeEnum) -> Type[ClientServerMessage]:
+		return GameManagerClientServerMessageMeta.get_client_server_message_class_per_client_server_message_type()[client_server_message_type]
 
 	def get_structural_error_client_server_message_response(self, *, structure_transition_exception: StructureTransitionException, destination_uuid: str) -> ClientServerMessage:
 		return None
 
 
-class AuthenticateClientRequestGameManagerClientServerMessage(GameManagerClientServerMessage):
-
-	def __init__(self):
-		super().__init__()
-
-		pass
-
-	@classmethod
-	def get_client_server_message_type(cls) -> ClientServerMessageTypeEnum:
-		return GameManagerClientServerMessageTypeEnum.AuthenticateClientRequest
+class GameManagerErrorGameManagerClientServerMessage(GameManagerClientServerMessage, client_server_message_type=GameManagerClientServerMessageTypeEnum.GameManagerError, field_names=("structure_state_name", "client_server_message_json", "destination_uuid"), is_response=True, is_structural_influence=False, is_ordered=True):
 
-	def to_json(self) -> Dict:
-		json_object = super().to_json()
-		return json_object
+	def get_structure_state(self) -> GameManagerStructureStateEnum:
+		return GameManagerStructureStateEnum(self.__structure_state_name)
 
-	def is_response(self) -> bool:
-		return False
+	def get_client_server_message(self) -> GameManagerClientServerMessage:
+		try:
+			return self.__client_server_message
+		except AttributeError:
+			# parse a copy so that to_json continues to return the nested message as it was received
+			self.__client_server_message = GameManagerClientServerMessage.parse_from_json(
+				json_object=dict(self.__client_server_message_json)
+			)
+			return self.__client_server_message
 
-	def get_destination_uuid(self) -> str:
-		return None
 
-	def is_structural_influence(self) -> bool:
-		return True
+class AuthenticateClientRequestGameManagerClientServerMessage(GameManagerClientServerMessage, client_server_message_type=GameManagerClientServerMessageTypeEnum.AuthenticateClientRequest, field_names=("session_token",), default_value_per_field_name={"session_token": None}, is_response=False, is_structural_influence=True, is_ordered=True):
 
-	def is_ordered(self) -> bool:
-		return True
+	def get_session_token(self) -> str:
+		return self.__session_token
 
 	def get_structural_error_client_server_message_response(self, *, structure_transition_exception: StructureTransitionException, destination_uuid: str) -> ClientServerMessage:
 		return GameManagerErrorGameManagerClientServerMessage(
 			structure_state_name=structure_transition_exception.get_structure_state().value,
-			client_server_message_json_string=json.dumps(structure_transition_exception.get_structure_influence().get_client_server_message().to_json()),
+			client_server_message_json=structure_transition_exception.get_structure_influence().get_client_server_message().to_json(),
 			destination_uuid=destination_uuid
 		)
 
 
-class UrlNavigationNeededResponseGameManagerClientServerMessage(GameManagerClientServerMessage):
-
-	def __init__(self, *, url: str, destination_uuid: str):
-		super().__init__()
-
-		self.__url = url
-		self.__destination_uuid = destination_uuid
+class UrlNavigationNeededResponseGameManagerClientServerMessage(GameManagerClientServerMessage, client_server_message_type=GameManagerClientServerMessageTypeEnum.UrlNavigationNeededResponse, field_names=("url", "destination_uuid"), is_response=True, is_structural_influence=False, is_ordered=True):
 
 	def get_url(self) -> str:
 		return self.__url
@@ -133,352 +169,3133 @@ class UrlNavigationNeededResponseGameManagerClientServerMessage(GameManagerClien
 	def navigate_to_url(self):
 		webbrowser.open(self.__url, new=2)
 
-	@classmethod
-	def get_client_server_message_type(cls) -> ClientServerMessageTypeEnum:
-		return GameManagerClientServerMessageTypeEnum.UrlNavigationNeededResponse
-
-	def to_json(self) -> Dict:
-		json_object = super().to_json()
-		json_object["url"] = self.__url
-		json_object["destination_uuid"] = self.__destination_uuid
-		return json_object
+	def get_structural_error_client_server_message_response(self, *, structure_transition_exception: StructureTransitionException, destination_uuid: str) -> ClientServerMessage:
+		return GameManagerErrorGameManagerClientServerMessage(
+			structure_state_name=structure_transition_exception.get_structure_state().value,
+			client_server_message_json=structure_transition_exception.get_structure_influence().get_client_server_message().to_json(),
+			destination_uuid=destination_uuid
+		)
 
-	def is_response(self) -> bool:
-		return True
 
-	def get_destination_uuid(self) -> str:
-		return self.__destination_uuid
+class AuthenticateClientResponseGameManagerClientServerMessage(GameManagerClientServerMessage, client_server_message_type=GameManagerClientServerMessageTypeEnum.AuthenticateClientResponse, field_names=("is_successful", "destination_uuid", "session_token"), default_value_per_field_name={"session_token": None}, is_response=True, is_structural_influence=False, is_ordered=True):
 
-	def is_structural_influence(self) -> bool:
-		return False
+	def is_successful(self) -> bool:
+		return self.__is_successful
 
-	def is_ordered(self) -> bool:
-		return True
+	def get_session_token(self) -> str:
+		return self.__session_token
 
 	def get_structural_error_client_server_message_response(self, *, structure_transition_exception: StructureTransitionException, destination_uuid: str) -> ClientServerMessage:
 		return GameManagerErrorGameManagerClientServerMessage(
 			structure_state_name=structure_transition_exception.get_structure_state().value,
-			client_server_message_json_string=json.dumps(structure_transition_exception.get_structure_influence().get_client_server_message().to_json()),
+			client_server_message_json=structure_transition_exception.get_structure_influence().get_client_server_message().to_json(),
 			destination_uuid=destination_uuid
 		)
 
 
-class AuthenticateClientResponseGameManagerClientServerMessage(GameManagerClientServerMessage):
+class AuthenticationTimeoutErrorGameManagerClientServerMessage(GameManagerClientServerMessage, client_server_message_type=GameManagerClientServerMessageTypeEnum.AuthenticationTimeoutError, field_names=("destination_uuid",), is_response=True, is_structural_influence=False, is_ordered=True):
 
-	def __init__(self, *, is_successful: bool, destination_uuid: str):
-		super().__init__()
+	pass
 
-		self.__is_successful = is_successful
-		self.__destination_uuid = destination_uuid
 
-	def is_successful(self) -> bool:
-		return self.__is_successful
+class ClientAlreadyAuthenticatedErrorGameManagerClientServerMessage(GameManagerClientServerMessage, client_server_message_type=GameManagerClientServerMessageTypeEnum.ClientAlreadyAuthenticatedError, field_names=("destination_uuid",), is_response=True, is_structural_influence=False, is_ordered=True):
 
-	@classmethod
-	def get_client_server_message_type(cls) -> ClientServerMessageTypeEnum:
-		return GameManagerClientServerMessageTypeEnum.AuthenticateClientResponse
+	pass
 
-	def to_json(self) -> Dict:
-		json_object = super().to_json()
-		json_object["is_successful"] = self.__is_successful
-		json_object["destination_uuid"] = self.__destination_uuid
-		return json_object
 
-	def is_response(self) -> bool:
-		return True
+class ClientAuthenticationManagerErrorGameManagerClientServerMessage(GameManagerClientServerMessage, client_server_message_type=GameManagerClientServerMessageTypeEnum.ClientAuthenticationManagerError, field_names=("message", "destination_uuid"), is_response=True, is_structural_influence=False, is_ordered=True):
 
-	def get_destination_uuid(self) -> str:
-		return self.__destination_uuid
+	def get_message(self) -> str:
+		return self.__message
 
-	def is_structural_influence(self) -> bool:
-		return False
 
-	def is_ordered(self) -> bool:
-		return True
+class ServerBusyErrorGameManagerClientServerMessage(GameManagerClientServerMessage, client_server_message_type=GameManagerClientServerMessageTypeEnum.ServerBusyError, field_names=("retry_after_milliseconds", "destination_uuid"), is_response=True, is_structural_influence=False, is_ordered=True):
 
-	def get_structural_error_client_server_message_response(self, *, structure_transition_exception: StructureTransitionException, destination_uuid: str) -> ClientServerMessage:
-		return GameManagerErrorGameManagerClientServerMessage(
-			structure_state_name=structure_transition_exception.get_structure_state().value,
-			client_server_message_json_string=json.dumps(structure_transition_exception.get_structure_influence().get_client_server_message().to_json()),
-			destination_uuid=destination_uuid
+	def get_retry_after_milliseconds(self) -> int:
+		return self.__retry_after_milliseconds
+
+
+class BatchGameManagerClientServerMessage(GameManagerClientServerMessage, client_server_message_type=GameManagerClientServerMessageTypeEnum.Batch, field_names=("client_server_message_jsons", "destination_uuid"), is_response=True, is_structural_influence=False, is_ordered=True):
+
+	def get_client_server_messages(self) -> List[GameManagerClientServerMessage]:
+		try:
+			return self.__client_server_messages
+		except AttributeError:
+			self.__client_server_messages = [
+				GameManagerClientServerMessage.parse_from_json(
+					json_object=dict(client_server_message_json)
+				) for client_server_message_json in self.__client_server_message_jsons
+			]
+			return self.__client_server_messages
+
+
+class DatagramChannelBindGameManagerClientServerMessage(GameManagerClientServerMessage, client_server_message_type=GameManagerClientServerMessageTypeEnum.DatagramChannelBind, field_names=("bind_token", "port", "destination_uuid"), is_response=True, is_structural_influence=False, is_ordered=True):
+
+	def get_bind_token(self) -> str:
+		return self.__bind_token
+
+	def get_port(self) -> int:
+		return self.__port
+
+
+class EntityInterestUpdateGameManagerClientServerMessage(GameManagerClientServerMessage, client_server_message_type=GameManagerClientServerMessageTypeEnum.EntityInterestUpdate, field_names=("entered_entity_indexes", "left_entity_indexes", "entity_jsons", "destination_uuid"), is_response=True, is_structural_influence=False, is_ordered=True):
+
+	def get_entered_entity_indexes(self) -> List[int]:
+		return self.__entered_entity_indexes
+
+	def get_left_entity_indexes(self) -> List[int]:
+		return self.__left_entity_indexes
+
+	def get_entity_jsons(self) -> List[Dict]:
+		return self.__entity_jsons
+
+
+def get_unbatched_callback(*, callback: Callable[[ClientServerMessage], None]) -> Callable[[ClientServerMessage], None]:
+
+	def unbatched_callback(client_server_message: ClientServerMessage):
+		if isinstance(client_server_message, BatchGameManagerClientServerMessage):
+			for batched_client_server_message in client_server_message.get_client_server_messages():
+				callback(batched_client_server_message)
+		else:
+			callback(client_server_message)
+
+	return unbatched_callback
+
+
+class GameManagerClientServerMessageBinaryCodec():
+
+	# type ids and field orders are part of the wire format, so existing entries must never be renumbered or reordered
+	__type_id_per_client_server_message_type = {
+		GameManagerClientServerMessageTypeEnum.GameManagerError: 1,
+		GameManagerClientServerMessageTypeEnum.AuthenticateClientRequest: 2,
+		GameManagerClientServerMessageTypeEnum.UrlNavigationNeededResponse: 3,
+		GameManagerClientServerMessageTypeEnum.AuthenticateClientResponse: 4,
+		GameManagerClientServerMessageTypeEnum.AuthenticationTimeoutError: 5,
+		GameManagerClientServerMessageTypeEnum.ClientAlreadyAuthenticatedError: 6,
+		GameManagerClientServerMessageTypeEnum.ClientAuthenticationManagerError: 7,
+		GameManagerClientServerMessageTypeEnum.ServerBusyError: 8,
+		GameManagerClientServerMessageTypeEnum.Batch: 9,
+		GameManagerClientServerMessageTypeEnum.DatagramChannelBind: 10,
+		GameManagerClientServerMessageTypeEnum.EntityInterestUpdate: 11
+	}  # type: Dict[GameManagerClientServerMessageTypeEnum, int]
+
+	__field_names_per_client_server_message_type = {
+		GameManagerClientServerMessageTypeEnum.GameManagerError: ("structure_state_name", "client_server_message_json", "destination_uuid"),
+		GameManagerClientServerMessageTypeEnum.AuthenticateClientRequest: ("session_token",),
+		GameManagerClientServerMessageTypeEnum.UrlNavigationNeededResponse: ("url", "destination_uuid"),
+		GameManagerClientServerMessageTypeEnum.AuthenticateClientResponse: ("is_successful", "destination_uuid", "session_token"),
+		GameManagerClientServerMessageTypeEnum.AuthenticationTimeoutError: ("destination_uuid",),
+		GameManagerClientServerMessageTypeEnum.ClientAlreadyAuthenticatedError: ("destination_uuid",),
+		GameManagerClientServerMessageTypeEnum.ClientAuthenticationManagerError: ("message", "destination_uuid"),
+		GameManagerClientServerMessageTypeEnum.ServerBusyError: ("retry_after_milliseconds", "destination_uuid"),
+		GameManagerClientServerMessageTypeEnum.Batch: ("client_server_message_jsons", "destination_uuid"),
+		GameManagerClientServerMessageTypeEnum.DatagramChannelBind: ("bind_token", "port", "destination_uuid"),
+		GameManagerClientServerMessageTypeEnum.EntityInterestUpdate: ("entered_entity_indexes", "left_entity_indexes", "entity_jsons", "destination_uuid")
+	}  # type: Dict[GameManagerClientServerMessageTypeEnum, Tuple[str, ...]]
+
+	__none_value_tag = 0
+	__false_value_tag = 1
+	__true_value_tag = 2
+	__integer_value_tag = 3
+	__float_value_tag = 4
+	__string_value_tag = 5
+	__uuid_value_tag = 6
+	__dict_value_tag = 7
+	__list_value_tag = 8
+	__client_server_message_value_tag = 9
+
+	__none_value_tag_bytes = bytes((__none_value_tag,))
+	__false_value_tag_bytes = bytes((__false_value_tag,))
+	__true_value_tag_bytes = bytes((__true_value_tag,))
+	__integer_value_tag_bytes = bytes((__integer_value_tag,))
+	__float_value_tag_bytes = bytes((__float_value_tag,))
+	__string_value_tag_bytes = bytes((__string_value_tag,))
+	__uuid_value_tag_bytes = bytes((__uuid_value_tag,))
+	__dict_value_tag_bytes = bytes((__dict_value_tag,))
+	__list_value_tag_bytes = bytes((__list_value_tag,))
+	__client_server_message_value_tag_bytes = bytes((__client_server_message_value_tag,))
+
+	__type_id_struct = struct.Struct(">H")
+	__integer_struct = struct.Struct(">q")
+	__float_struct = struct.Struct(">d")
+	__length_struct = struct.Struct(">I")
+
+	def __init__(self):
+
+		self.__client_server_message_type_per_type_id = {}  # type: Dict[int, GameManagerClientServerMessageTypeEnum]
+		self.__client_server_message_type_per_value = {}  # type: Dict[str, GameManagerClientServerMessageTypeEnum]
+
+		self.__initialize()
+
+	def __initialize(self):
+
+		for client_server_message_type in GameManagerClientServerMessageTypeEnum:
+			if client_server_message_type not in self.__type_id_per_client_server_message_type or client_server_message_type not in self.__field_names_per_client_server_message_type:
+				raise Exception(f"Missing binary codec type id or field names for {client_server_message_type}.")
+			self.__client_server_message_type_per_type_id[self.__type_id_per_client_server_message_type[client_server_message_type]] = client_server_message_type
+			self.__client_server_message_type_per_value[client_server_message_type.value] = client_server_message_type
+
+	def encode(self, *, client_server_message: GameManagerClientServerMessage) -> bytes:
+		byte_arrays = []  # type: List[bytes]
+		self.__encode_client_server_message_json(
+			client_server_message_json=client_server_message.to_json(),
+			byte_arrays=byte_arrays
+		)
+		return b"".join(byte_arrays)
+
+	def decode(self, *, client_server_message_bytes: bytes) -> GameManagerClientServerMessage:
+		client_server_message_json, index = self.__decode_client_server_message_json(
+			client_server_message_bytes=memoryview(client_server_message_bytes),
+			index=0
+		)
+		if index != len(client_server_message_bytes):
+			raise Exception(f"Unexpected trailing bytes after index {index} of {len(client_server_message_bytes)}.")
+		return GameManagerClientServerMessage.parse_from_json(
+			json_object=client_server_message_json
 		)
 
+	def __encode_client_server_message_json(self, *, client_server_message_json: Dict, byte_arrays: List[bytes]):
+		client_server_message_type = self.__client_server_message_type_per_value[client_server_message_json["__type"]]
+		field_names = self.__field_names_per_client_server_message_type[client_server_message_type]
+		if len(client_server_message_json) != len(field_names) + 1:
+			raise Exception(f"Unexpected fields for {client_server_message_type}: {sorted(client_server_message_json.keys())}.")
+		byte_arrays.append(self.__type_id_struct.pack(self.__type_id_per_client_server_message_type[client_server_message_type]))
+		for field_name in field_names:
+			self.__encode_value(
+				value=client_server_message_json[field_name],
+				byte_arrays=byte_arrays
+			)
+
+	def __decode_client_server_message_json(self, *, client_server_message_bytes: memoryview, index: int) -> Tuple[Dict, int]:
+		type_id, = self.__type_id_struct.unpack_from(client_server_message_bytes, index)
+		index += self.__type_id_struct.size
+		client_server_message_type = self.__client_server_message_type_per_type_id[type_id]
+		client_server_message_json = {
+			"__type": client_server_message_type.value
+		}
+		for field_name in self.__field_names_per_client_server_message_type[client_server_message_type]:
+			client_server_message_json[field_name], index = self.__decode_value(
+				client_server_message_bytes=client_server_message_bytes,
+				index=index
+			)
+		return client_server_message_json, index
+
+	def __encode_string(self, *, value: str, byte_arrays: List[bytes]):
+		value_bytes = value.encode("utf-8")
+		byte_arrays.append(self.__length_struct.pack(len(value_bytes)))
+		byte_arrays.append(value_bytes)
+
+	def __decode_string(self, *, client_server_message_bytes: memoryview, index: int) -> Tuple[str, int]:
+		length, = self.__length_struct.unpack_from(client_server_message_bytes, index)
+		index += self.__length_struct.size
+		return str(client_server_message_bytes[index:index + length], "utf-8"), index + length
+
+	def __encode_value(self, *, value, byte_arrays: List[bytes]):
+		if value is None:
+			byte_arrays.append(self.__none_value_tag_bytes)
+		elif value is True:
+			byte_arrays.append(self.__true_value_tag_bytes)
+		elif value is False:
+			byte_arrays.append(self.__false_value_tag_bytes)
+		elif isinstance(value, int):
+			byte_arrays.append(self.__integer_value_tag_bytes)
+			byte_arrays.append(self.__integer_struct.pack(value))
+		elif isinstance(value, float):
+			byte_arrays.append(self.__float_value_tag_bytes)
+			byte_arrays.append(self.__float_struct.pack(value))
+		elif isinstance(value, str):
+			uuid_bytes = None
+			# only canonical lowercase uuid strings are packed so that the decoded string is identical to the original
+			if len(value) == 36 and value[8] == "-" and value[13] == "-" and value[18] == "-" and value[23] == "-" and value == value.lower():
+				try:
+					uuid_bytes = bytes.fromhex(value[0:8] + value[9:13] + value[14:18] + value[19:23] + value[24:36])
+				except ValueError:
+					pass
+				# fromhex skips whitespace, which would otherwise shorten the packed value
+				if uuid_bytes is not None and len(uuid_bytes) != 16:
+					uuid_bytes = None
+			if uuid_bytes is not None:
+				byte_arrays.append(self.__uuid_value_tag_bytes)
+				byte_arrays.append(uuid_bytes)
+			else:
+				byte_arrays.append(self.__string_value_tag_bytes)
+				self.__encode_string(
+					value=value,
+					byte_arrays=byte_arrays
+				)
+		elif isinstance(value, dict):
+			if value.get("__type", None) in self.__client_server_message_type_per_value:
+				byte_arrays.append(self.__client_server_message_value_tag_bytes)
+				self.__encode_client_server_message_json(
+					client_server_message_json=value,
+					byte_arrays=byte_arrays
+				)
+			else:
+				byte_arrays.append(self.__dict_value_tag_bytes)
+				byte_arrays.append(self.__length_struct.pack(len(value)))
+				for key, dict_value in value.items():
+					self.__encode_string(
+						value=key,
+						byte_arrays=byte_arrays
+					)
+					self.__encode_value(
+						value=dict_value,
+						byte_arrays=byte_arrays
+					)
+		elif isinstance(value, (list, tuple)):
+			byte_arrays.append(self.__list_value_tag_bytes)
+			byte_arrays.append(self.__length_struct.pack(len(value)))
+			for list_value in value:
+				self.__encode_value(
+					value=list_value,
+					byte_arrays=byte_arrays
+				)
+		else:
+			raise Exception(f"Unexpected value type {type(value)}.")
+
+	def __decode_value(self, *, client_server_message_bytes: memoryview, index: int) -> Tuple[object, int]:
+		tag = client_server_message_bytes[index]
+		index += 1
+		if tag == self.__none_value_tag:
+			return None, index
+		elif tag == self.__true_value_tag:
+			return True, index
+		elif tag == self.__false_value_tag:
+			return False, index
+		elif tag == self.__integer_value_tag:
+			return self.__integer_struct.unpack_from(client_server_message_bytes, index)[0], index + self.__integer_struct.size
+		elif tag == self.__float_value_tag:
+			return self.__float_struct.unpack_from(client_server_message_bytes, index)[0], index + self.__float_struct.size
+		elif tag == self.__string_value_tag:
+			return self.__decode_string(
+				client_server_message_bytes=client_server_message_bytes,
+				index=index
+			)
+		elif tag == self.__uuid_value_tag:
+			uuid_hex = client_server_message_bytes[index:index + 16].hex()
+			return f"{uuid_hex[0:8]}-{uuid_hex[8:12]}-{uuid_hex[12:16]}-{uuid_hex[16:20]}-{uuid_hex[20:32]}", index + 16
+		elif tag == self.__client_server_message_value_tag:
+			return self.__decode_client_server_message_json(
+				client_server_message_bytes=client_server_message_bytes,
+				index=index
+			)
+		elif tag == self.__dict_value_tag:
+			length, = self.__length_struct.unpack_from(client_server_message_bytes, index)
+			index += self.__length_struct.size
+			dict_value = {}
+			for _ in range(length):
+				key, index = self.__decode_string(
+					client_server_message_bytes=client_server_message_bytes,
+					index=index
+				)
+				dict_value[key], index = self.__decode_value(
+					client_server_message_bytes=client_server_message_bytes,
+					index=index
+				)
+			return dict_value, index
+		elif tag == self.__list_value_tag:
+			length, = self.__length_struct.unpack_from(client_server_message_bytes, index)
+			index += self.__length_struct.size
+			list_value = []
+			for _ in range(length):
+				value, index = self.__decode_value(
+					client_server_message_bytes=client_server_message_bytes,
+					index=index
+				)
+				list_value.append(value)
+			return list_value, index
+		else:
+			raise Exception(f"Unexpected value tag {tag} at index {index - 1}.")
+
 
-class AuthenticationTimeoutErrorGameManagerClientServerMessage(GameManagerClientServerMessage):
+class StructuredLogFormatter(logging.Formatter):
 
-	def __init__(self, *, destination_uuid: str):
+	def __init__(self, *, field_names: Tuple[str, ...] = ("client_uuid", "authentication_uuid")):
 		super().__init__()
 
-		self.__destination_uuid = destination_uuid
+		self.__field_names = field_names
 
-	@classmethod
-	def get_client_server_message_type(cls) -> ClientServerMessageTypeEnum:
-		return GameManagerClientServerMessageTypeEnum.AuthenticationTimeoutError
+	def format(self, record: logging.LogRecord) -> str:
+		json_object = {
+			"time": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(),
+			"level": record.levelname,
+			"logger": record.name,
+			"message": record.getMessage()
+		}
+		for field_name in self.__field_names:
+			if hasattr(record, field_name):
+				json_object[field_name] = getattr(record, field_name)
+		if record.exc_info:
+			json_object["exception"] = self.formatException(record.exc_info)
+		return json.dumps(json_object)
 
-	def to_json(self) -> Dict:
-		json_object = super().to_json()
-		json_object["destination_uuid"] = self.__destination_uuid
-		return json_object
 
-	def is_response(self) -> bool:
-		return True
+class AsynchronousLogHandler(logging.Handler):
 
-	def get_destination_uuid(self) -> str:
-		return self.__destination_uuid
+	def __init__(self, *, handler: logging.Handler = None):
+		super().__init__()
 
-	def is_structural_influence(self) -> bool:
-		return False
+		if handler is None:
+			handler = logging.StreamHandler(sys.stdout)
+			handler.setFormatter(StructuredLogFormatter())
+
+		self.__handler = handler
+
+		self.__log_records = queue.Queue()  # type: queue.Queue
+		self.__is_closed = False
+		self.__writer_thread = start_thread(self.__writer_thread_method)
+
+	def emit(self, record: logging.LogRecord):
+		# formatting and writing are both left to the writer thread so that the logging thread only pays for the enqueue
+		self.__log_records.put_nowait(record)
+
+	def __writer_thread_method(self):
+		while True:
+			record = self.__log_records.get()
+			if record is None:
+				break
+			self.__handler.handle(record)
+
+	def close(self):
+		if not self.__is_closed:
+			self.__is_closed = True
+			self.__log_records.put(None)
+			self.__writer_thread.join()
+			self.__handler.close()
+		super().close()
+
+
+class DeadlineScheduler():
+
+	def __init__(self, *, worker_threads_total: int, logger: logging.Logger = None):
+
+		self.__worker_threads_total = worker_threads_total
+		self.__logger = logging.getLogger(f"{__name__}.{DeadlineScheduler.__name__}") if logger is None else logger
+
+		self.__deadlines = []  # type: List[Tuple[float, int, str]]
+		self.__deadline_per_deadline_key = {}  # type: Dict[str, Tuple[int, Callable[[], None]]]
+		self.__deadlines_condition = threading.Condition()
+		self.__deadline_index = 0
+		self.__expired_callbacks = queue.Queue()  # type: queue.Queue
+		self.__is_running = False
+		self.__scheduler_thread = None  # type: threading.Thread
+		self.__worker_threads = []  # type: List[threading.Thread]
+
+	def start(self):
+
+		self.__deadlines_condition.acquire()
+		if self.__is_running:
+			self.__deadlines_condition.release()
+			raise Exception(f"DeadlineScheduler already started.")
+		self.__is_running = True
+		self.__deadlines_condition.release()
+
+		self.__scheduler_thread = start_thread(self.__scheduler_thread_method)
+		for worker_thread_index in range(self.__worker_threads_total):
+			self.__worker_threads.append(start_thread(self.__worker_thread_method))
+
+	def schedule(self, *, deadline_key: str, delay_seconds: float, callback: Callable[[], None]):
+
+		deadline_time = time.monotonic() + delay_seconds
+
+		self.__deadlines_condition.acquire()
+		self.__deadline_index += 1
+		self.__deadline_per_deadline_key[deadline_key] = (self.__deadline_index, callback)
+		is_earliest_deadline = not self.__deadlines or deadline_time < self.__deadlines[0][0]
+		heapq.heappush(self.__deadlines, (deadline_time, self.__deadline_index, deadline_key))
+		if is_earliest_deadline:
+			self.__deadlines_condition.notify()
+		self.__deadlines_condition.release()
+
+	def cancel(self, *, deadline_key: str) -> bool:
+
+		self.__deadlines_condition.acquire()
+		is_cancelled = self.__deadline_per_deadline_key.pop(deadline_key, None) is not None
+		if len(self.__deadlines) > 64 and len(self.__deadlines) > 2 * len(self.__deadline_per_deadline_key):
+			# the heap is mostly made of cancelled deadlines, so drop them rather than waiting for them to expire
+			self.__deadlines = [
+				deadline for deadline in self.__deadlines
+				if deadline[2] in self.__deadline_per_deadline_key and self.__deadline_per_deadline_key[deadline[2]][0] == deadline[1]
+			]
+			heapq.heapify(self.__deadlines)
+		self.__deadlines_condition.release()
+
+		return is_cancelled
+
+	def get_pending_deadlines_total(self) -> int:
+		return len(self.__deadline_per_deadline_key)
+
+	def __scheduler_thread_method(self):
+
+		self.__deadlines_condition.acquire()
+		while self.__is_running:
+			now = time.monotonic()
+			while self.__deadlines and self.__deadlines[0][0] <= now:
+				deadline_time, deadline_index, deadline_key = heapq.heappop(self.__deadlines)
+				deadline = self.__deadline_per_deadline_key.get(deadline_key, None)
+				if deadline is not None and deadline[0] == deadline_index:
+					del self.__deadline_per_deadline_key[deadline_key]
+					self.__expired_callbacks.put(deadline[1])
+			if self.__deadlines:
+				self.__deadlines_condition.wait(self.__deadlines[0][0] - now)
+			else:
+				self.__deadlines_condition.wait()
+		self.__deadlines_condition.release()
 
-	def is_ordered(self) -> bool:
-		return True
+	def __worker_thread_method(self):
 
-	def get_structural_error_client_server_message_response(self, *, structure_transition_exception: StructureTransitionException, destination_uuid: str) -> ClientServerMessage:
-		return None
+		while True:
+			callback = self.__expired_callbacks.get()
+			if callback is None:
+				break
+			try:
+				callback()
+			except Exception as ex:
+				self.__logger.exception("__worker_thread_method: ex: %s", ex)
 
+	def dispose(self):
 
-class ClientAlreadyAuthenticatedErrorGameManagerClientServerMessage(GameManagerClientServerMessage):
+		self.__deadlines_condition.acquire()
+		self.__is_running = False
+		self.__deadlines.clear()
+		self.__deadline_per_deadline_key.clear()
+		self.__deadlines_condition.notify()
+		self.__deadlines_condition.release()
 
-	def __init__(self, *, destination_uuid: str):
-		super().__init__()
+		for worker_thread in self.__worker_threads:
+			self.__expired_callbacks.put(None)
 
-		self.__destination_uuid = destination_uuid
 
-	@classmethod
-	def get_client_server_message_type(cls) -> ClientServerMessageTypeEnum:
-		return GameManagerClientServerMessageTypeEnum.ClientAlreadyAuthenticatedError
+class AsyncioDeadlineScheduler():
 
-	def to_json(self) -> Dict:
-		json_object = super().to_json()
-		json_object["destination_uuid"] = self.__destination_uuid
-		return json_object
+	def __init__(self, *, loop: asyncio.AbstractEventLoop):
 
-	def is_response(self) -> bool:
-		return True
+		self.__loop = loop
 
-	def get_destination_uuid(self) -> str:
-		return self.__destination_uuid
+		self.__timer_handle_per_deadline_key = {}  # type: Dict[str, asyncio.TimerHandle]
 
-	def is_structural_influence(self) -> bool:
-		return False
+	def schedule(self, *, deadline_key: str, delay_seconds: float, callback: Callable[[], None]):
+		# like DeadlineScheduler but every call and callback stays on the event loop, so no lock is needed
+		timer_handle = self.__timer_handle_per_deadline_key.pop(deadline_key, None)
+		if timer_handle is not None:
+			timer_handle.cancel()
+		self.__timer_handle_per_deadline_key[deadline_key] = self.__loop.call_later(delay_seconds, self.__expire, deadline_key, callback)
 
-	def is_ordered(self) -> bool:
+	def __expire(self, deadline_key: str, callback: Callable[[], None]):
+		del self.__timer_handle_per_deadline_key[deadline_key]
+		callback()
+
+	def cancel(self, *, deadline_key: str) -> bool:
+		timer_handle = self.__timer_handle_per_deadline_key.pop(deadline_key, None)
+		if timer_handle is None:
+			return False
+		timer_handle.cancel()
 		return True
 
-	def get_structural_error_client_server_message_response(self, *, structure_transition_exception: StructureTransitionException, destination_uuid: str) -> ClientServerMessage:
-		return None
+	def get_pending_deadlines_total(self) -> int:
+		return len(self.__timer_handle_per_deadline_key)
 
+	def dispose(self):
+		for timer_handle in self.__timer_handle_per_deadline_key.values():
+			timer_handle.cancel()
+		self.__timer_handle_per_deadline_key.clear()
 
-class ClientAuthenticationManagerErrorGameManagerClientServerMessage(GameManagerClientServerMessage):
 
-	def __init__(self, *, message: str, destination_uuid: str):
-		super().__init__()
+class PendingAuthenticationResultEnum(Enum):
+	Added = "added"
+	AlreadyPending = "already_pending"
+	ClientAlreadyAuthenticated = "client_already_authenticated"
+	MaximumPendingAuthenticationsReached = "maximum_pending_authentications_reached"
 
-		self.__message = message
-		self.__destination_uuid = destination_uuid
 
-	def get_message(self) -> str:
-		return self.__message
+class AuthenticationCompletionResultEnum(Enum):
+	NotPending = "not_pending"
+	ClientAlreadyAuthenticated = "client_already_authenticated"
+	Completed = "completed"
 
-	@classmethod
-	def get_client_server_message_type(cls) -> ClientServerMessageTypeEnum:
-		return GameManagerClientServerMessageTypeEnum.ClientAuthenticationManagerError
 
-	def to_json(self) -> Dict:
-		json_object = super().to_json()
-		json_object["message"] = self.__message
-		json_object["destination_uuid"] = self.__destination_uuid
-		return json_object
+class AuthenticationStateStore(ABC):
 
-	def is_response(self) -> bool:
-		return True
+	@abstractmethod
+	def try_add_pending_authentication(self, *, client_uuid: str, authentication_uuid: str, maximum_pending_authentications_total: int = None) -> PendingAuthenticationResultEnum:
+		raise NotImplementedError()
 
-	def get_destination_uuid(self) -> str:
-		return self.__destination_uuid
+	@abstractmethod
+	def is_pending_authentication(self, *, client_uuid: str, authentication_uuid: str) -> bool:
+		raise NotImplementedError()
 
-	def is_structural_influence(self) -> bool:
-		return False
+	@abstractmethod
+	def get_pending_authentication_uuid(self, *, client_uuid: str) -> str:
+		raise NotImplementedError()
 
-	def is_ordered(self) -> bool:
-		return True
+	@abstractmethod
+	def try_remove_pending_authentication(self, *, client_uuid: str, authentication_uuid: str) -> bool:
+		raise NotImplementedError()
 
-	def get_structural_error_client_server_message_response(self, *, structure_transition_exception: StructureTransitionException, destination_uuid: str) -> ClientServerMessage:
-		return None
+	@abstractmethod
+	def try_complete_pending_authentication(self, *, client_uuid: str, authentication_uuid: str, authentication_id: str) -> AuthenticationCompletionResultEnum:
+		raise NotImplementedError()
 
+	@abstractmethod
+	def try_add_authentication(self, *, client_uuid: str, authentication_id: str) -> bool:
+		raise NotImplementedError()
 
-class GameManagerStructure(Structure):
+	@abstractmethod
+	def get_authentication_id(self, *, client_uuid: str) -> str:
+		raise NotImplementedError()
 
-	def __init__(self, *, client_authentication_client_messenger_factory: ClientMessengerFactory, authentication_timeout_seconds: float, is_debug: bool = False):
-		super().__init__(
-			states=GameManagerStructureStateEnum,
-			initial_state=GameManagerStructureStateEnum.Active  # TODO start UnderMaintenance
-		)
+	@abstractmethod
+	def refresh_client(self, *, client_uuid: str):
+		raise NotImplementedError()
 
-		self.__client_authentication_client_messenger_factory = client_authentication_client_messenger_factory
-		self.__authentication_timeout_seconds = authentication_timeout_seconds
-		self.__is_debug = is_debug
+	@abstractmethod
+	def remove_client(self, *, client_uuid: str) -> List[str]:
+		raise NotImplementedError()
 
-		self.__client_authentication_client_messenger = None  # type: ClientMessenger
-		self.__authentication_id_per_client_uuid = {}  # type: Dict[str, str]
-		self.__authentication_id_per_client_uuid_semaphore = Semaphore()
-		self.__found_exception = None  # type: Exception
-		self.__authentication_uuids = set()  # type: Set[str]
-		self.__authentication_uuids_semaphore = Semaphore()
+	@abstractmethod
+	def remove_idle_clients(self, *, idle_seconds: float) -> List[str]:
+		raise NotImplementedError()
 
-		self.add_transition(
-			client_server_message_type=GameManagerClientServerMessageTypeEnum.AuthenticateClientRequest,
-			start_structure_state=GameManagerStructureStateEnum.Active,
-			end_structure_state=GameManagerStructureStateEnum.Active,
-			on_transition=self.__authenticate_client_request_received
-		)
+	@abstractmethod
+	def get_pending_authentications_total(self) -> int:
+		raise NotImplementedError()
 
-		self.__initialize()
+	@abstractmethod
+	def get_authenticated_clients_total(self) -> int:
+		raise NotImplementedError()
 
-	def __initialize(self):
+	def dispose(self):
+		pass
 
-		self.__client_authentication_client_messenger = self.__client_authentication_client_messenger_factory.get_client_messenger()
 
-		self.__client_authentication_client_messenger.connect_to_server()
+class AuthenticationStateStoreFactory(ABC):
 
-		self.__client_authentication_client_messenger.receive_from_server(
-			callback=self.__client_authentication_client_messenger_callback,
-			on_exception=self.__client_authentication_client_messenger_on_exception
-		)
+	@abstractmethod
+	def get_authentication_state_store(self) -> AuthenticationStateStore:
+		raise NotImplementedError()
 
-	def __client_authentication_client_messenger_callback(self, client_server_message: ClientServerMessage):
-		print(f"{datetime.utcnow()}: GameManagerStructure: __client_authentication_client_messenger_callback: client_server_message: {client_server_message}")
-		if isinstance(client_server_message, UrlNavigationNeededResponseClientAuthenticationClientServerMessage):
-			external_metadata_json = client_server_message.get_external_metadata_json()
-			self.__authentication_uuids_semaphore.acquire()
-			if external_metadata_json["authentication_uuid"] in self.__authentication_uuids:
-				self.__authentication_uuids_semaphore.release()
-				self.send_response(
-					client_server_message=UrlNavigationNeededResponseGameManagerClientServerMessage(
-						url=client_server_message.get_url(),
-						destination_uuid=external_metadata_json["client_uuid"]
-					)
-				)
-			else:
-				if self.__is_debug:
-					print(f"{datetime.utcnow()}: GameManagerStructure: __client_authentication_client_messenger_callback: UrlNavigationNeededResponseClientAuthenticationClientServerMessage: authentication_uuid missing")
-				self.__authentication_uuids_semaphore.release()
-		elif isinstance(client_server_message, AuthenticationResponseClientAuthenticationClientServerMessage):
-			external_metadata_json = client_server_message.get_external_metadata_json()
-			self.__authentication_uuids_semaphore.acquire()
-			if external_metadata_json["authentication_uuid"] in self.__authentication_uuids:
-				self.__authentication_uuids.remove(external_metadata_json["authentication_uuid"])
-				self.__authentication_uuids_semaphore.release()
-
-				self.__authentication_id_per_client_uuid_semaphore.acquire()
-				if external_metadata_json["client_uuid"] in self.__authentication_id_per_client_uuid:
-					self.__authentication_id_per_client_uuid_semaphore.release()
-					self.send_response(
-						client_server_message=ClientAlreadyAuthenticatedErrorGameManagerClientServerMessage(
-							destination_uuid=external_metadata_json["client_uuid"]
-						)
-					)
-				else:
-					if client_server_message.is_successful():
-						self.__authentication_id_per_client_uuid[external_metadata_json["client_uuid"]] = client_server_message.get_authentication_id()
-					self.__authentication_id_per_client_uuid_semaphore.release()
-					self.send_response(
-						client_server_message=AuthenticateClientResponseGameManagerClientServerMessage(
-							is_successful=client_server_message.is_successful(),
-							destination_uuid=external_metadata_json["client_uuid"]
-						)
-					)
-			else:
-				if self.__is_debug:
-					print(f"{datetime.utcnow()}: GameManagerStructure: __client_authentication_client_messenger_callback: AuthenticationResponseClientAuthenticationClientServerMessage: authentication_uuid missing")
-				self.__authentication_uuids_semaphore.release()
-		elif isinstance(client_server_message, UnexpectedAuthenticationRequestClientAuthenticationClientServerMessage):
-			external_metadata_json = client_server_message.get_external_metadata_json()
-			self.send_response(
-				client_server_message=ClientAuthenticationManagerErrorGameManagerClientServerMessage(
-					message=f"Unexpected authentication request {client_server_message.get_client_server_message().__class__.get_client_server_message_type()} while in state {client_server_message.get_structure_state().value}",
-					destination_uuid=external_metadata_json["client_uuid"]
-				)
-			)
-		elif isinstance(client_server_message, UnexpectedOpenidAuthenticationResponseClientAuthenticationClientServerMessage):
-			print(f"Received OpenID Connect response unexpectedly as {client_server_message.get_client_server_message().__class__.get_client_server_message_type()} while in state {client_server_message.get_structure_state().value}")
+
+class PendingAuthenticationCounter():
+
+	def __init__(self):
+
+		self.__semaphore = Semaphore()
+		self.__pending_authentications_total = 0
+
+	def try_increment(self, *, maximum_pending_authentications_total: int) -> bool:
+		self.__semaphore.acquire()
+		if maximum_pending_authentications_total is not None and self.__pending_authentications_total >= maximum_pending_authentications_total:
+			is_incremented = False
 		else:
-			raise Exception(f"{datetime.utcnow()}: GameManagerStructure: __client_authentication_client_messenger_callback: Unexpected ClientAuthenticationClientServerMessage: {type(client_server_message)}.")
+			self.__pending_authentications_total += 1
+			is_incremented = True
+		self.__semaphore.release()
+		return is_incremented
 
-	def __client_authentication_client_messenger_on_exception(self, exception: Exception):
-		print(f"{datetime.utcnow()}: GameManagerStructure: __client_authentication_client_messenger_on_exception: exception: {exception}")
-		if self.__found_exception is None:
-			self.__found_exception = exception
+	def decrement(self):
+		self.__semaphore.acquire()
+		self.__pending_authentications_total -= 1
+		self.__semaphore.release()
 
-	def __authenticate_client_request_received(self, structure_influence: StructureInfluence):
+	def get_pending_authentications_total(self) -> int:
+		return self.__pending_authentications_total
 
-		openid_authentication_request = structure_influence.get_client_server_message()  # type: AuthenticateClientRequestGameManagerClientServerMessage
 
-		client_uuid = structure_influence.get_source_uuid()
+class AuthenticationStateStoreShard():
+
+	def __init__(self, *, pending_authentication_counter: PendingAuthenticationCounter):
+
+		# the counter is shared by every shard of a store, and its lock is only ever taken while holding a shard lock, never the other way around
+		self.__pending_authentication_counter = pending_authentication_counter
+
+		self.__semaphore = Semaphore()
+		self.__client_uuid_per_pending_authentication_uuid = {}  # type: Dict[str, str]
+		self.__pending_authentication_uuid_per_client_uuid = {}  # type: Dict[str, str]
+		self.__authentication_id_per_client_uuid = {}  # type: Dict[str, str]
+		self.__activity_time_per_client_uuid = OrderedDict()  # type: OrderedDict[str, float]
+
+	def __remove_pending_authentication(self, *, authentication_uuid: str) -> bool:
+		client_uuid = self.__client_uuid_per_pending_authentication_uuid.pop(authentication_uuid, None)
+		if client_uuid is None:
+			return False
+		del self.__pending_authentication_uuid_per_client_uuid[client_uuid]
+		self.__pending_authentication_counter.decrement()
+		return True
+
+	def __add_authentication(self, *, client_uuid: str, authentication_id: str):
+		self.__authentication_id_per_client_uuid[client_uuid] = authentication_id
+		self.__activity_time_per_client_uuid[client_uuid] = time.monotonic()
 
+	def try_add_pending_authentication(self, *, client_uuid: str, authentication_uuid: str, maximum_pending_authentications_total: int) -> PendingAuthenticationResultEnum:
+		self.__semaphore.acquire()
 		if client_uuid in self.__authentication_id_per_client_uuid:
-			self.send_response(
-				client_server_message=ClientAlreadyAuthenticatedErrorGameManagerClientServerMessage(
-					destination_uuid=client_uuid
+			pending_authentication_result = PendingAuthenticationResultEnum.ClientAlreadyAuthenticated
+		elif client_uuid in self.__pending_authentication_uuid_per_client_uuid:
+			pending_authentication_result = PendingAuthenticationResultEnum.AlreadyPending
+		elif not self.__pending_authentication_counter.try_increment(
+			maximum_pending_authentications_total=maximum_pending_authentications_total
+		):
+			pending_authentication_result = PendingAuthenticationResultEnum.MaximumPendingAuthenticationsReached
+		else:
+			self.__client_uuid_per_pending_authentication_uuid[authentication_uuid] = client_uuid
+			self.__pending_authentication_uuid_per_client_uuid[client_uuid] = authentication_uuid
+			pending_authentication_result = PendingAuthenticationResultEnum.Added
+		self.__semaphore.release()
+		return pending_authentication_result
+
+	def is_pending_authentication(self, *, authentication_uuid: str) -> bool:
+		return authentication_uuid in self.__client_uuid_per_pending_authentication_uuid
+
+	def get_pending_authentication_uuid(self, *, client_uuid: str) -> str:
+		return self.__pending_authentication_uuid_per_client_uuid.get(client_uuid, None)
+
+	def try_remove_pending_authentication(self, *, authentication_uuid: str) -> bool:
+		self.__semaphore.acquire()
+		is_removed = self.__remove_pending_authentication(
+			authentication_uuid=authentication_uuid
+		)
+		self.__semaphore.release()
+		return is_removed
+
+	def try_complete_pending_authentication(self, *, client_uuid: str, authentication_uuid: str, authentication_id: str) -> AuthenticationCompletionResultEnum:
+		self.__semaphore.acquire()
+		if not self.__remove_pending_authentication(
+			authentication_uuid=authentication_uuid
+		):
+			authentication_completion_result = AuthenticationCompletionResultEnum.NotPending
+		elif client_uuid in self.__authentication_id_per_client_uuid:
+			authentication_completion_result = AuthenticationCompletionResultEnum.ClientAlreadyAuthenticated
+		else:
+			if authentication_id is not None:
+				self.__add_authentication(
+					client_uuid=client_uuid,
+					authentication_id=authentication_id
 				)
+			authentication_completion_result = AuthenticationCompletionResultEnum.Completed
+		self.__semaphore.release()
+		return authentication_completion_result
+
+	def try_add_authentication(self, *, client_uuid: str, authentication_id: str) -> bool:
+		self.__semaphore.acquire()
+		if client_uuid in self.__authentication_id_per_client_uuid:
+			is_added = False
+		else:
+			self.__add_authentication(
+				client_uuid=client_uuid,
+				authentication_id=authentication_id
 			)
+			is_added = True
+		self.__semaphore.release()
+		return is_added
+
+	def get_authentication_id(self, *, client_uuid: str) -> str:
+		return self.__authentication_id_per_client_uuid.get(client_uuid, None)
+
+	def refresh_client(self, *, client_uuid: str):
+		self.__semaphore.acquire()
+		if client_uuid in self.__activity_time_per_client_uuid:
+			self.__activity_time_per_client_uuid[client_uuid] = time.monotonic()
+			self.__activity_time_per_client_uuid.move_to_end(client_uuid)
+		self.__semaphore.release()
+
+	def remove_client(self, *, client_uuid: str) -> List[str]:
+		self.__semaphore.acquire()
+		self.__authentication_id_per_client_uuid.pop(client_uuid, None)
+		self.__activity_time_per_client_uuid.pop(client_uuid, None)
+		authentication_uuid = self.__pending_authentication_uuid_per_client_uuid.get(client_uuid, None)
+		if authentication_uuid is None:
+			pending_authentication_uuids = []
 		else:
-			external_metadata_json = {
-				"client_uuid": client_uuid,
-				"authentication_uuid": str(uuid.uuid4())
-			}
-			self.__authentication_uuids_semaphore.acquire()
-			self.__authentication_uuids.add(external_metadata_json["authentication_uuid"])
-			self.__authentication_uuids_semaphore.release()
-			self.__client_authentication_client_messenger.send_to_server(
-				request_client_server_message=OpenidAuthenticationRequestClientAuthenticationClientServerMessage(
-					external_metadata_json=external_metadata_json
-				)
+			self.__remove_pending_authentication(
+				authentication_uuid=authentication_uuid
 			)
+			pending_authentication_uuids = [authentication_uuid]
+		self.__semaphore.release()
+		return pending_authentication_uuids
+
+	def remove_idle_clients(self, *, idle_seconds: float) -> List[str]:
+		idle_time = time.monotonic() - idle_seconds
+		client_uuids = []  # type: List[str]
+		self.__semaphore.acquire()
+		# clients are kept in order of their last activity so only the idle ones are ever visited
+		while self.__activity_time_per_client_uuid:
+			client_uuid, activity_time = next(iter(self.__activity_time_per_client_uuid.items()))
+			if activity_time > idle_time:
+				break
+			del self.__activity_time_per_client_uuid[client_uuid]
+			del self.__authentication_id_per_client_uuid[client_uuid]
+			client_uuids.append(client_uuid)
+		self.__semaphore.release()
+		return client_uuids
+
+	def get_authenticated_clients_total(self) -> int:
+		return len(self.__authentication_id_per_client_uuid)
+
+
+class ShardedAuthenticationStateStore(AuthenticationStateStore):
+
+	def __init__(self, *, shards_total: int):
+
+		if shards_total < 1:
+			raise Exception(f"At least one shard is required but {shards_total} were requested.")
+
+		self.__pending_authentication_counter = PendingAuthenticationCounter()
+		self.__shards = tuple(AuthenticationStateStoreShard(
+			pending_authentication_counter=self.__pending_authentication_counter
+		) for shard_index in range(shards_total))  # type: Tuple[AuthenticationStateStoreShard, ...]
+
+	def __get_shard(self, *, client_uuid: str) -> AuthenticationStateStoreShard:
+		# every entry of a client lives in the same shard so that each check-and-set only ever holds one lock
+		return self.__shards[hash(client_uuid) % len(self.__shards)]
+
+	def try_add_pending_authentication(self, *, client_uuid: str, authentication_uuid: str, maximum_pending_authentications_total: int = None) -> PendingAuthenticationResultEnum:
+		return self.__get_shard(
+			client_uuid=client_uuid
+		).try_add_pending_authentication(
+			client_uuid=client_uuid,
+			authentication_uuid=authentication_uuid,
+			maximum_pending_authentications_total=maximum_pending_authentications_total
+		)
 
-			def timeout_thread():
-				nonlocal external_metadata_json
+	def is_pending_authentication(self, *, client_uuid: str, authentication_uuid: str) -> bool:
+		return self.__get_shard(
+			client_uuid=client_uuid
+		).is_pending_authentication(
+			authentication_uuid=authentication_uuid
+		)
 
-				if self.__is_debug:
-					print(f"GameManagerStructure: __authenticate_client_request_received: timeout_thread: time.sleep: start")
-				time.sleep(self.__authentication_timeout_seconds)
-				if self.__is_debug:
-					print(f"GameManagerStructure: __authenticate_client_request_received: timeout_thread: time.sleep: end")
+	def get_pending_authentication_uuid(self, *, client_uuid: str) -> str:
+		return self.__get_shard(
+			client_uuid=client_uuid
+		).get_pending_authentication_uuid(
+			client_uuid=client_uuid
+		)
 
-				self.__authentication_uuids_semaphore.acquire()
-				if external_metadata_json["authentication_uuid"] in self.__authentication_uuids:
-					is_timeout = True
-					self.__authentication_uuids.remove(external_metadata_json["authentication_uuid"])
-				else:
-					is_timeout = False
-				self.__authentication_uuids_semaphore.release()
-
-				if is_timeout:
-					if self.__is_debug:
-						print(f"GameManagerStructure: __authenticate_client_request_received: timeout_thread: send_response: start")
-					self.send_response(
-						client_server_message=AuthenticationTimeoutErrorGameManagerClientServerMessage(
-							destination_uuid=external_metadata_json["client_uuid"]
-						)
-					)
-					if self.__is_debug:
-						print(f"GameManagerStructure: __authenticate_client_request_received: timeout_thread: send_response: end")
+	def try_remove_pending_authentication(self, *, client_uuid: str, authentication_uuid: str) -> bool:
+		return self.__get_shard(
+			client_uuid=client_uuid
+		).try_remove_pending_authentication(
+			authentication_uuid=authentication_uuid
+		)
 
-			start_thread(timeout_thread)
+	def try_complete_pending_authentication(self, *, client_uuid: str, authentication_uuid: str, authentication_id: str) -> AuthenticationCompletionResultEnum:
+		return self.__get_shard(
+			client_uuid=client_uuid
+		).try_complete_pending_authentication(
+			client_uuid=client_uuid,
+			authentication_uuid=authentication_uuid,
+			authentication_id=authentication_id
+		)
 
-	def dispose(self):
-		self.__client_authentication_client_messenger.dispose()
+	def try_add_authentication(self, *, client_uuid: str, authentication_id: str) -> bool:
+		return self.__get_shard(
+			client_uuid=client_uuid
+		).try_add_authentication(
+			client_uuid=client_uuid,
+			authentication_id=authentication_id
+		)
 
+	def get_authentication_id(self, *, client_uuid: str) -> str:
+		return self.__get_shard(
+			client_uuid=client_uuid
+		).get_authentication_id(
+			client_uuid=client_uuid
+		)
 
-class GameManagerStructureFactory(StructureFactory):
+	def refresh_client(self, *, client_uuid: str):
+		self.__get_shard(
+			client_uuid=client_uuid
+		).refresh_client(
+			client_uuid=client_uuid
+		)
+
+	def remove_client(self, *, client_uuid: str) -> List[str]:
+		return self.__get_shard(
+			client_uuid=client_uuid
+		).remove_client(
+			client_uuid=client_uuid
+		)
 
-	def __init__(self, *, client_authentication_client_messenger_factory: ClientMessengerFactory, authentication_timeout_seconds: float, is_debug: bool = False):
+	def remove_idle_clients(self, *, idle_seconds: float) -> List[str]:
+		client_uuids = []  # type: List[str]
+		for shard in self.__shards:
+			client_uuids.extend(shard.remove_idle_clients(
+				idle_seconds=idle_seconds
+			))
+		return client_uuids
 
-		self.__client_authentication_client_messenger_factory = client_authentication_client_messenger_factory
-		self.__authentication_timeout_seconds = authentication_timeout_seconds
-		self.__is_debug = is_debug
+	def get_pending_authentications_total(self) -> int:
+		return self.__pending_authentication_counter.get_pending_authentications_total()
 
-	def get_structure(self) -> Structure:
-		return GameManagerStructure(
-			client_authentication_client_messenger_factory=self.__client_authentication_client_messenger_factory,
-			authentication_timeout_seconds=self.__authentication_timeout_seconds,
+	def get_authenticated_clients_total(self) -> int:
+		return sum(shard.get_authenticated_clients_total() for shard in self.__shards)
+
+
+class ShardedAuthenticationStateStoreFactory(AuthenticationStateStoreFactory):
+
+	def __init__(self, *, shards_total: int):
+
+		self.__shards_total = shards_total
+
+	def get_authentication_state_store(self) -> AuthenticationStateStore:
+		return ShardedAuthenticationStateStore(
+			shards_total=self.__shards_total
+		)
+
+
+class SqliteAuthenticationStateStore(AuthenticationStateStore):
+
+	def __init__(self, *, database_file_path: str, busy_timeout_seconds: float):
+
+		self.__database_file_path = database_file_path
+		self.__busy_timeout_seconds = busy_timeout_seconds
+
+		self.__semaphore = Semaphore()
+		self.__connection = None  # type: sqlite3.Connection
+
+		self.__initialize()
+
+	def __initialize(self):
+
+		# transactions are opened explicitly so that every check and write happens under one immediate write lock
+		self.__connection = sqlite3.connect(self.__database_file_path, timeout=self.__busy_timeout_seconds, isolation_level=None, check_same_thread=False)
+		self.__connection.execute("PRAGMA journal_mode=WAL")
+		self.__connection.execute("PRAGMA synchronous=NORMAL")
+		# executescript commits any open transaction itself, and every statement in it is idempotent
+		# the total of pending authentications is kept by triggers so that the cap is checked without counting rows
+		self.__connection.executescript("""
+			BEGIN IMMEDIATE;
+			CREATE TABLE IF NOT EXISTS pending_authentication (
+				authentication_uuid TEXT PRIMARY KEY,
+				client_uuid TEXT NOT NULL UNIQUE
+			);
+			CREATE TABLE IF NOT EXISTS pending_authentication_total (
+				pending_authentication_total_id INTEGER PRIMARY KEY CHECK (pending_authentication_total_id = 0),
+				total INTEGER NOT NULL
+			);
+			INSERT OR IGNORE INTO pending_authentication_total (pending_authentication_total_id, total) SELECT 0, COUNT(*) FROM pending_authentication;
+			CREATE TRIGGER IF NOT EXISTS pending_authentication_inserted AFTER INSERT ON pending_authentication BEGIN
+				UPDATE pending_authentication_total SET total = total + 1 WHERE pending_authentication_total_id = 0;
+			END;
+			CREATE TRIGGER IF NOT EXISTS pending_authentication_deleted AFTER DELETE ON pending_authentication BEGIN
+				UPDATE pending_authentication_total SET total = total - 1 WHERE pending_authentication_total_id = 0;
+			END;
+			CREATE TABLE IF NOT EXISTS authentication (
+				client_uuid TEXT PRIMARY KEY,
+				authentication_id TEXT NOT NULL,
+				activity_time REAL NOT NULL
+			);
+			CREATE INDEX IF NOT EXISTS authentication_activity_time_index ON authentication (activity_time);
+			COMMIT;
+		""")
+
+	def __run_in_transaction(self, function: Callable[[sqlite3.Connection], object]) -> object:
+		self.__semaphore.acquire()
+		try:
+			self.__connection.execute("BEGIN IMMEDIATE")
+			try:
+				result = function(self.__connection)
+			except Exception:
+				self.__connection.execute("ROLLBACK")
+				raise
+			self.__connection.execute("COMMIT")
+			return result
+		finally:
+			self.__semaphore.release()
+
+	def __fetch_one(self, sql: str, parameters: Tuple) -> Tuple:
+		self.__semaphore.acquire()
+		try:
+			return self.__connection.execute(sql, parameters).fetchone()
+		finally:
+			self.__semaphore.release()
+
+	def try_add_pending_authentication(self, *, client_uuid: str, authentication_uuid: str, maximum_pending_authentications_total: int = None) -> PendingAuthenticationResultEnum:
+
+		def try_add_pending_authentication(connection: sqlite3.Connection) -> PendingAuthenticationResultEnum:
+			if connection.execute("SELECT 1 FROM authentication WHERE client_uuid = ?", (client_uuid,)).fetchone() is not None:
+				return PendingAuthenticationResultEnum.ClientAlreadyAuthenticated
+			if connection.execute("SELECT 1 FROM pending_authentication WHERE client_uuid = ?", (client_uuid,)).fetchone() is not None:
+				return PendingAuthenticationResultEnum.AlreadyPending
+			if maximum_pending_authentications_total is not None and connection.execute("SELECT total FROM pending_authentication_total WHERE pending_authentication_total_id = 0").fetchone()[0] >= maximum_pending_authentications_total:
+				return PendingAuthenticationResultEnum.MaximumPendingAuthenticationsReached
+			connection.execute("INSERT INTO pending_authentication (authentication_uuid, client_uuid) VALUES (?, ?)", (authentication_uuid, client_uuid))
+			return PendingAuthenticationResultEnum.Added
+
+		return self.__run_in_transaction(try_add_pending_authentication)
+
+	def is_pending_authentication(self, *, client_uuid: str, authentication_uuid: str) -> bool:
+		return self.__fetch_one("SELECT 1 FROM pending_authentication WHERE authentication_uuid = ?", (authentication_uuid,)) is not None
+
+	def get_pending_authentication_uuid(self, *, client_uuid: str) -> str:
+		row = self.__fetch_one("SELECT authentication_uuid FROM pending_authentication WHERE client_uuid = ?", (client_uuid,))
+		return None if row is None else row[0]
+
+	def try_remove_pending_authentication(self, *, client_uuid: str, authentication_uuid: str) -> bool:
+		return self.__run_in_transaction(lambda connection: connection.execute("DELETE FROM pending_authentication WHERE authentication_uuid = ?", (authentication_uuid,)).rowcount == 1)
+
+	def try_complete_pending_authentication(self, *, client_uuid: str, authentication_uuid: str, authentication_id: str) -> AuthenticationCompletionResultEnum:
+
+		def try_complete_pending_authentication(connection: sqlite3.Connection) -> AuthenticationCompletionResultEnum:
+			if connection.execute("DELETE FROM pending_authentication WHERE authentication_uuid = ?", (authentication_uuid,)).rowcount == 0:
+				return AuthenticationCompletionResultEnum.NotPending
+			if connection.execute("SELECT 1 FROM authentication WHERE client_uuid = ?", (client_uuid,)).fetchone() is not None:
+				return AuthenticationCompletionResultEnum.ClientAlreadyAuthenticated
+			if authentication_id is not None:
+				connection.execute("INSERT INTO authentication (client_uuid, authentication_id, activity_time) VALUES (?, ?, ?)", (client_uuid, authentication_id, time.time()))
+			return AuthenticationCompletionResultEnum.Completed
+
+		return self.__run_in_transaction(try_complete_pending_authentication)
+
+	def try_add_authentication(self, *, client_uuid: str, authentication_id: str) -> bool:
+		return self.__run_in_transaction(lambda connection: connection.execute("INSERT OR IGNORE INTO authentication (client_uuid, authentication_id, activity_time) VALUES (?, ?, ?)", (client_uuid, authentication_id, time.time())).rowcount == 1)
+
+	def get_authentication_id(self, *, client_uuid: str) -> str:
+		row = self.__fetch_one("SELECT authentication_id FROM authentication WHERE client_uuid = ?", (client_uuid,))
+		return None if row is None else row[0]
+
+	def refresh_client(self, *, client_uuid: str):
+		self.__run_in_transaction(lambda connection: connection.execute("UPDATE authentication SET activity_time = ? WHERE client_uuid = ?", (time.time(), client_uuid)))
+
+	def remove_client(self, *, client_uuid: str) -> List[str]:
+
+		def remove_client(connection: sqlite3.Connection) -> List[str]:
+			connection.execute("DELETE FROM authentication WHERE client_uuid = ?", (client_uuid,))
+			pending_authentication_uuids = [row[0] for row in connection.execute("SELECT authentication_uuid FROM pending_authentication WHERE client_uuid = ?", (client_uuid,))]
+			connection.execute("DELETE FROM pending_authentication WHERE client_uuid = ?", (client_uuid,))
+			return pending_authentication_uuids
+
+		return self.__run_in_transaction(remove_client)
+
+	def remove_idle_clients(self, *, idle_seconds: float) -> List[str]:
+
+		# wall clock time is used since the activity times are compared across processes
+		idle_time = time.time() - idle_seconds
+
+		def remove_idle_clients(connection: sqlite3.Connection) -> List[str]:
+			client_uuids = [row[0] for row in connection.execute("SELECT client_uuid FROM authentication WHERE activity_time <= ?", (idle_time,))]
+			connection.execute("DELETE FROM authentication WHERE activity_time <= ?", (idle_time,))
+			return client_uuids
+
+		return self.__run_in_transaction(remove_idle_clients)
+
+	def get_pending_authentications_total(self) -> int:
+		return self.__fetch_one("SELECT total FROM pending_authentication_total WHERE pending_authentication_total_id = 0", ())[0]
+
+	def get_authenticated_clients_total(self) -> int:
+		return self.__fetch_one("SELECT COUNT(*) FROM authentication", ())[0]
+
+	def dispose(self):
+		self.__semaphore.acquire()
+		self.__connection.close()
+		self.__semaphore.release()
+
+
+class SqliteAuthenticationStateStoreFactory(AuthenticationStateStoreFactory):
+
+	def __init__(self, *, database_file_path: str, busy_timeout_seconds: float = 5.0):
+
+		self.__database_file_path = database_file_path
+		self.__busy_timeout_seconds = busy_timeout_seconds
+
+	def get_authentication_state_store(self) -> AuthenticationStateStore:
+		return SqliteAuthenticationStateStore(
+			database_file_path=self.__database_file_path,
+			busy_timeout_seconds=self.__busy_timeout_seconds
+		)
+
+
+class AuthenticationSessionTokenCache():
+
+	def __init__(self, *, time_to_live_seconds: float, maximum_session_tokens_total: int):
+
+		self.__time_to_live_seconds = time_to_live_seconds
+		self.__maximum_session_tokens_total = maximum_session_tokens_total
+
+		self.__authentication_id_and_expiry_time_per_session_token = OrderedDict()  # type: OrderedDict[str, Tuple[str, float]]
+		self.__semaphore = Semaphore()
+
+	def add_authentication_id(self, *, authentication_id: str) -> str:
+		session_token = secrets.token_urlsafe(32)
+		self.__semaphore.acquire()
+		self.__authentication_id_and_expiry_time_per_session_token[session_token] = (authentication_id, time.monotonic() + self.__time_to_live_seconds)
+		while len(self.__authentication_id_and_expiry_time_per_session_token) > self.__maximum_session_tokens_total:
+			self.__authentication_id_and_expiry_time_per_session_token.popitem(last=False)
+		self.__semaphore.release()
+		return session_token
+
+	def try_pop_authentication_id(self, *, session_token: str) -> str:
+		# session tokens are single use so that a leaked token is only good until its owner reconnects
+		self.__semaphore.acquire()
+		authentication_id_and_expiry_time = self.__authentication_id_and_expiry_time_per_session_token.pop(session_token, None)
+		self.__semaphore.release()
+		if authentication_id_and_expiry_time is None or authentication_id_and_expiry_time[1] <= time.monotonic():
+			return None
+		return authentication_id_and_expiry_time[0]
+
+	def get_session_tokens_total(self) -> int:
+		return len(self.__authentication_id_and_expiry_time_per_session_token)
+
+
+class AuthenticationSessionTokenCacheFactory():
+
+	def __init__(self, *, time_to_live_seconds: float, maximum_session_tokens_total: int):
+
+		self.__time_to_live_seconds = time_to_live_seconds
+		self.__maximum_session_tokens_total = maximum_session_tokens_total
+
+	def get_authentication_session_token_cache(self) -> AuthenticationSessionTokenCache:
+		return AuthenticationSessionTokenCache(
+			time_to_live_seconds=self.__time_to_live_seconds,
+			maximum_session_tokens_total=self.__maximum_session_tokens_total
+		)
+
+
+class TokenBucketRateLimiter():
+
+	def __init__(self, *, tokens_per_second: float, maximum_tokens_total: int):
+
+		self.__tokens_per_second = tokens_per_second
+		self.__maximum_tokens_total = maximum_tokens_total
+
+		self.__tokens_total_and_update_time_per_key = {}  # type: Dict[str, Tuple[float, float]]
+		self.__semaphore = Semaphore()
+
+	def try_acquire_token(self, *, key: str) -> float:
+		now = time.monotonic()
+		self.__semaphore.acquire()
+		tokens_total, update_time = self.__tokens_total_and_update_time_per_key.get(key, (self.__maximum_tokens_total, now))
+		tokens_total = min(self.__maximum_tokens_total, tokens_total + (now - update_time) * self.__tokens_per_second)
+		if tokens_total >= 1:
+			self.__tokens_total_and_update_time_per_key[key] = (tokens_total - 1, now)
+			retry_after_seconds = 0.0
+		else:
+			self.__tokens_total_and_update_time_per_key[key] = (tokens_total, now)
+			retry_after_seconds = (1 - tokens_total) / self.__tokens_per_second
+		self.__semaphore.release()
+		return retry_after_seconds
+
+	def remove_key(self, *, key: str):
+		self.__semaphore.acquire()
+		self.__tokens_total_and_update_time_per_key.pop(key, None)
+		self.__semaphore.release()
+
+	def get_keys_total(self) -> int:
+		return len(self.__tokens_total_and_update_time_per_key)
+
+
+class LatencyHistogram():
+
+	def __init__(self, *, bucket_upper_bounds_seconds: Tuple[float, ...]):
+
+		self.__bucket_upper_bounds_seconds = tuple(sorted(bucket_upper_bounds_seconds))
+
+		self.__bucket_totals = [0] * (len(self.__bucket_upper_bounds_seconds) + 1)  # type: List[int]
+		self.__observations_total = 0
+		self.__seconds_total = 0.0
+		self.__semaphore = Semaphore()
+
+	def observe(self, *, seconds: float):
+		bucket_index = bisect.bisect_left(self.__bucket_upper_bounds_seconds, seconds)
+		self.__semaphore.acquire()
+		self.__bucket_totals[bucket_index] += 1
+		self.__observations_total += 1
+		self.__seconds_total += seconds
+		self.__semaphore.release()
+
+	def get_snapshot(self) -> Dict:
+		self.__semaphore.acquire()
+		bucket_totals = list(self.__bucket_totals)
+		observations_total = self.__observations_total
+		seconds_total = self.__seconds_total
+		self.__semaphore.release()
+
+		cumulative_bucket_totals = {}  # type: Dict[str, int]
+		cumulative_total = 0
+		for bucket_upper_bound_seconds, bucket_total in zip(self.__bucket_upper_bounds_seconds + (float("inf"), ), bucket_totals):
+			cumulative_total += bucket_total
+			cumulative_bucket_totals[str(bucket_upper_bound_seconds)] = cumulative_total
+
+		return {
+			"buckets": cumulative_bucket_totals,
+			"count": observations_total,
+			"sum": seconds_total
+		}
+
+
+class GameManagerStructureMetrics():
+
+	def __init__(self, *, bucket_upper_bounds_seconds: Tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)):
+
+		self.__counter_per_name = {
+			"authentication_requests_total": 0,
+			"authentication_requests_coalesced_total": 0,
+			"authentication_requests_resumed_total": 0,
+			"authentication_requests_rejected_busy_total": 0,
+			"authentication_requests_rejected_already_authenticated_total": 0,
+			"authentication_requests_failed_upstream_total": 0,
+			"url_navigations_total": 0,
+			"authentication_responses_total": 0,
+			"authentication_responses_successful_total": 0,
+			"authentication_timeouts_total": 0
+		}  # type: Dict[str, int]
+		self.__latency_histogram_per_name = {
+			"request_to_url_navigation_seconds": LatencyHistogram(
+				bucket_upper_bounds_seconds=bucket_upper_bounds_seconds
+			),
+			"request_to_response_seconds": LatencyHistogram(
+				bucket_upper_bounds_seconds=bucket_upper_bounds_seconds
+			)
+		}  # type: Dict[str, LatencyHistogram]
+		self.__request_time_per_authentication_uuid = {}  # type: Dict[str, float]
+		self.__semaphore = Semaphore()
+
+	def increment_counter(self, *, name: str):
+		self.__semaphore.acquire()
+		self.__counter_per_name[name] += 1
+		self.__semaphore.release()
+
+	def start_authentication(self, *, authentication_uuid: str):
+		self.__request_time_per_authentication_uuid[authentication_uuid] = time.monotonic()
+
+	def url_navigation_received(self, *, authentication_uuid: str):
+		request_time = self.__request_time_per_authentication_uuid.get(authentication_uuid, None)
+		if request_time is not None:
+			self.__latency_histogram_per_name["request_to_url_navigation_seconds"].observe(
+				seconds=time.monotonic() - request_time
+			)
+		self.increment_counter(
+			name="url_navigations_total"
+		)
+
+	def authentication_response_received(self, *, authentication_uuid: str, is_successful: bool):
+		request_time = self.__request_time_per_authentication_uuid.pop(authentication_uuid, None)
+		if request_time is not None:
+			self.__latency_histogram_per_name["request_to_response_seconds"].observe(
+				seconds=time.monotonic() - request_time
+			)
+		self.increment_counter(
+			name="authentication_responses_total"
+		)
+		if is_successful:
+			self.increment_counter(
+				name="authentication_responses_successful_total"
+			)
+
+	def authentication_timed_out(self, *, authentication_uuid: str):
+		self.__request_time_per_authentication_uuid.pop(authentication_uuid, None)
+		self.increment_counter(
+			name="authentication_timeouts_total"
+		)
+
+	def cancel_authentication(self, *, authentication_uuid: str):
+		self.__request_time_per_authentication_uuid.pop(authentication_uuid, None)
+
+	def get_snapshot(self) -> Dict:
+		self.__semaphore.acquire()
+		counters = dict(self.__counter_per_name)
+		self.__semaphore.release()
+
+		started_authentications_total = counters["authentication_requests_total"] - counters["authentication_requests_coalesced_total"] - counters["authentication_requests_resumed_total"] - counters["authentication_requests_rejected_busy_total"] - counters["authentication_requests_rejected_already_authenticated_total"] - counters["authentication_requests_failed_upstream_total"]
+
+		return {
+			"counters": counters,
+			"histograms": {
+				name: latency_histogram.get_snapshot() for name, latency_histogram in self.__latency_histogram_per_name.items()
+			},
+			"authentication_timeout_rate": counters["authentication_timeouts_total"] / started_authentications_total if started_authentications_total > 0 else 0.0
+		}
+
+
+class UnorderedResponseSender():
+
+	def __init__(self, *, worker_threads_total: int, send_response: Callable[[ClientServerMessage], None], logger: logging.Logger = None):
+
+		self.__worker_threads_total = worker_threads_total
+		self.__send_response = send_response
+		self.__logger = logging.getLogger(f"{__name__}.{UnorderedResponseSender.__name__}") if logger is None else logger
+
+		self.__client_server_messages = queue.Queue()  # type: queue.Queue
+		self.__worker_threads = []  # type: List[threading.Thread]
+
+	def start(self):
+
+		if self.__worker_threads:
+			raise Exception(f"UnorderedResponseSender already started.")
+
+		for worker_thread_index in range(self.__worker_threads_total):
+			self.__worker_threads.append(start_thread(self.__worker_thread_method))
+
+	def send(self, *, client_server_message: ClientServerMessage):
+		self.__client_server_messages.put(client_server_message)
+
+	def get_queued_client_server_messages_total(self) -> int:
+		return self.__client_server_messages.qsize()
+
+	def __worker_thread_method(self):
+
+		while True:
+			client_server_message = self.__client_server_messages.get()
+			if client_server_message is None:
+				break
+			try:
+				self.__send_response(client_server_message)
+			except Exception as ex:
+				self.__logger.exception("__worker_thread_method: ex: %s", ex)
+
+	def dispose(self):
+
+		# queued messages are still sent since each worker only stops once it reaches its marker
+		for worker_thread in self.__worker_threads:
+			self.__client_server_messages.put(None)
+
+
+class ResponseClientServerMessageBatcher():
+
+	def __init__(self, *, flush_seconds: float, maximum_client_server_messages_total: int, deadline_scheduler: DeadlineScheduler, send_response: Callable[[ClientServerMessage], None]):
+
+		self.__flush_seconds = flush_seconds
+		self.__maximum_client_server_messages_total = maximum_client_server_messages_total
+		self.__deadline_scheduler = deadline_scheduler
+		self.__send_response = send_response
+
+		self.__semaphore = Semaphore()
+		self.__client_server_messages_per_destination_uuid = {}  # type: Dict[str, List[GameManagerClientServerMessage]]
+		self.__outgoing_client_server_messages_per_destination_uuid = {}  # type: Dict[str, Deque[List[GameManagerClientServerMessage]]]
+
+	def __get_deadline_key(self, *, destination_uuid: str) -> str:
+		return f"response_batch:{destination_uuid}"
+
+	def __try_take_batch(self, *, destination_uuid: str) -> bool:
+		# must be called while holding the semaphore, returning True if the caller is now responsible for sending this destination's batches
+		client_server_messages = self.__client_server_messages_per_destination_uuid.pop(destination_uuid, None)
+		if client_server_messages is None:
+			return False
+		outgoing_client_server_messages = self.__outgoing_client_server_messages_per_destination_uuid.get(destination_uuid, None)
+		if outgoing_client_server_messages is not None:
+			# another thread is already sending to this destination and will send this batch after its own
+			outgoing_client_server_messages.append(client_server_messages)
+			return False
+		self.__outgoing_client_server_messages_per_destination_uuid[destination_uuid] = deque([client_server_messages])
+		return True
+
+	def __send_batches(self, *, destination_uuid: str):
+		# sending happens outside of the semaphore while still keeping every batch for the same destination in order
+		while True:
+			self.__semaphore.acquire()
+			outgoing_client_server_messages = self.__outgoing_client_server_messages_per_destination_uuid[destination_uuid]
+			if not outgoing_client_server_messages:
+				del self.__outgoing_client_server_messages_per_destination_uuid[destination_uuid]
+				self.__semaphore.release()
+				break
+			client_server_messages = outgoing_client_server_messages.popleft()
+			self.__semaphore.release()
+
+			if len(client_server_messages) == 1:
+				self.__send_response(client_server_messages[0])
+			else:
+				self.__send_response(BatchGameManagerClientServerMessage(
+					client_server_message_jsons=[client_server_message.to_json() for client_server_message in client_server_messages],
+					destination_uuid=destination_uuid
+				))
+
+	def add(self, *, client_server_message: GameManagerClientServerMessage):
+		destination_uuid = client_server_message.get_destination_uuid()
+		self.__semaphore.acquire()
+		client_server_messages = self.__client_server_messages_per_destination_uuid.get(destination_uuid, None)
+		if client_server_messages is None:
+			client_server_messages = []
+			self.__client_server_messages_per_destination_uuid[destination_uuid] = client_server_messages
+			self.__deadline_scheduler.schedule(
+				deadline_key=self.__get_deadline_key(
+					destination_uuid=destination_uuid
+				),
+				delay_seconds=self.__flush_seconds,
+				callback=lambda: self.flush(
+					destination_uuid=destination_uuid
+				)
+			)
+		client_server_messages.append(client_server_message)
+		if len(client_server_messages) >= self.__maximum_client_server_messages_total:
+			self.__deadline_scheduler.cancel(
+				deadline_key=self.__get_deadline_key(
+					destination_uuid=destination_uuid
+				)
+			)
+			is_sending = self.__try_take_batch(
+				destination_uuid=destination_uuid
+			)
+		else:
+			is_sending = False
+		self.__semaphore.release()
+
+		if is_sending:
+			self.__send_batches(
+				destination_uuid=destination_uuid
+			)
+
+	def flush(self, *, destination_uuid: str):
+		self.__semaphore.acquire()
+		is_sending = self.__try_take_batch(
+			destination_uuid=destination_uuid
+		)
+		self.__semaphore.release()
+
+		if is_sending:
+			self.__send_batches(
+				destination_uuid=destination_uuid
+			)
+
+	def flush_all(self):
+		self.__semaphore.acquire()
+		sending_destination_uuids = []  # type: List[str]
+		for destination_uuid in list(self.__client_server_messages_per_destination_uuid.keys()):
+			self.__deadline_scheduler.cancel(
+				deadline_key=self.__get_deadline_key(
+					destination_uuid=destination_uuid
+				)
+			)
+			if self.__try_take_batch(
+				destination_uuid=destination_uuid
+			):
+				sending_destination_uuids.append(destination_uuid)
+		self.__semaphore.release()
+
+		for destination_uuid in sending_destination_uuids:
+			self.__send_batches(
+				destination_uuid=destination_uuid
+			)
+
+	def get_pending_client_server_messages_total(self) -> int:
+		return sum(len(client_server_messages) for client_server_messages in list(self.__client_server_messages_per_destination_uuid.values()))
+
+
+class DatagramChannelPacketTypeEnum(Enum):
+	Bind = 1
+	BindAcknowledgement = 2
+	Data = 3
+
+
+class DatagramChannelPacket():
+
+	header_struct = struct.Struct(">BI")
+	maximum_sequence = 0xFFFFFFFF
+
+	@staticmethod
+	def is_newer_sequence(*, sequence: int, previous_sequence: int) -> bool:
+		# serial number arithmetic so that the sequence can wrap around without every later packet looking stale
+		return 0 < ((sequence - previous_sequence) & DatagramChannelPacket.maximum_sequence) < 0x80000000
+
+
+class DatagramChannelServer():
+
+	def __init__(self, *, host: str, port: int, bind_token_time_to_live_seconds: float, on_datagram_received: Callable[[str, bytes], None], logger: logging.Logger = None):
+
+		self.__host = host
+		self.__port = port
+		self.__bind_token_time_to_live_seconds = bind_token_time_to_live_seconds
+		self.__on_datagram_received = on_datagram_received
+		self.__logger = logging.getLogger(f"{__name__}.{DatagramChannelServer.__name__}") if logger is None else logger
+
+		self.__socket = None  # type: socket.socket
+		self.__receive_thread = None  # type: threading.Thread
+		self.__semaphore = Semaphore()
+		self.__bind_token_expiry_per_bind_token = OrderedDict()  # type: OrderedDict[str, Tuple[str, float]]
+		self.__bind_tokens_per_client_uuid = {}  # type: Dict[str, Set[str]]
+		self.__address_per_client_uuid = {}  # type: Dict[str, Tuple[str, int]]
+		self.__client_uuid_per_address = {}  # type: Dict[Tuple[str, int], str]
+		self.__received_sequence_per_client_uuid = {}  # type: Dict[str, int]
+		self.__sent_sequence_per_client_uuid = {}  # type: Dict[str, int]
+		self.__dropped_datagrams_total = 0
+
+	def start(self):
+
+		if self.__socket is not None:
+			raise Exception(f"DatagramChannelServer already started.")
+
+		self.__socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+		self.__socket.bind((self.__host, self.__port))
+		self.__receive_thread = start_thread(self.__receive_thread_method)
+
+	def get_port(self) -> int:
+		return self.__socket.getsockname()[1]
+
+	def __pop_bind_token(self, *, bind_token: str) -> Tuple[str, float]:
+		# expects the semaphore to be held
+		bind_token_expiry = self.__bind_token_expiry_per_bind_token.pop(bind_token, None)
+		if bind_token_expiry is not None:
+			bind_tokens = self.__bind_tokens_per_client_uuid[bind_token_expiry[0]]
+			bind_tokens.discard(bind_token)
+			if not bind_tokens:
+				del self.__bind_tokens_per_client_uuid[bind_token_expiry[0]]
+		return bind_token_expiry
+
+	def add_bind_token(self, *, client_uuid: str) -> str:
+		bind_token = secrets.token_urlsafe(24)
+		now = time.monotonic()
+		self.__semaphore.acquire()
+		while self.__bind_token_expiry_per_bind_token:
+			oldest_bind_token = next(iter(self.__bind_token_expiry_per_bind_token))
+			if self.__bind_token_expiry_per_bind_token[oldest_bind_token][1] > now:
+				break
+			self.__pop_bind_token(
+				bind_token=oldest_bind_token
+			)
+		self.__bind_token_expiry_per_bind_token[bind_token] = (client_uuid, now + self.__bind_token_time_to_live_seconds)
+		self.__bind_tokens_per_client_uuid.setdefault(client_uuid, set()).add(bind_token)
+		self.__semaphore.release()
+		return bind_token
+
+	def is_client_bound(self, *, client_uuid: str) -> bool:
+		return client_uuid in self.__address_per_client_uuid
+
+	def remove_client(self, *, client_uuid: str):
+		self.__semaphore.acquire()
+		# an unused bind token would otherwise still bind an address to the removed client until it expires
+		for bind_token in self.__bind_tokens_per_client_uuid.pop(client_uuid, ()):
+			del self.__bind_token_expiry_per_bind_token[bind_token]
+		address = self.__address_per_client_uuid.pop(client_uuid, None)
+		if address is not None:
+			del self.__client_uuid_per_address[address]
+		self.__received_sequence_per_client_uuid.pop(client_uuid, None)
+		self.__sent_sequence_per_client_uuid.pop(client_uuid, None)
+		self.__semaphore.release()
+
+	def send_to_client(self, *, client_uuid: str, datagram_bytes: bytes) -> bool:
+		self.__semaphore.acquire()
+		address = self.__address_per_client_uuid.get(client_uuid, None)
+		if address is None:
+			self.__semaphore.release()
+			return False
+		sequence = (self.__sent_sequence_per_client_uuid.get(client_uuid, 0) + 1) & DatagramChannelPacket.maximum_sequence
+		self.__sent_sequence_per_client_uuid[client_uuid] = sequence
+		self.__semaphore.release()
+		self.__socket.sendto(DatagramChannelPacket.header_struct.pack(DatagramChannelPacketTypeEnum.Data.value, sequence) + datagram_bytes, address)
+		return True
+
+	def get_dropped_datagrams_total(self) -> int:
+		self.__semaphore.acquire()
+		dropped_datagrams_total = self.__dropped_datagrams_total
+		self.__semaphore.release()
+		return dropped_datagrams_total
+
+	def __add_dropped_datagram(self):
+		self.__semaphore.acquire()
+		self.__dropped_datagrams_total += 1
+		self.__semaphore.release()
+
+	def __receive_thread_method(self):
+
+		while True:
+			try:
+				packet_bytes, address = self.__socket.recvfrom(65535)
+			except OSError:
+				# the socket was closed by dispose
+				break
+			if len(packet_bytes) < DatagramChannelPacket.header_struct.size:
+				self.__add_dropped_datagram()
+				continue
+			packet_type_value, sequence = DatagramChannelPacket.header_struct.unpack_from(packet_bytes, 0)
+			if packet_type_value == DatagramChannelPacketTypeEnum.Data.value:
+				self.__semaphore.acquire()
+				client_uuid = self.__client_uuid_per_address.get(address, None)
+				if client_uuid is None:
+					is_dropped = True
+				else:
+					previous_sequence = self.__received_sequence_per_client_uuid.get(client_uuid, None)
+					is_dropped = previous_sequence is not None and not DatagramChannelPacket.is_newer_sequence(
+						sequence=sequence,
+						previous_sequence=previous_sequence
+					)
+					if not is_dropped:
+						self.__received_sequence_per_client_uuid[client_uuid] = sequence
+				if is_dropped:
+					self.__dropped_datagrams_total += 1
+				self.__semaphore.release()
+				if not is_dropped:
+					try:
+						self.__on_datagram_received(client_uuid, packet_bytes[DatagramChannelPacket.header_struct.size:])
+					except Exception as ex:
+						self.__logger.exception("__receive_thread_method: ex: %s", ex)
+			elif packet_type_value == DatagramChannelPacketTypeEnum.Bind.value:
+				bind_token = packet_bytes[DatagramChannelPacket.header_struct.size:].decode("utf-8", errors="replace")
+				self.__semaphore.acquire()
+				bind_token_expiry = self.__pop_bind_token(
+					bind_token=bind_token
+				)
+				if bind_token_expiry is not None and bind_token_expiry[1] > time.monotonic():
+					client_uuid = bind_token_expiry[0]
+					previous_address = self.__address_per_client_uuid.get(client_uuid, None)
+					if previous_address is not None:
+						del self.__client_uuid_per_address[previous_address]
+					self.__address_per_client_uuid[client_uuid] = address
+					self.__client_uuid_per_address[address] = client_uuid
+					self.__received_sequence_per_client_uuid.pop(client_uuid, None)
+					is_acknowledged = True
+				else:
+					# a repeated bind from an already bound address means that the acknowledgement was lost
+					is_acknowledged = address in self.__client_uuid_per_address
+				if not is_acknowledged:
+					self.__dropped_datagrams_total += 1
+				self.__semaphore.release()
+				if is_acknowledged:
+					self.__socket.sendto(DatagramChannelPacket.header_struct.pack(DatagramChannelPacketTypeEnum.BindAcknowledgement.value, 0), address)
+			else:
+				self.__add_dropped_datagram()
+
+	def dispose(self):
+		if self.__socket is not None:
+			# closing alone does not wake a thread blocked in recv on every platform
+			try:
+				self.__socket.shutdown(socket.SHUT_RDWR)
+			except OSError:
+				pass
+			self.__socket.close()
+
+
+class DatagramChannelServerFactory():
+
+	def __init__(self, *, host: str, port: int, bind_token_time_to_live_seconds: float, on_datagram_received: Callable[[str, bytes], None], logger: logging.Logger = None):
+
+		self.__host = host
+		self.__port = port
+		self.__bind_token_time_to_live_seconds = bind_token_time_to_live_seconds
+		self.__on_datagram_received = on_datagram_received
+		self.__logger = logger
+
+	def get_datagram_channel_server(self) -> DatagramChannelServer:
+		return DatagramChannelServer(
+			host=self.__host,
+			port=self.__port,
+			bind_token_time_to_live_seconds=self.__bind_token_time_to_live_seconds,
+			on_datagram_received=self.__on_datagram_received,
+			logger=self.__logger
+		)
+
+
+class DatagramChannelClient():
+
+	def __init__(self, *, host: str, port: int, bind_token: str, on_datagram_received: Callable[[bytes], None], bind_timeout_seconds: float = 5.0, bind_retry_seconds: float = 0.25, logger: logging.Logger = None):
+
+		self.__host = host
+		self.__port = port
+		self.__bind_token = bind_token
+		self.__on_datagram_received = on_datagram_received
+		self.__bind_timeout_seconds = bind_timeout_seconds
+		self.__bind_retry_seconds = bind_retry_seconds
+		self.__logger = logging.getLogger(f"{__name__}.{DatagramChannelClient.__name__}") if logger is None else logger
+
+		self.__socket = None  # type: socket.socket
+		self.__receive_thread = None  # type: threading.Thread
+		self.__bind_acknowledged_event = threading.Event()
+		self.__sent_sequence = 0
+		self.__sent_sequence_semaphore = Semaphore()
+		self.__received_sequence = None  # type: int
+		self.__dropped_datagrams_total = 0
+
+	def connect_to_server(self):
+
+		if self.__socket is not None:
+			raise Exception(f"DatagramChannelClient already connected.")
+
+		self.__socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+		self.__socket.connect((self.__host, self.__port))
+		self.__receive_thread = start_thread(self.__receive_thread_method)
+
+		bind_packet_bytes = DatagramChannelPacket.header_struct.pack(DatagramChannelPacketTypeEnum.Bind.value, 0) + self.__bind_token.encode("utf-8")
+		bind_deadline_time = time.monotonic() + self.__bind_timeout_seconds
+		while not self.__bind_acknowledged_event.is_set():
+			if time.monotonic() >= bind_deadline_time:
+				raise Exception(f"Failed to bind datagram channel within {self.__bind_timeout_seconds} seconds.")
+			self.__socket.send(bind_packet_bytes)
+			self.__bind_acknowledged_event.wait(self.__bind_retry_seconds)
+
+	def send_to_server(self, *, datagram_bytes: bytes):
+		self.__sent_sequence_semaphore.acquire()
+		self.__sent_sequence = (self.__sent_sequence + 1) & DatagramChannelPacket.maximum_sequence
+		sequence = self.__sent_sequence
+		self.__sent_sequence_semaphore.release()
+		self.__socket.send(DatagramChannelPacket.header_struct.pack(DatagramChannelPacketTypeEnum.Data.value, sequence) + datagram_bytes)
+
+	def get_dropped_datagrams_total(self) -> int:
+		return self.__dropped_datagrams_total
+
+	def __receive_thread_method(self):
+
+		while True:
+			try:
+				packet_bytes = self.__socket.recv(65535)
+			except ConnectionRefusedError:
+				# an earlier bind reached a closed port, which is reported on the next receive
+				continue
+			except OSError:
+				break
+			if len(packet_bytes) < DatagramChannelPacket.header_struct.size:
+				self.__dropped_datagrams_total += 1
+				continue
+			packet_type_value, sequence = DatagramChannelPacket.header_struct.unpack_from(packet_bytes, 0)
+			if packet_type_value == DatagramChannelPacketTypeEnum.BindAcknowledgement.value:
+				self.__bind_acknowledged_event.set()
+			elif packet_type_value == DatagramChannelPacketTypeEnum.Data.value:
+				if self.__received_sequence is not None and not DatagramChannelPacket.is_newer_sequence(
+					sequence=sequence,
+					previous_sequence=self.__received_sequence
+				):
+					self.__dropped_datagrams_total += 1
+				else:
+					self.__received_sequence = sequence
+					try:
+						self.__on_datagram_received(packet_bytes[DatagramChannelPacket.header_struct.size:])
+					except Exception as ex:
+						self.__logger.exception("__receive_thread_method: ex: %s", ex)
+			else:
+				self.__dropped_datagrams_total += 1
+
+	def dispose(self):
+		if self.__socket is not None:
+			# closing alone does not wake a thread blocked in recv on every platform
+			try:
+				self.__socket.shutdown(socket.SHUT_RDWR)
+			except OSError:
+				pass
+			self.__socket.close()
+
+
+class ClientAuthenticationClientMessengerPool():
+
+	def __init__(self, *, client_authentication_client_messenger_factory: ClientMessengerFactory, client_messengers_total: int, callback: Callable[[ClientServerMessage], None], on_exception: Callable[[Exception], None]):
+
+		if client_messengers_total < 1:
+			raise Exception(f"At least one client messenger is required but {client_messengers_total} were requested.")
+
+		self.__client_authentication_client_messenger_factory = client_authentication_client_messenger_factory
+		self.__client_messengers_total = client_messengers_total
+		self.__callback = callback
+		self.__on_exception = on_exception
+
+		self.__client_messengers = []  # type: List[ClientMessenger]
+		self.__client_messenger_semaphores = []  # type: List[Semaphore]
+		self.__client_messenger_index = 0
+		self.__client_messenger_index_semaphore = Semaphore()
+
+	def connect_to_server(self):
+
+		for client_messenger_index in range(self.__client_messengers_total):
+			client_messenger = self.__client_authentication_client_messenger_factory.get_client_messenger()
+
+			client_messenger.connect_to_server()
+
+			# every messenger shares the same callback since responses are correlated by the authentication_uuid in their external metadata
+			client_messenger.receive_from_server(
+				callback=self.__callback,
+				on_exception=self.__on_exception
+			)
+
+			self.__client_messengers.append(client_messenger)
+			self.__client_messenger_semaphores.append(Semaphore())
+
+	def send_to_server(self, *, request_client_server_message: ClientServerMessage):
+
+		self.__client_messenger_index_semaphore.acquire()
+		client_messenger_index = self.__client_messenger_index
+		self.__client_messenger_index = (self.__client_messenger_index + 1) % len(self.__client_messengers)
+		self.__client_messenger_index_semaphore.release()
+
+		# only writes to the same socket are serialized so that requests are pipelined across the pool
+		client_messenger_semaphore = self.__client_messenger_semaphores[client_messenger_index]
+		client_messenger_semaphore.acquire()
+		try:
+			self.__client_messengers[client_messenger_index].send_to_server(
+				request_client_server_message=request_client_server_message
+			)
+		finally:
+			client_messenger_semaphore.release()
+
+	def dispose(self):
+		for client_messenger in self.__client_messengers:
+			client_messenger.dispose()
+
+
+class ClientAuthenticationReplica():
+
+	def __init__(self, *, client_authentication_client_messenger_factory: ClientMessengerFactory, client_messengers_total: int, callback: Callable[[ClientServerMessage], None], on_exception: Callable[[Exception], None], on_unhealthy: Callable[[float], None], backoff_seconds: float, maximum_backoff_seconds: float, logger: logging.Logger = None):
+
+		self.__client_authentication_client_messenger_factory = client_authentication_client_messenger_factory
+		self.__client_messengers_total = client_messengers_total
+		self.__callback = callback
+		self.__on_exception = on_exception
+		self.__on_unhealthy = on_unhealthy
+		self.__backoff_seconds = backoff_seconds
+		self.__maximum_backoff_seconds = maximum_backoff_seconds
+		self.__logger = logging.getLogger(f"{__name__}.{ClientAuthenticationReplica.__name__}") if logger is None else logger
+
+		self.__client_authentication_client_messenger_pool = None  # type: ClientAuthenticationClientMessengerPool
+		self.__is_healthy = False
+		self.__failures_total = 0
+		self.__retry_time = 0.0
+		self.__health_semaphore = Semaphore()
+		self.__outstanding_authentications_total = 0
+
+	def connect_to_server(self):
+
+		if self.__client_authentication_client_messenger_pool is not None:
+			try:
+				self.__client_authentication_client_messenger_pool.dispose()
+			except Exception as ex:
+				self.__logger.error("connect_to_server: dispose: ex: %s", ex)
+			self.__client_authentication_client_messenger_pool = None
+
+		client_authentication_client_messenger_pool = None  # type: ClientAuthenticationClientMessengerPool
+
+		def on_exception(exception: Exception):
+			nonlocal client_authentication_client_messenger_pool
+
+			# exceptions raised by a pool that has since been replaced must not take the new connections out of rotation
+			if client_authentication_client_messenger_pool is self.__client_authentication_client_messenger_pool:
+				self.set_unhealthy()
+			self.__on_exception(exception)
+
+		client_authentication_client_messenger_pool = ClientAuthenticationClientMessengerPool(
+			client_authentication_client_messenger_factory=self.__client_authentication_client_messenger_factory,
+			client_messengers_total=self.__client_messengers_total,
+			callback=self.__callback,
+			on_exception=on_exception
+		)
+		self.__client_authentication_client_messenger_pool = client_authentication_client_messenger_pool
+
+		try:
+			client_authentication_client_messenger_pool.connect_to_server()
+		except Exception as ex:
+			self.set_unhealthy()
+			raise ex
+
+		self.__health_semaphore.acquire()
+		self.__is_healthy = True
+		self.__failures_total = 0
+		self.__health_semaphore.release()
+
+	def send_to_server(self, *, request_client_server_message: ClientServerMessage):
+		try:
+			self.__client_authentication_client_messenger_pool.send_to_server(
+				request_client_server_message=request_client_server_message
+			)
+		except Exception as ex:
+			self.set_unhealthy()
+			raise ex
+
+	def set_unhealthy(self):
+		self.__health_semaphore.acquire()
+		now = time.monotonic()
+		# repeated failures reported before the retry is due belong to the same outage and do not extend the backoff
+		if self.__is_healthy or self.__retry_time <= now:
+			self.__is_healthy = False
+			self.__failures_total += 1
+			retry_seconds = min(self.__backoff_seconds * 2 ** (self.__failures_total - 1), self.__maximum_backoff_seconds)
+			self.__retry_time = now + retry_seconds
+		else:
+			retry_seconds = None
+		self.__health_semaphore.release()
+
+		if retry_seconds is not None:
+			self.__on_unhealthy(retry_seconds)
+
+	def is_healthy(self) -> bool:
+		return self.__is_healthy
+
+	def get_failures_total(self) -> int:
+		return self.__failures_total
+
+	def get_outstanding_authentications_total(self) -> int:
+		return self.__outstanding_authentications_total
+
+	def add_outstanding_authentication(self):
+		self.__outstanding_authentications_total += 1
+
+	def remove_outstanding_authentication(self):
+		self.__outstanding_authentications_total -= 1
+
+	def dispose(self):
+		if self.__client_authentication_client_messenger_pool is not None:
+			self.__client_authentication_client_messenger_pool.dispose()
+
+
+class ClientAuthenticationReplicaRouter():
+
+	def __init__(self, *, client_authentication_client_messenger_factories: List[ClientMessengerFactory], client_messengers_total: int, callback: Callable[[ClientServerMessage], None], on_exception: Callable[[Exception], None], backoff_seconds: float, maximum_backoff_seconds: float, logger: logging.Logger = None):
+
+		if not client_authentication_client_messenger_factories:
+			raise Exception(f"At least one ClientAuthenticationManager replica is required.")
+
+		self.__logger = logging.getLogger(f"{__name__}.{ClientAuthenticationReplicaRouter.__name__}") if logger is None else logger
+
+		# reconnects run on their own worker so that a replica that is slow to connect never holds up requests routed to the others
+		self.__reconnect_scheduler = DeadlineScheduler(
+			worker_threads_total=1,
+			logger=self.__logger
+		)
+		self.__replicas = []  # type: List[ClientAuthenticationReplica]
+		for replica_index, client_authentication_client_messenger_factory in enumerate(client_authentication_client_messenger_factories):
+			self.__replicas.append(ClientAuthenticationReplica(
+				client_authentication_client_messenger_factory=client_authentication_client_messenger_factory,
+				client_messengers_total=client_messengers_total,
+				callback=callback,
+				on_exception=on_exception,
+				on_unhealthy=self.__get_on_unhealthy(
+					replica_index=replica_index
+				),
+				backoff_seconds=backoff_seconds,
+				maximum_backoff_seconds=maximum_backoff_seconds,
+				logger=self.__logger
+			))
+		self.__replica_per_authentication_uuid = {}  # type: Dict[str, ClientAuthenticationReplica]
+		self.__replicas_semaphore = Semaphore()
+
+	def __get_on_unhealthy(self, *, replica_index: int) -> Callable[[float], None]:
+
+		def on_unhealthy(retry_seconds: float):
+			self.__reconnect_scheduler.schedule(
+				deadline_key=f"replica_reconnect:{replica_index}",
+				delay_seconds=retry_seconds,
+				callback=lambda: self.__reconnect(
+					replica_index=replica_index
+				)
+			)
+
+		return on_unhealthy
+
+	def __reconnect(self, *, replica_index: int):
+		try:
+			self.__replicas[replica_index].connect_to_server()
+		except Exception as ex:
+			# the failed connect has already scheduled the next attempt with a longer backoff
+			self.__logger.warning("__reconnect: replica %s: ex: %s", replica_index, ex)
+
+	def connect_to_server(self):
+
+		self.__reconnect_scheduler.start()
+
+		connected_replicas_total = 0
+		found_exception = None  # type: Exception
+		for replica in self.__replicas:
+			try:
+				replica.connect_to_server()
+				connected_replicas_total += 1
+			except Exception as ex:
+				self.__logger.error("connect_to_server: ex: %s", ex)
+				if found_exception is None:
+					found_exception = ex
+
+		if connected_replicas_total == 0:
+			raise found_exception
+
+	def __try_add_outstanding_authentication(self, *, authentication_uuid: str, excluded_replicas: List[ClientAuthenticationReplica]) -> ClientAuthenticationReplica:
+		self.__replicas_semaphore.acquire()
+		healthy_replicas = [replica for replica in self.__replicas if replica.is_healthy() and replica not in excluded_replicas]
+		if not healthy_replicas:
+			replica = None
+		else:
+			replica = min(healthy_replicas, key=lambda replica: replica.get_outstanding_authentications_total())
+			replica.add_outstanding_authentication()
+			self.__replica_per_authentication_uuid[authentication_uuid] = replica
+		self.__replicas_semaphore.release()
+		return replica
+
+	def send_to_server(self, *, authentication_uuid: str, request_client_server_message: ClientServerMessage):
+
+		# the replica is claimed under the semaphore and the send happens after releasing it so that requests are pipelined across replicas
+		excluded_replicas = []  # type: List[ClientAuthenticationReplica]
+		while True:
+			replica = self.__try_add_outstanding_authentication(
+				authentication_uuid=authentication_uuid,
+				excluded_replicas=excluded_replicas
+			)
+			if replica is None:
+				raise Exception(f"No ClientAuthenticationManager replica is available.")
+			try:
+				replica.send_to_server(
+					request_client_server_message=request_client_server_message
+				)
+				break
+			except Exception as ex:
+				self.__logger.warning("send_to_server: ex: %s", ex)
+				self.complete_authentication(
+					authentication_uuid=authentication_uuid
+				)
+				excluded_replicas.append(replica)
+
+	def complete_authentication(self, *, authentication_uuid: str):
+		self.__replicas_semaphore.acquire()
+		replica = self.__replica_per_authentication_uuid.pop(authentication_uuid, None)
+		if replica is not None:
+			replica.remove_outstanding_authentication()
+		self.__replicas_semaphore.release()
+
+	def get_outstanding_authentications_totals(self) -> List[int]:
+		return [replica.get_outstanding_authentications_total() for replica in self.__replicas]
+
+	def get_healthy_replicas_total(self) -> int:
+		return sum(1 for replica in self.__replicas if replica.is_healthy())
+
+	def dispose(self):
+		self.__reconnect_scheduler.dispose()
+		for replica in self.__replicas:
+			replica.dispose()
+
+
+class GameManagerAuthenticationStateMachine():
+
+	def __init__(self, *, authentication_timeout_seconds: float, authentication_state_store: AuthenticationStateStore, authentication_session_token_cache: AuthenticationSessionTokenCache, authentication_request_rate_limiter: TokenBucketRateLimiter, client_authentication_replica_router: ClientAuthenticationReplicaRouter, deadline_scheduler: DeadlineScheduler, metrics: GameManagerStructureMetrics, logger: logging.Logger, send_response: Callable[[ClientServerMessage], None], run_blocking: Callable[[Callable[[], None]], None], on_client_authenticated: Callable[[str], None], on_client_removed: Callable[[str], None], session_idle_timeout_seconds: float, session_idle_sweep_seconds: float, maximum_pending_authentications_total: int, server_busy_retry_after_seconds: float):
+
+		self.__authentication_timeout_seconds = authentication_timeout_seconds
+		self.__authentication_state_store = authentication_state_store
+		self.__authentication_session_token_cache = authentication_session_token_cache
+		self.__authentication_request_rate_limiter = authentication_request_rate_limiter
+		self.__client_authentication_replica_router = client_authentication_replica_router
+		self.__deadline_scheduler = deadline_scheduler
+		self.__metrics = metrics
+		self.__logger = logger
+		self.__send_response = send_response
+		self.__run_blocking = run_blocking
+		self.__on_client_authenticated = on_client_authenticated
+		self.__on_client_removed = on_client_removed
+		self.__session_idle_timeout_seconds = session_idle_timeout_seconds
+		self.__session_idle_sweep_seconds = session_idle_sweep_seconds
+		self.__maximum_pending_authentications_total = maximum_pending_authentications_total
+		self.__server_busy_retry_after_seconds = server_busy_retry_after_seconds
+
+		# a session is written back to the store at most this often, so an idle session is evicted up to this long before its timeout
+		self.__session_refresh_seconds = None if session_idle_timeout_seconds is None else session_idle_timeout_seconds / 4
+		self.__session_refresh_time_per_client_uuid = {}  # type: Dict[str, float]
+		self.__session_refresh_semaphore = Semaphore()
+
+	def start(self):
+		if self.__session_idle_timeout_seconds is not None:
+			self.__schedule_session_idle_sweep()
+
+	def __schedule_session_idle_sweep(self):
+		self.__deadline_scheduler.schedule(
+			deadline_key="session_idle_sweep",
+			delay_seconds=self.__session_idle_sweep_seconds,
+			callback=self.__session_idle_sweep
+		)
+
+	def __session_idle_sweep(self):
+		client_uuids = self.__authentication_state_store.remove_idle_clients(
+			idle_seconds=self.__session_idle_timeout_seconds
+		)
+		for client_uuid in client_uuids:
+			self.__remove_client(
+				client_uuid=client_uuid
+			)
+		if client_uuids and self.__logger.isEnabledFor(logging.DEBUG):
+			self.__logger.debug("session_idle_sweep: removed %s idle sessions", len(client_uuids))
+		self.__schedule_session_idle_sweep()
+
+	def __remove_client(self, *, client_uuid: str):
+		if self.__session_refresh_seconds is not None:
+			self.__session_refresh_semaphore.acquire()
+			self.__session_refresh_time_per_client_uuid.pop(client_uuid, None)
+			self.__session_refresh_semaphore.release()
+		if self.__authentication_request_rate_limiter is not None:
+			self.__authentication_request_rate_limiter.remove_key(
+				key=client_uuid
+			)
+		if self.__on_client_removed is not None:
+			self.__on_client_removed(client_uuid)
+
+	def __complete_upstream_authentication(self, *, authentication_uuid: str):
+		# the router takes a lock, so the caller decides where that may block
+		self.__run_blocking(lambda: self.__client_authentication_replica_router.complete_authentication(
+			authentication_uuid=authentication_uuid
+		))
+
+	def __client_authenticated(self, *, client_uuid: str):
+		if self.__on_client_authenticated is not None:
+			self.__on_client_authenticated(client_uuid)
+
+	def start_authentication(self, *, client_uuid: str, session_token: str) -> Dict:
+		# returns the external metadata of a new authentication that still needs to be sent upstream, otherwise the client has already been answered
+
+		self.__metrics.increment_counter(
+			name="authentication_requests_total"
+		)
+
+		if self.__authentication_request_rate_limiter is not None:
+			retry_after_seconds = self.__authentication_request_rate_limiter.try_acquire_token(
+				key=client_uuid
+			)
+			if retry_after_seconds > 0:
+				self.__metrics.increment_counter(
+					name="authentication_requests_rejected_busy_total"
+				)
+				self.__send_response(ServerBusyErrorGameManagerClientServerMessage(
+					retry_after_milliseconds=int(retry_after_seconds * 1000) + 1,
+					destination_uuid=client_uuid
+				))
+				return None
+
+		if self.__authentication_state_store.get_authentication_id(
+			client_uuid=client_uuid
+		) is not None:
+			self.__metrics.increment_counter(
+				name="authentication_requests_rejected_already_authenticated_total"
+			)
+			self.__send_response(ClientAlreadyAuthenticatedErrorGameManagerClientServerMessage(
+				destination_uuid=client_uuid
+			))
+			return None
+
+		if session_token is not None and self.__authentication_session_token_cache is not None:
+			authentication_id = self.__authentication_session_token_cache.try_pop_authentication_id(
+				session_token=session_token
+			)
+			if authentication_id is not None:
+				# the resume supersedes an authentication the client may still have pending upstream
+				pending_authentication_uuid = self.__authentication_state_store.get_pending_authentication_uuid(
+					client_uuid=client_uuid
+				)
+				if pending_authentication_uuid is not None and self.__authentication_state_store.try_remove_pending_authentication(
+					client_uuid=client_uuid,
+					authentication_uuid=pending_authentication_uuid
+				):
+					self.__deadline_scheduler.cancel(
+						deadline_key=pending_authentication_uuid
+					)
+					self.__complete_upstream_authentication(
+						authentication_uuid=pending_authentication_uuid
+					)
+					self.__metrics.cancel_authentication(
+						authentication_uuid=pending_authentication_uuid
+					)
+				if self.__authentication_state_store.try_add_authentication(
+					client_uuid=client_uuid,
+					authentication_id=authentication_id
+				):
+					self.__metrics.increment_counter(
+						name="authentication_requests_resumed_total"
+					)
+					self.__send_response(AuthenticateClientResponseGameManagerClientServerMessage(
+						is_successful=True,
+						destination_uuid=client_uuid,
+						session_token=self.__authentication_session_token_cache.add_authentication_id(
+							authentication_id=authentication_id
+						)
+					))
+					self.__client_authenticated(
+						client_uuid=client_uuid
+					)
+				else:
+					self.__metrics.increment_counter(
+						name="authentication_requests_rejected_already_authenticated_total"
+					)
+					self.__send_response(ClientAlreadyAuthenticatedErrorGameManagerClientServerMessage(
+						destination_uuid=client_uuid
+					))
+				return None
+
+		external_metadata_json = {
+			"client_uuid": client_uuid,
+			"authentication_uuid": str(uuid.uuid4())
+		}
+
+		# the store checks the cap in the same step that adds the authentication, so that a resume is never capped and a retry from a pending client still joins its authentication
+		pending_authentication_result = self.__authentication_state_store.try_add_pending_authentication(
+			client_uuid=external_metadata_json["client_uuid"],
+			authentication_uuid=external_metadata_json["authentication_uuid"],
+			maximum_pending_authentications_total=self.__maximum_pending_authentications_total
+		)
+
+		if pending_authentication_result == PendingAuthenticationResultEnum.ClientAlreadyAuthenticated:
+			self.__metrics.increment_counter(
+				name="authentication_requests_rejected_already_authenticated_total"
+			)
+			self.__send_response(ClientAlreadyAuthenticatedErrorGameManagerClientServerMessage(
+				destination_uuid=client_uuid
+			))
+			return None
+		elif pending_authentication_result == PendingAuthenticationResultEnum.AlreadyPending:
+			self.__metrics.increment_counter(
+				name="authentication_requests_coalesced_total"
+			)
+			# the retry joins the pending authentication, whose url and response are each sent to the client once
+			return None
+		elif pending_authentication_result == PendingAuthenticationResultEnum.MaximumPendingAuthenticationsReached:
+			self.__metrics.increment_counter(
+				name="authentication_requests_rejected_busy_total"
+			)
+			self.__send_response(ServerBusyErrorGameManagerClientServerMessage(
+				retry_after_milliseconds=int(self.__server_busy_retry_after_seconds * 1000),
+				destination_uuid=client_uuid
+			))
+			return None
+		else:
+			self.__metrics.start_authentication(
+				authentication_uuid=external_metadata_json["authentication_uuid"]
+			)
+			if self.__logger.isEnabledFor(logging.DEBUG):
+				self.__logger.debug("start_authentication: started", extra=external_metadata_json)
+			return external_metadata_json
+
+	def send_authentication_request(self, *, external_metadata_json: Dict):
+		# blocks on the upstream socket, so the asyncio structure runs this in an executor
+		self.__client_authentication_replica_router.send_to_server(
+			authentication_uuid=external_metadata_json["authentication_uuid"],
+			request_client_server_message=OpenidAuthenticationRequestClientAuthenticationClientServerMessage(
+				external_metadata_json=external_metadata_json
+			)
+		)
+
+	def authentication_request_sent(self, *, external_metadata_json: Dict):
+		# a response that arrived before this point already removed the pending authentication, so the timeout will find nothing to do
+		self.__deadline_scheduler.schedule(
+			deadline_key=external_metadata_json["authentication_uuid"],
+			delay_seconds=self.__authentication_timeout_seconds,
+			callback=lambda: self.__authentication_timeout(
+				external_metadata_json=external_metadata_json
+			)
+		)
+
+	def authentication_request_failed(self, *, external_metadata_json: Dict, exception: Exception):
+		self.__authentication_state_store.try_remove_pending_authentication(
+			client_uuid=external_metadata_json["client_uuid"],
+			authentication_uuid=external_metadata_json["authentication_uuid"]
+		)
+		self.__metrics.cancel_authentication(
+			authentication_uuid=external_metadata_json["authentication_uuid"]
+		)
+		self.__metrics.increment_counter(
+			name="authentication_requests_failed_upstream_total"
+		)
+		self.__send_response(ClientAuthenticationManagerErrorGameManagerClientServerMessage(
+			message=str(exception),
+			destination_uuid=external_metadata_json["client_uuid"]
+		))
+
+	def __authentication_timeout(self, *, external_metadata_json: Dict):
+		self.__complete_upstream_authentication(
+			authentication_uuid=external_metadata_json["authentication_uuid"]
+		)
+		if self.__authentication_state_store.try_remove_pending_authentication(
+			client_uuid=external_metadata_json["client_uuid"],
+			authentication_uuid=external_metadata_json["authentication_uuid"]
+		):
+			self.__metrics.authentication_timed_out(
+				authentication_uuid=external_metadata_json["authentication_uuid"]
+			)
+			if self.__logger.isEnabledFor(logging.DEBUG):
+				self.__logger.debug("authentication_timeout: send_response: start", extra=external_metadata_json)
+			self.__send_response(AuthenticationTimeoutErrorGameManagerClientServerMessage(
+				destination_uuid=external_metadata_json["client_uuid"]
+			))
+			if self.__logger.isEnabledFor(logging.DEBUG):
+				self.__logger.debug("authentication_timeout: send_response: end", extra=external_metadata_json)
+
+	def url_navigation_needed_response_received(self, *, client_server_message: UrlNavigationNeededResponseClientAuthenticationClientServerMessage):
+		external_metadata_json = client_server_message.get_external_metadata_json()
+		if self.__authentication_state_store.is_pending_authentication(
+			client_uuid=external_metadata_json["client_uuid"],
+			authentication_uuid=external_metadata_json["authentication_uuid"]
+		):
+			self.__metrics.url_navigation_received(
+				authentication_uuid=external_metadata_json["authentication_uuid"]
+			)
+			self.__send_response(UrlNavigationNeededResponseGameManagerClientServerMessage(
+				url=client_server_message.get_url(),
+				destination_uuid=external_metadata_json["client_uuid"]
+			))
+		else:
+			if self.__logger.isEnabledFor(logging.DEBUG):
+				self.__logger.debug("url_navigation_needed_response_received: url navigation needed for missing authentication", extra=external_metadata_json)
+
+	def authentication_response_received(self, *, client_server_message: AuthenticationResponseClientAuthenticationClientServerMessage):
+		external_metadata_json = client_server_message.get_external_metadata_json()
+		authentication_completion_result = self.__authentication_state_store.try_complete_pending_authentication(
+			client_uuid=external_metadata_json["client_uuid"],
+			authentication_uuid=external_metadata_json["authentication_uuid"],
+			authentication_id=client_server_message.get_authentication_id() if client_server_message.is_successful() else None
+		)
+		if authentication_completion_result == AuthenticationCompletionResultEnum.NotPending:
+			if self.__logger.isEnabledFor(logging.DEBUG):
+				self.__logger.debug("authentication_response_received: authentication response for missing authentication", extra=external_metadata_json)
+		else:
+			self.__deadline_scheduler.cancel(
+				deadline_key=external_metadata_json["authentication_uuid"]
+			)
+			self.__complete_upstream_authentication(
+				authentication_uuid=external_metadata_json["authentication_uuid"]
+			)
+			self.__metrics.authentication_response_received(
+				authentication_uuid=external_metadata_json["authentication_uuid"],
+				is_successful=client_server_message.is_successful()
+			)
+			if self.__logger.isEnabledFor(logging.DEBUG):
+				self.__logger.debug("authentication_response_received: is_successful: %s", client_server_message.is_successful(), extra=external_metadata_json)
+
+			if authentication_completion_result == AuthenticationCompletionResultEnum.ClientAlreadyAuthenticated:
+				self.__send_response(ClientAlreadyAuthenticatedErrorGameManagerClientServerMessage(
+					destination_uuid=external_metadata_json["client_uuid"]
+				))
+			else:
+				if client_server_message.is_successful() and self.__authentication_session_token_cache is not None:
+					session_token = self.__authentication_session_token_cache.add_authentication_id(
+						authentication_id=client_server_message.get_authentication_id()
+					)
+				else:
+					session_token = None
+				self.__send_response(AuthenticateClientResponseGameManagerClientServerMessage(
+					is_successful=client_server_message.is_successful(),
+					destination_uuid=external_metadata_json["client_uuid"],
+					session_token=session_token
+				))
+				if client_server_message.is_successful():
+					self.__client_authenticated(
+						client_uuid=external_metadata_json["client_uuid"]
+					)
+
+	def unexpected_authentication_request_received(self, *, client_server_message: UnexpectedAuthenticationRequestClientAuthenticationClientServerMessage):
+		external_metadata_json = client_server_message.get_external_metadata_json()
+		self.__send_response(ClientAuthenticationManagerErrorGameManagerClientServerMessage(
+			message=f"Unexpected authentication request {client_server_message.get_client_server_message().__class__.get_client_server_message_type()} while in state {client_server_message.get_structure_state().value}",
+			destination_uuid=external_metadata_json["client_uuid"]
+		))
+
+	def unexpected_openid_authentication_response_received(self, *, client_server_message: UnexpectedOpenidAuthenticationResponseClientAuthenticationClientServerMessage):
+		self.__logger.warning("unexpected_openid_authentication_response_received: received OpenID Connect response unexpectedly as %s while in state %s", client_server_message.get_client_server_message().__class__.get_client_server_message_type(), client_server_message.get_structure_state().value)
+
+	def refresh_client_session(self, *, client_uuid: str):
+		if self.__session_refresh_seconds is not None:
+			refresh_time = time.monotonic()
+			self.__session_refresh_semaphore.acquire()
+			previous_refresh_time = self.__session_refresh_time_per_client_uuid.get(client_uuid, None)
+			is_refresh_needed = previous_refresh_time is None or refresh_time - previous_refresh_time >= self.__session_refresh_seconds
+			if is_refresh_needed:
+				self.__session_refresh_time_per_client_uuid[client_uuid] = refresh_time
+			self.__session_refresh_semaphore.release()
+			if is_refresh_needed:
+				# stores ignore clients that are not authenticated, so the refresh needs no read first
+				self.__authentication_state_store.refresh_client(
+					client_uuid=client_uuid
+				)
+
+	def client_disconnected(self, *, client_uuid: str):
+		self.__remove_client(
+			client_uuid=client_uuid
+		)
+		for authentication_uuid in self.__authentication_state_store.remove_client(
+			client_uuid=client_uuid
+		):
+			self.__deadline_scheduler.cancel(
+				deadline_key=authentication_uuid
+			)
+			self.__complete_upstream_authentication(
+				authentication_uuid=authentication_uuid
+			)
+			self.__metrics.cancel_authentication(
+				authentication_uuid=authentication_uuid
+			)
+
+	def get_authentication_id(self, *, client_uuid: str) -> str:
+		return self.__authentication_state_store.get_authentication_id(
+			client_uuid=client_uuid
+		)
+
+	def get_authenticated_sessions_total(self) -> int:
+		return self.__authentication_state_store.get_authenticated_clients_total()
+
+	def get_metrics_snapshot(self) -> Dict:
+		metrics_snapshot = self.__metrics.get_snapshot()
+		metrics_snapshot["time"] = datetime.utcnow().isoformat()
+		metrics_snapshot["gauges"] = {
+			"pending_authentications_total": self.__authentication_state_store.get_pending_authentications_total(),
+			"authenticated_sessions_total": self.__authentication_state_store.get_authenticated_clients_total(),
+			"scheduled_deadlines_total": self.__deadline_scheduler.get_pending_deadlines_total(),
+			"outstanding_authentications_per_replica": self.__client_authentication_replica_router.get_outstanding_authentications_totals()
+		}
+		return metrics_snapshot
+
+
+def client_authentication_client_server_message_handler(*, client_server_message_class: Type[ClientServerMessage]):
+
+	def decorator(function: Callable):
+		function.client_authentication_client_server_message_type = client_server_message_class.get_client_server_message_type()
+		return function
+
+	return decorator
+
+
+def structure_transition(*, client_server_message_type: ClientServerMessageTypeEnum, start_structure_state: StructureStateEnum, end_structure_state: StructureStateEnum):
+
+	def decorator(function: Callable):
+		if "structure_transitions" not in vars(function):
+			function.structure_transitions = []
+		function.structure_transitions.append((client_server_message_type, start_structure_state, end_structure_state))
+		return function
+
+	return decorator
+
+
+def get_registered_handlers(*, class_type: type) -> Tuple[Dict[ClientServerMessageTypeEnum, Callable], List[Tuple[ClientServerMessageTypeEnum, StructureStateEnum, StructureStateEnum, Callable]]]:
+	client_authentication_client_server_message_handler_per_client_server_message_type = {}  # type: Dict[ClientServerMessageTypeEnum, Callable]
+	structure_transition_per_key = {}  # type: Dict[Tuple[ClientServerMessageTypeEnum, StructureStateEnum], Tuple[ClientServerMessageTypeEnum, StructureStateEnum, StructureStateEnum, Callable]]
+	# walking the mro from the base lets subclasses replace inherited handlers for the same message type
+	for mro_class_type in reversed(class_type.__mro__):
+		for attribute in vars(mro_class_type).values():
+			if callable(attribute):
+				if hasattr(attribute, "client_authentication_client_server_message_type"):
+					client_authentication_client_server_message_handler_per_client_server_message_type[attribute.client_authentication_client_server_message_type] = attribute
+				for client_server_message_type, start_structure_state, end_structure_state in getattr(attribute, "structure_transitions", ()):
+					structure_transition_per_key[(client_server_message_type, start_structure_state)] = (client_server_message_type, start_structure_state, end_structure_state, attribute)
+	return client_authentication_client_server_message_handler_per_client_server_message_type, list(structure_transition_per_key.values())
+
+
+class GameManagerStructure(Structure):
+
+	def __init__(self, *, authentication_timeout_seconds: float, client_authentication_client_messenger_factory: ClientMessengerFactory = None, client_authentication_client_messenger_factories: List[ClientMessengerFactory] = None, client_authentication_client_messengers_total: int = 1, client_authentication_replica_backoff_seconds: float = 1.0, client_authentication_replica_maximum_backoff_seconds: float = 60.0, authentication_timeout_worker_threads_total: int = 1, authentication_state_store_factory: AuthenticationStateStoreFactory = None, authentication_session_token_cache_factory: AuthenticationSessionTokenCacheFactory = None, session_idle_timeout_seconds: float = None, session_idle_sweep_seconds: float = 60.0, maximum_pending_authentications_total: int = None, authentication_requests_per_second: float = None, authentication_requests_burst_total: int = 1, server_busy_retry_after_seconds: float = 1.0, log_handler: logging.Handler = None, metrics_file_path: str = None, metrics_dump_seconds: float = 60.0, response_batch_flush_seconds: float = None, response_batch_maximum_client_server_messages_total: int = 64, unordered_response_worker_threads_total: int = None, datagram_channel_server_factory: DatagramChannelServerFactory = None, client_interest_manager: ClientInterestManager = None, is_debug: bool = False):
+		super().__init__(
+			states=GameManagerStructureStateEnum,
+			initial_state=GameManagerStructureStateEnum.Active  # TODO start UnderMaintenance
+		)
+
+		if (client_authentication_client_messenger_factory is None) == (client_authentication_client_messenger_factories is None):
+			raise Exception(f"Exactly one of client_authentication_client_messenger_factory or client_authentication_client_messenger_factories must be provided.")
+
+		self.__client_authentication_client_messenger_factories = [client_authentication_client_messenger_factory] if client_authentication_client_messenger_factories is None else client_authentication_client_messenger_factories
+		self.__authentication_timeout_seconds = authentication_timeout_seconds
+		self.__client_authentication_client_messengers_total = client_authentication_client_messengers_total
+		self.__client_authentication_replica_backoff_seconds = client_authentication_replica_backoff_seconds
+		self.__client_authentication_replica_maximum_backoff_seconds = client_authentication_replica_maximum_backoff_seconds
+		self.__authentication_timeout_worker_threads_total = authentication_timeout_worker_threads_total
+		self.__authentication_state_store_factory = authentication_state_store_factory
+		self.__authentication_session_token_cache_factory = authentication_session_token_cache_factory
+		self.__session_idle_timeout_seconds = session_idle_timeout_seconds
+		self.__session_idle_sweep_seconds = session_idle_sweep_seconds
+		self.__maximum_pending_authentications_total = maximum_pending_authentications_total
+		self.__authentication_requests_per_second = authentication_requests_per_second
+		self.__authentication_requests_burst_total = authentication_requests_burst_total
+		self.__server_busy_retry_after_seconds = server_busy_retry_after_seconds
+		self.__log_handler = log_handler
+		self.__metrics_file_path = metrics_file_path
+		self.__metrics_dump_seconds = metrics_dump_seconds
+		self.__response_batch_flush_seconds = response_batch_flush_seconds
+		self.__response_batch_maximum_client_server_messages_total = response_batch_maximum_client_server_messages_total
+		self.__unordered_response_worker_threads_total = unordered_response_worker_threads_total
+		self.__datagram_channel_server_factory = datagram_channel_server_factory
+		self.__client_interest_manager = client_interest_manager
+		self.__is_debug = is_debug
+
+		self.__client_authentication_replica_router = None  # type: ClientAuthenticationReplicaRouter
+		self.__authentication_timeout_scheduler = None  # type: DeadlineScheduler
+		self.__authentication_state_store = None  # type: AuthenticationStateStore
+		self.__authentication_state_machine = None  # type: GameManagerAuthenticationStateMachine
+		self.__response_client_server_message_batcher = None  # type: ResponseClientServerMessageBatcher
+		self.__response_batch_flush_scheduler = None  # type: DeadlineScheduler
+		self.__unordered_response_sender = None  # type: UnorderedResponseSender
+		self.__datagram_channel_server = None  # type: DatagramChannelServer
+		self.__client_interest_manager_semaphore = Semaphore()
+		self.__metrics = GameManagerStructureMetrics()
+		self.__found_exception = None  # type: Exception
+		self.__is_log_handler_owned = self.__log_handler is None
+
+		# the logger is kept out of the logging module's registry so that each structure has its own level and handler
+		self.__logger = logging.Logger(f"{__name__}.{GameManagerStructure.__name__}", logging.DEBUG if self.__is_debug else logging.INFO)
+		if self.__log_handler is None:
+			self.__log_handler = AsynchronousLogHandler()
+		self.__logger.addHandler(self.__log_handler)
+
+		for client_server_message_type, start_structure_state, end_structure_state, function in self.__class__.structure_transitions:
+			self.add_transition(
+				client_server_message_type=client_server_message_type,
+				start_structure_state=start_structure_state,
+				end_structure_state=end_structure_state,
+				on_transition=function.__get__(self)
+			)
+
+		self.__initialize()
+
+	def __init_subclass__(cls, **kwargs):
+		super().__init_subclass__(**kwargs)
+		cls.register_handlers()
+
+	@classmethod
+	def register_handlers(cls):
+		cls.client_authentication_client_server_message_handler_per_client_server_message_type, cls.structure_transitions = get_registered_handlers(
+			class_type=cls
+		)
+
+	def __initialize(self):
+
+		if self.__authentication_state_store_factory is None:
+			self.__authentication_state_store_factory = ShardedAuthenticationStateStoreFactory(
+				shards_total=16
+			)
+		self.__authentication_state_store = self.__authentication_state_store_factory.get_authentication_state_store()
+
+		self.__authentication_timeout_scheduler = DeadlineScheduler(
+			worker_threads_total=self.__authentication_timeout_worker_threads_total,
+			logger=self.__logger
+		)
+		self.__authentication_timeout_scheduler.start()
+
+		if self.__datagram_channel_server_factory is not None:
+			self.__datagram_channel_server = self.__datagram_channel_server_factory.get_datagram_channel_server()
+			self.__datagram_channel_server.start()
+
+		if self.__unordered_response_worker_threads_total is not None:
+			self.__unordered_response_sender = UnorderedResponseSender(
+				worker_threads_total=self.__unordered_response_worker_threads_total,
+				send_response=lambda client_server_message: super(GameManagerStructure, self).send_response(
+					client_server_message=client_server_message
+				),
+				logger=self.__logger
+			)
+			self.__unordered_response_sender.start()
+
+		if self.__response_batch_flush_seconds is not None:
+			# flushes get their own worker so that a slow client send never delays an authentication timeout
+			self.__response_batch_flush_scheduler = DeadlineScheduler(
+				worker_threads_total=1,
+				logger=self.__logger
+			)
+			self.__response_batch_flush_scheduler.start()
+			self.__response_client_server_message_batcher = ResponseClientServerMessageBatcher(
+				flush_seconds=self.__response_batch_flush_seconds,
+				maximum_client_server_messages_total=self.__response_batch_maximum_client_server_messages_total,
+				deadline_scheduler=self.__response_batch_flush_scheduler,
+				send_response=lambda client_server_message: super(GameManagerStructure, self).send_response(
+					client_server_message=client_server_message
+				)
+			)
+
+		if self.__metrics_file_path is not None:
+			self.__schedule_metrics_dump()
+
+		self.__client_authentication_replica_router = ClientAuthenticationReplicaRouter(
+			client_authentication_client_messenger_factories=self.__client_authentication_client_messenger_factories,
+			client_messengers_total=self.__client_authentication_client_messengers_total,
+			callback=self.__client_authentication_client_messenger_callback,
+			on_exception=self.__client_authentication_client_messenger_on_exception,
+			backoff_seconds=self.__client_authentication_replica_backoff_seconds,
+			maximum_backoff_seconds=self.__client_authentication_replica_maximum_backoff_seconds,
+			logger=self.__logger
+		)
+
+		authentication_session_token_cache = None  # type: AuthenticationSessionTokenCache
+		if self.__authentication_session_token_cache_factory is not None:
+			authentication_session_token_cache = self.__authentication_session_token_cache_factory.get_authentication_session_token_cache()
+
+		authentication_request_rate_limiter = None  # type: TokenBucketRateLimiter
+		if self.__authentication_requests_per_second is not None:
+			authentication_request_rate_limiter = TokenBucketRateLimiter(
+				tokens_per_second=self.__authentication_requests_per_second,
+				maximum_tokens_total=self.__authentication_requests_burst_total
+			)
+
+		self.__authentication_state_machine = GameManagerAuthenticationStateMachine(
+			authentication_timeout_seconds=self.__authentication_timeout_seconds,
+			authentication_state_store=self.__authentication_state_store,
+			authentication_session_token_cache=authentication_session_token_cache,
+			authentication_request_rate_limiter=authentication_request_rate_limiter,
+			client_authentication_replica_router=self.__client_authentication_replica_router,
+			deadline_scheduler=self.__authentication_timeout_scheduler,
+			metrics=self.__metrics,
+			logger=self.__logger,
+			send_response=lambda client_server_message: self.send_response(
+				client_server_message=client_server_message
+			),
+			run_blocking=lambda function: function(),
+			on_client_authenticated=self.__client_authenticated,
+			on_client_removed=self.__client_removed,
+			session_idle_timeout_seconds=self.__session_idle_timeout_seconds,
+			session_idle_sweep_seconds=self.__session_idle_sweep_seconds,
+			maximum_pending_authentications_total=self.__maximum_pending_authentications_total,
+			server_busy_retry_after_seconds=self.__server_busy_retry_after_seconds
+		)
+
+		self.__client_authentication_replica_router.connect_to_server()
+
+		self.__authentication_state_machine.start()
+
+	def __client_removed(self, client_uuid: str):
+		if self.__datagram_channel_server is not None:
+			self.__datagram_channel_server.remove_client(
+				client_uuid=client_uuid
+			)
+		if self.__client_interest_manager is not None:
+			self.__client_interest_manager_semaphore.acquire()
+			self.__client_interest_manager.remove_client(
+				client_uuid=client_uuid
+			)
+			self.__client_interest_manager_semaphore.release()
+
+	def __schedule_metrics_dump(self):
+
+		def metrics_dump():
+			try:
+				with open(self.__metrics_file_path, "a") as file_handle:
+					file_handle.write(json.dumps(self.get_metrics_snapshot()) + "\n")
+			except Exception as ex:
+				self.__logger.error("metrics_dump: ex: %s", ex)
+			self.__schedule_metrics_dump()
+
+		self.__authentication_timeout_scheduler.schedule(
+			deadline_key="metrics_dump",
+			delay_seconds=self.__metrics_dump_seconds,
+			callback=metrics_dump
+		)
+
+	def __client_authentication_client_messenger_callback(self, client_server_message: ClientServerMessage):
+		if self.__logger.isEnabledFor(logging.DEBUG):
+			self.__logger.debug("client_authentication_client_messenger_callback: client_server_message: %s", client_server_message)
+		client_authentication_client_server_message_handler = self.__class__.client_authentication_client_server_message_handler_per_client_server_message_type.get(client_server_message.__class__.get_client_server_message_type(), None)
+		if client_authentication_client_server_message_handler is None:
+			raise Exception(f"{datetime.utcnow()}: GameManagerStructure: __client_authentication_client_messenger_callback: Unexpected ClientAuthenticationClientServerMessage: {type(client_server_message)}.")
+		client_authentication_client_server_message_handler(self, client_server_message)
+
+	@client_authentication_client_server_message_handler(
+		client_server_message_class=UrlNavigationNeededResponseClientAuthenticationClientServerMessage
+	)
+	def __url_navigation_needed_response_received(self, client_server_message: UrlNavigationNeededResponseClientAuthenticationClientServerMessage):
+		self.__authentication_state_machine.url_navigation_needed_response_received(
+			client_server_message=client_server_message
+		)
+
+	@client_authentication_client_server_message_handler(
+		client_server_message_class=AuthenticationResponseClientAuthenticationClientServerMessage
+	)
+	def __authentication_response_received(self, client_server_message: AuthenticationResponseClientAuthenticationClientServerMessage):
+		self.__authentication_state_machine.authentication_response_received(
+			client_server_message=client_server_message
+		)
+
+	@client_authentication_client_server_message_handler(
+		client_server_message_class=UnexpectedAuthenticationRequestClientAuthenticationClientServerMessage
+	)
+	def __unexpected_authentication_request_received(self, client_server_message: UnexpectedAuthenticationRequestClientAuthenticationClientServerMessage):
+		self.__authentication_state_machine.unexpected_authentication_request_received(
+			client_server_message=client_server_message
+		)
+
+	@client_authentication_client_server_message_handler(
+		client_server_message_class=UnexpectedOpenidAuthenticationResponseClientAuthenticationClientServerMessage
+	)
+	def __unexpected_openid_authentication_response_received(self, client_server_message: UnexpectedOpenidAuthenticationResponseClientAuthenticationClientServerMessage):
+		self.__authentication_state_machine.unexpected_openid_authentication_response_received(
+			client_server_message=client_server_message
+		)
+
+	def __client_authentication_client_messenger_on_exception(self, exception: Exception):
+		self.__logger.error("client_authentication_client_messenger_on_exception: exception: %s", exception)
+		if self.__found_exception is None:
+			self.__found_exception = exception
+
+	@structure_transition(
+		client_server_message_type=GameManagerClientServerMessageTypeEnum.AuthenticateClientRequest,
+		start_structure_state=GameManagerStructureStateEnum.Active,
+		end_structure_state=GameManagerStructureStateEnum.Active
+	)
+	def __authenticate_client_request_received(self, structure_influence: StructureInfluence):
+
+		openid_authentication_request = structure_influence.get_client_server_message()  # type: AuthenticateClientRequestGameManagerClientServerMessage
+
+		external_metadata_json = self.__authentication_state_machine.start_authentication(
+			client_uuid=structure_influence.get_source_uuid(),
+			session_token=openid_authentication_request.get_session_token()
+		)
+		if external_metadata_json is not None:
+			try:
+				self.__authentication_state_machine.send_authentication_request(
+					external_metadata_json=external_metadata_json
+				)
+			except Exception as ex:
+				self.__authentication_state_machine.authentication_request_failed(
+					external_metadata_json=external_metadata_json,
+					exception=ex
+				)
+			else:
+				self.__authentication_state_machine.authentication_request_sent(
+					external_metadata_json=external_metadata_json
+				)
+
+	def __client_authenticated(self, client_uuid: str):
+		self.__send_datagram_channel_bind(
+			client_uuid=client_uuid
+		)
+
+	def __send_datagram_channel_bind(self, *, client_uuid: str):
+		if self.__datagram_channel_server is not None:
+			self.send_response(
+				client_server_message=DatagramChannelBindGameManagerClientServerMessage(
+					bind_token=self.__datagram_channel_server.add_bind_token(
+						client_uuid=client_uuid
+					),
+					port=self.__datagram_channel_server.get_port(),
+					destination_uuid=client_uuid
+				)
+			)
+
+	def send_datagram(self, *, client_uuid: str, datagram_bytes: bytes) -> bool:
+		if self.__datagram_channel_server is None:
+			raise Exception(f"No datagram_channel_server_factory was provided.")
+		return self.__datagram_channel_server.send_to_client(
+			client_uuid=client_uuid,
+			datagram_bytes=datagram_bytes
+		)
+
+	def update_structure(self, *, structure_influence: StructureInfluence):
+		# any inbound message keeps an authenticated session alive so that the idle sweep only evicts quiet clients
+		self.__authentication_state_machine.refresh_client_session(
+			client_uuid=structure_influence.get_source_uuid()
+		)
+		super().update_structure(
+			structure_influence=structure_influence
+		)
+
+	def send_response(self, *, client_server_message: ClientServerMessage):
+		# only messages that declare is_ordered=False use the unordered lane, and they skip batching since they are the latency sensitive ones
+		if not client_server_message.is_ordered():
+			if self.__unordered_response_sender is None:
+				super().send_response(
+					client_server_message=client_server_message
+				)
+			else:
+				self.__unordered_response_sender.send(
+					client_server_message=client_server_message
+				)
+		elif self.__response_client_server_message_batcher is None:
+			super().send_response(
+				client_server_message=client_server_message
+			)
+		else:
+			self.__response_client_server_message_batcher.add(
+				client_server_message=client_server_message
+			)
+
+	def set_client_interest(self, *, client_uuid: str, position: Tuple[float, ...], radius: float) -> bool:
+		if self.__client_interest_manager is None:
+			raise Exception(f"No client_interest_manager was provided.")
+		if self.__authentication_state_machine.get_authentication_id(
+			client_uuid=client_uuid
+		) is None:
+			return False
+		self.__client_interest_manager_semaphore.acquire()
+		self.__client_interest_manager.set_client_interest(
+			client_uuid=client_uuid,
+			position=position,
+			radius=radius
+		)
+		self.__client_interest_manager_semaphore.release()
+		return True
+
+	def send_entity_interest_updates(self, *, get_entity_json: Callable[[int], Dict]) -> int:
+		if self.__client_interest_manager is None:
+			raise Exception(f"No client_interest_manager was provided.")
+		self.__client_interest_manager_semaphore.acquire()
+		try:
+			client_interest_updates = self.__client_interest_manager.update()
+		finally:
+			self.__client_interest_manager_semaphore.release()
+		# get_entity_json is called once per visible entity per call and its json is shared by every client that can see it, although each message is still serialized separately
+		entity_json_per_entity_index = {}  # type: Dict[int, Dict]
+		sent_client_server_messages_total = 0
+		for client_interest_update in client_interest_updates:
+			visible_entity_indexes = client_interest_update.get_visible_entity_indexes().tolist()
+			left_entity_indexes = client_interest_update.get_left_entity_indexes().tolist()
+			if not visible_entity_indexes and not left_entity_indexes:
+				continue
+			entity_jsons = []  # type: List[Dict]
+			for entity_index in visible_entity_indexes:
+				entity_json = entity_json_per_entity_index.get(entity_index, None)
+				if entity_json is None:
+					entity_json = get_entity_json(entity_index)
+					entity_json_per_entity_index[entity_index] = entity_json
+				entity_jsons.append(entity_json)
+			self.send_response(
+				client_server_message=EntityInterestUpdateGameManagerClientServerMessage(
+					entered_entity_indexes=client_interest_update.get_entered_entity_indexes().tolist(),
+					left_entity_indexes=left_entity_indexes,
+					entity_jsons=entity_jsons,
+					destination_uuid=client_interest_update.get_client_uuid()
+				)
+			)
+			sent_client_server_messages_total += 1
+		return sent_client_server_messages_total
+
+	def refresh_client_session(self, *, client_uuid: str):
+		self.__authentication_state_machine.refresh_client_session(
+			client_uuid=client_uuid
+		)
+
+	def client_disconnected(self, *, client_uuid: str):
+		# the framework does not tell the structure when a connection closes, so the server owner must call this for every client that disconnects
+		self.__authentication_state_machine.client_disconnected(
+			client_uuid=client_uuid
+		)
+
+	def get_authentication_id(self, *, client_uuid: str) -> str:
+		return self.__authentication_state_machine.get_authentication_id(
+			client_uuid=client_uuid
+		)
+
+	def get_authenticated_sessions_total(self) -> int:
+		return self.__authentication_state_machine.get_authenticated_sessions_total()
+
+	def get_metrics_snapshot(self) -> Dict:
+		return self.__authentication_state_machine.get_metrics_snapshot()
+
+	def dispose(self):
+		self.__client_authentication_replica_router.dispose()
+		if self.__response_client_server_message_batcher is not None:
+			self.__response_client_server_message_batcher.flush_all()
+			self.__response_batch_flush_scheduler.dispose()
+		self.__authentication_timeout_scheduler.dispose()
+		if self.__unordered_response_sender is not None:
+			self.__unordered_response_sender.dispose()
+		if self.__datagram_channel_server is not None:
+			self.__datagram_channel_server.dispose()
+		self.__authentication_state_store.dispose()
+		self.__logger.removeHandler(self.__log_handler)
+		if self.__is_log_handler_owned:
+			self.__log_handler.close()
+
+
+GameManagerStructure.register_handlers()
+
+
+class GameManagerStructureFactory(StructureFactory):
+
+	def __init__(self, *, authentication_timeout_seconds: float, client_authentication_client_messenger_factory: ClientMessengerFactory = None, client_authentication_client_messenger_factories: List[ClientMessengerFactory] = None, client_authentication_client_messengers_total: int = 1, client_authentication_replica_backoff_seconds: float = 1.0, client_authentication_replica_maximum_backoff_seconds: float = 60.0, authentication_timeout_worker_threads_total: int = 1, authentication_state_store_factory: AuthenticationStateStoreFactory = None, authentication_session_token_cache_factory: AuthenticationSessionTokenCacheFactory = None, session_idle_timeout_seconds: float = None, session_idle_sweep_seconds: float = 60.0, maximum_pending_authentications_total: int = None, authentication_requests_per_second: float = None, authentication_requests_burst_total: int = 1, server_busy_retry_after_seconds: float = 1.0, log_handler: logging.Handler = None, metrics_file_path: str = None, metrics_dump_seconds: float = 60.0, response_batch_flush_seconds: float = None, response_batch_maximum_client_server_messages_total: int = 64, unordered_response_worker_threads_total: int = None, datagram_channel_server_factory: DatagramChannelServerFactory = None, client_interest_manager: ClientInterestManager = None, is_debug: bool = False):
+
+		self.__client_authentication_client_messenger_factory = client_authentication_client_messenger_factory
+		self.__client_authentication_client_messenger_factories = client_authentication_client_messenger_factories
+		self.__authentication_timeout_seconds = authentication_timeout_seconds
+		self.__client_authentication_client_messengers_total = client_authentication_client_messengers_total
+		self.__client_authentication_replica_backoff_seconds = client_authentication_replica_backoff_seconds
+		self.__client_authentication_replica_maximum_backoff_seconds = client_authentication_replica_maximum_backoff_seconds
+		self.__authentication_timeout_worker_threads_total = authentication_timeout_worker_threads_total
+		self.__authentication_state_store_factory = authentication_state_store_factory
+		self.__authentication_session_token_cache_factory = authentication_session_token_cache_factory
+		self.__session_idle_timeout_seconds = session_idle_timeout_seconds
+		self.__session_idle_sweep_seconds = session_idle_sweep_seconds
+		self.__maximum_pending_authentications_total = maximum_pending_authentications_total
+		self.__authentication_requests_per_second = authentication_requests_per_second
+		self.__authentication_requests_burst_total = authentication_requests_burst_total
+		self.__server_busy_retry_after_seconds = server_busy_retry_after_seconds
+		self.__log_handler = log_handler
+		self.__metrics_file_path = metrics_file_path
+		self.__metrics_dump_seconds = metrics_dump_seconds
+		self.__response_batch_flush_seconds = response_batch_flush_seconds
+		self.__response_batch_maximum_client_server_messages_total = response_batch_maximum_client_server_messages_total
+		self.__unordered_response_worker_threads_total = unordered_response_worker_threads_total
+		self.__datagram_channel_server_factory = datagram_channel_server_factory
+		self.__client_interest_manager = client_interest_manager
+		self.__is_debug = is_debug
+
+	def get_structure(self) -> Structure:
+		return GameManagerStructure(
+			authentication_timeout_seconds=self.__authentication_timeout_seconds,
+			client_authentication_client_messenger_factory=self.__client_authentication_client_messenger_factory,
+			client_authentication_client_messenger_factories=self.__client_authentication_client_messenger_factories,
+			client_authentication_client_messengers_total=self.__client_authentication_client_messengers_total,
+			client_authentication_replica_backoff_seconds=self.__client_authentication_replica_backoff_seconds,
+			client_authentication_replica_maximum_backoff_seconds=self.__client_authentication_replica_maximum_backoff_seconds,
+			authentication_timeout_worker_threads_total=self.__authentication_timeout_worker_threads_total,
+			authentication_state_store_factory=self.__authentication_state_store_factory,
+			authentication_session_token_cache_factory=self.__authentication_session_token_cache_factory,
+			session_idle_timeout_seconds=self.__session_idle_timeout_seconds,
+			session_idle_sweep_seconds=self.__session_idle_sweep_seconds,
+			maximum_pending_authentications_total=self.__maximum_pending_authentications_total,
+			authentication_requests_per_second=self.__authentication_requests_per_second,
+			authentication_requests_burst_total=self.__authentication_requests_burst_total,
+			server_busy_retry_after_seconds=self.__server_busy_retry_after_seconds,
+			log_handler=self.__log_handler,
+			metrics_file_path=self.__metrics_file_path,
+			metrics_dump_seconds=self.__metrics_dump_seconds,
+			response_batch_flush_seconds=self.__response_batch_flush_seconds,
+			response_batch_maximum_client_server_messages_total=self.__response_batch_maximum_client_server_messages_total,
+			unordered_response_worker_threads_total=self.__unordered_response_worker_threads_total,
+			datagram_channel_server_factory=self.__datagram_channel_server_factory,
+			client_interest_manager=self.__client_interest_manager,
+			is_debug=self.__is_debug
+		)
+
+
+class AsyncioGameManagerStructure():
+
+	def __init__(self, *, send_response: Callable[[ClientServerMessage], None], authentication_timeout_seconds: float, client_authentication_client_messenger_factory: ClientMessengerFactory = None, client_authentication_client_messenger_factories: List[ClientMessengerFactory] = None, client_authentication_client_messengers_total: int = 1, client_authentication_replica_backoff_seconds: float = 1.0, client_authentication_replica_maximum_backoff_seconds: float = 60.0, authentication_state_store_factory: AuthenticationStateStoreFactory = None, authentication_session_token_cache_factory: AuthenticationSessionTokenCacheFactory = None, session_idle_timeout_seconds: float = None, session_idle_sweep_seconds: float = 60.0, maximum_pending_authentications_total: int = None, authentication_requests_per_second: float = None, authentication_requests_burst_total: int = 1, server_busy_retry_after_seconds: float = 1.0, log_handler: logging.Handler = None, is_debug: bool = False):
+
+		if (client_authentication_client_messenger_factory is None) == (client_authentication_client_messenger_factories is None):
+			raise Exception(f"Exactly one of client_authentication_client_messenger_factory or client_authentication_client_messenger_factories must be provided.")
+
+		self.__send_response = send_response
+		self.__authentication_timeout_seconds = authentication_timeout_seconds
+		self.__client_authentication_client_messenger_factories = [client_authentication_client_messenger_factory] if client_authentication_client_messenger_factories is None else client_authentication_client_messenger_factories
+		self.__client_authentication_client_messengers_total = client_authentication_client_messengers_total
+		self.__client_authentication_replica_backoff_seconds = client_authentication_replica_backoff_seconds
+		self.__client_authentication_replica_maximum_backoff_seconds = client_authentication_replica_maximum_backoff_seconds
+		self.__authentication_state_store_factory = authentication_state_store_factory
+		self.__authentication_session_token_cache_factory = authentication_session_token_cache_factory
+		self.__session_idle_timeout_seconds = session_idle_timeout_seconds
+		self.__session_idle_sweep_seconds = session_idle_sweep_seconds
+		self.__maximum_pending_authentications_total = maximum_pending_authentications_total
+		self.__authentication_requests_per_second = authentication_requests_per_second
+		self.__authentication_requests_burst_total = authentication_requests_burst_total
+		self.__server_busy_retry_after_seconds = server_busy_retry_after_seconds
+		self.__log_handler = log_handler
+		self.__is_debug = is_debug
+
+		self.__loop = None  # type: asyncio.AbstractEventLoop
+		self.__structure_state = GameManagerStructureStateEnum.Active
+		self.__structure_transition_per_key = {(client_server_message_type, start_structure_state): (end_structure_state, function) for client_server_message_type, start_structure_state, end_structure_state, function in self.__class__.structure_transitions}  # type: Dict[Tuple[ClientServerMessageTypeEnum, StructureStateEnum], Tuple[StructureStateEnum, Callable]]
+		self.__client_authentication_replica_router = None  # type: ClientAuthenticationReplicaRouter
+		self.__authentication_state_store = None  # type: AuthenticationStateStore
+		self.__deadline_scheduler = None  # type: AsyncioDeadlineScheduler
+		self.__authentication_state_machine = None  # type: GameManagerAuthenticationStateMachine
+		self.__metrics = GameManagerStructureMetrics()
+		self.__found_exception = None  # type: Exception
+		self.__is_log_handler_owned = self.__log_handler is None
+
+		self.__logger = logging.Logger(f"{__name__}.{AsyncioGameManagerStructure.__name__}", logging.DEBUG if self.__is_debug else logging.INFO)
+		if self.__log_handler is None:
+			self.__log_handler = AsynchronousLogHandler()
+		self.__logger.addHandler(self.__log_handler)
+
+	def __init_subclass__(cls, **kwargs):
+		super().__init_subclass__(**kwargs)
+		cls.register_handlers()
+
+	@classmethod
+	def register_handlers(cls):
+		cls.client_authentication_client_server_message_handler_per_client_server_message_type, cls.structure_transitions = get_registered_handlers(
+			class_type=cls
+		)
+
+	async def start(self):
+
+		self.__loop = asyncio.get_running_loop()
+
+		if self.__authentication_state_store_factory is None:
+			# every state access happens on the event loop, so a single shard never contends
+			self.__authentication_state_store_factory = ShardedAuthenticationStateStoreFactory(
+				shards_total=1
+			)
+		self.__authentication_state_store = self.__authentication_state_store_factory.get_authentication_state_store()
+
+		authentication_session_token_cache = None  # type: AuthenticationSessionTokenCache
+		if self.__authentication_session_token_cache_factory is not None:
+			authentication_session_token_cache = self.__authentication_session_token_cache_factory.get_authentication_session_token_cache()
+
+		authentication_request_rate_limiter = None  # type: TokenBucketRateLimiter
+		if self.__authentication_requests_per_second is not None:
+			authentication_request_rate_limiter = TokenBucketRateLimiter(
+				tokens_per_second=self.__authentication_requests_per_second,
+				maximum_tokens_total=self.__authentication_requests_burst_total
+			)
+
+		self.__deadline_scheduler = AsyncioDeadlineScheduler(
+			loop=self.__loop
+		)
+
+		self.__client_authentication_replica_router = ClientAuthenticationReplicaRouter(
+			client_authentication_client_messenger_factories=self.__client_authentication_client_messenger_factories,
+			client_messengers_total=self.__client_authentication_client_messengers_total,
+			callback=self.__client_authentication_client_messenger_callback,
+			on_exception=self.__client_authentication_client_messenger_on_exception,
+			backoff_seconds=self.__client_authentication_replica_backoff_seconds,
+			maximum_backoff_seconds=self.__client_authentication_replica_maximum_backoff_seconds,
+			logger=self.__logger
+		)
+
+		self.__authentication_state_machine = GameManagerAuthenticationStateMachine(
+			authentication_timeout_seconds=self.__authentication_timeout_seconds,
+			authentication_state_store=self.__authentication_state_store,
+			authentication_session_token_cache=authentication_session_token_cache,
+			authentication_request_rate_limiter=authentication_request_rate_limiter,
+			client_authentication_replica_router=self.__client_authentication_replica_router,
+			deadline_scheduler=self.__deadline_scheduler,
+			metrics=self.__metrics,
+			logger=self.__logger,
+			send_response=self.__send_response,
+			# the router serializes with a threading lock, so it is only ever called from the default executor
+			run_blocking=lambda function: self.__loop.run_in_executor(None, function),
+			on_client_authenticated=None,
+			on_client_removed=None,
+			session_idle_timeout_seconds=self.__session_idle_timeout_seconds,
+			session_idle_sweep_seconds=self.__session_idle_sweep_seconds,
+			maximum_pending_authentications_total=self.__maximum_pending_authentications_total,
+			server_busy_retry_after_seconds=self.__server_busy_retry_after_seconds
+		)
+
+		# the upstream messengers use blocking sockets, so they are only ever touched from the default executor
+		await self.__loop.run_in_executor(None, self.__client_authentication_replica_router.connect_to_server)
+
+		self.__authentication_state_machine.start()
+
+	def __client_authentication_client_messenger_callback(self, client_server_message: ClientServerMessage):
+		self.__loop.call_soon_threadsafe(self.__dispatch_client_authentication_client_server_message, client_server_message)
+
+	def __client_authentication_client_messenger_on_exception(self, exception: Exception):
+		self.__logger.error("client_authentication_client_messenger_on_exception: exception: %s", exception)
+		if self.__found_exception is None:
+			self.__found_exception = exception
+
+	def __dispatch_client_authentication_client_server_message(self, client_server_message: ClientServerMessage):
+		client_authentication_client_server_message_handler = self.__class__.client_authentication_client_server_message_handler_per_client_server_message_type.get(client_server_message.__class__.get_client_server_message_type(), None)
+		if client_authentication_client_server_message_handler is None:
+			raise Exception(f"{datetime.utcnow()}: AsyncioGameManagerStructure: __dispatch_client_authentication_client_server_message: Unexpected ClientAuthenticationClientServerMessage: {type(client_server_message)}.")
+		client_authentication_client_server_message_handler(self, client_server_message)
+
+	@client_authentication_client_server_message_handler(
+		client_server_message_class=UrlNavigationNeededResponseClientAuthenticationClientServerMessage
+	)
+	def __url_navigation_needed_response_received(self, client_server_message: UrlNavigationNeededResponseClientAuthenticationClientServerMessage):
+		self.__authentication_state_machine.url_navigation_needed_response_received(
+			client_server_message=client_server_message
+		)
+
+	@client_authentication_client_server_message_handler(
+		client_server_message_class=AuthenticationResponseClientAuthenticationClientServerMessage
+	)
+	def __authentication_response_received(self, client_server_message: AuthenticationResponseClientAuthenticationClientServerMessage):
+		self.__authentication_state_machine.authentication_response_received(
+			client_server_message=client_server_message
+		)
+
+	@client_authentication_client_server_message_handler(
+		client_server_message_class=UnexpectedAuthenticationRequestClientAuthenticationClientServerMessage
+	)
+	def __unexpected_authentication_request_received(self, client_server_message: UnexpectedAuthenticationRequestClientAuthenticationClientServerMessage):
+		self.__authentication_state_machine.unexpected_authentication_request_received(
+			client_server_message=client_server_message
+		)
+
+	@client_authentication_client_server_message_handler(
+		client_server_message_class=UnexpectedOpenidAuthenticationResponseClientAuthenticationClientServerMessage
+	)
+	def __unexpected_openid_authentication_response_received(self, client_server_message: UnexpectedOpenidAuthenticationResponseClientAuthenticationClientServerMessage):
+		self.__authentication_state_machine.unexpected_openid_authentication_response_received(
+			client_server_message=client_server_message
+		)
+
+	async def update_structure(self, *, structure_influence: StructureInfluence):
+		self.__authentication_state_machine.refresh_client_session(
+			client_uuid=structure_influence.get_source_uuid()
+		)
+		client_server_message = structure_influence.get_client_server_message()
+		structure_transition = self.__structure_transition_per_key.get((client_server_message.__class__.get_client_server_message_type(), self.__structure_state), None)
+		if structure_transition is None:
+			self.__send_response(GameManagerErrorGameManagerClientServerMessage(
+				structure_state_name=self.__structure_state.value,
+				client_server_message_json=client_server_message.to_json(),
+				destination_uuid=structure_influence.get_source_uuid()
+			))
+		else:
+			end_structure_state, function = structure_transition
+			self.__structure_state = end_structure_state
+			await function(self, structure_influence)
+
+	@structure_transition(
+		client_server_message_type=GameManagerClientServerMessageTypeEnum.AuthenticateClientRequest,
+		start_structure_state=GameManagerStructureStateEnum.Active,
+		end_structure_state=GameManagerStructureStateEnum.Active
+	)
+	async def __authenticate_client_request_received(self, structure_influence: StructureInfluence):
+
+		openid_authentication_request = structure_influence.get_client_server_message()  # type: AuthenticateClientRequestGameManagerClientServerMessage
+
+		external_metadata_json = self.__authentication_state_machine.start_authentication(
+			client_uuid=structure_influence.get_source_uuid(),
+			session_token=openid_authentication_request.get_session_token()
+		)
+		if external_metadata_json is not None:
+			try:
+				await self.__loop.run_in_executor(None, lambda: self.__authentication_state_machine.send_authentication_request(
+					external_metadata_json=external_metadata_json
+				))
+			except Exception as ex:
+				self.__authentication_state_machine.authentication_request_failed(
+					external_metadata_json=external_metadata_json,
+					exception=ex
+				)
+			else:
+				self.__authentication_state_machine.authentication_request_sent(
+					external_metadata_json=external_metadata_json
+				)
+
+	def refresh_client_session(self, *, client_uuid: str):
+		self.__authentication_state_machine.refresh_client_session(
+			client_uuid=client_uuid
+		)
+
+	def client_disconnected(self, *, client_uuid: str):
+		# the framework does not tell the structure when a connection closes, so the server owner must call this for every client that disconnects
+		self.__authentication_state_machine.client_disconnected(
+			client_uuid=client_uuid
+		)
+
+	def get_authentication_id(self, *, client_uuid: str) -> str:
+		return self.__authentication_state_machine.get_authentication_id(
+			client_uuid=client_uuid
+		)
+
+	def get_authenticated_sessions_total(self) -> int:
+		return self.__authentication_state_machine.get_authenticated_sessions_total()
+
+	def get_metrics_snapshot(self) -> Dict:
+		return self.__authentication_state_machine.get_metrics_snapshot()
+
+	async def dispose(self):
+		if self.__deadline_scheduler is not None:
+			self.__deadline_scheduler.dispose()
+		if self.__client_authentication_replica_router is not None:
+			await self.__loop.run_in_executor(None, self.__client_authentication_replica_router.dispose)
+		if self.__authentication_state_store is not None:
+			self.__authentication_state_store.dispose()
+		self.__logger.removeHandler(self.__log_handler)
+		if self.__is_log_handler_owned:
+			self.__log_handler.close()
+
+
+AsyncioGameManagerStructure.register_handlers()
+
+
+class AsyncioGameManagerStructureFactory():
+
+	def __init__(self, *, authentication_timeout_seconds: float, client_authentication_client_messenger_factory: ClientMessengerFactory = None, client_authentication_client_messenger_factories: List[ClientMessengerFactory] = None, client_authentication_client_messengers_total: int = 1, client_authentication_replica_backoff_seconds: float = 1.0, client_authentication_replica_maximum_backoff_seconds: float = 60.0, authentication_state_store_factory: AuthenticationStateStoreFactory = None, authentication_session_token_cache_factory: AuthenticationSessionTokenCacheFactory = None, session_idle_timeout_seconds: float = None, session_idle_sweep_seconds: float = 60.0, maximum_pending_authentications_total: int = None, authentication_requests_per_second: float = None, authentication_requests_burst_total: int = 1, server_busy_retry_after_seconds: float = 1.0, log_handler: logging.Handler = None, is_debug: bool = False):
+
+		self.__authentication_timeout_seconds = authentication_timeout_seconds
+		self.__client_authentication_client_messenger_factory = client_authentication_client_messenger_factory
+		self.__client_authentication_client_messenger_factories = client_authentication_client_messenger_factories
+		self.__client_authentication_client_messengers_total = client_authentication_client_messengers_total
+		self.__client_authentication_replica_backoff_seconds = client_authentication_replica_backoff_seconds
+		self.__client_authentication_replica_maximum_backoff_seconds = client_authentication_replica_maximum_backoff_seconds
+		self.__authentication_state_store_factory = authentication_state_store_factory
+		self.__authentication_session_token_cache_factory = authentication_session_token_cache_factory
+		self.__session_idle_timeout_seconds = session_idle_timeout_seconds
+		self.__session_idle_sweep_seconds = session_idle_sweep_seconds
+		self.__maximum_pending_authentications_total = maximum_pending_authentications_total
+		self.__authentication_requests_per_second = authentication_requests_per_second
+		self.__authentication_requests_burst_total = authentication_requests_burst_total
+		self.__server_busy_retry_after_seconds = server_busy_retry_after_seconds
+		self.__log_handler = log_handler
+		self.__is_debug = is_debug
+
+	def get_structure(self, *, send_response: Callable[[ClientServerMessage], None]) -> AsyncioGameManagerStructure:
+		return AsyncioGameManagerStructure(
+			send_response=send_response,
+			authentication_timeout_seconds=self.__authentication_timeout_seconds,
+			client_authentication_client_messenger_factory=self.__client_authentication_client_messenger_factory,
+			client_authentication_client_messenger_factories=self.__client_authentication_client_messenger_factories,
+			client_authentication_client_messengers_total=self.__client_authentication_client_messengers_total,
+			client_authentication_replica_backoff_seconds=self.__client_authentication_replica_backoff_seconds,
+			client_authentication_replica_maximum_backoff_seconds=self.__client_authentication_replica_maximum_backoff_seconds,
+			authentication_state_store_factory=self.__authentication_state_store_factory,
+			authentication_session_token_cache_factory=self.__authentication_session_token_cache_factory,
+			session_idle_timeout_seconds=self.__session_idle_timeout_seconds,
+			session_idle_sweep_seconds=self.__session_idle_sweep_seconds,
+			maximum_pending_authentications_total=self.__maximum_pending_authentications_total,
+			authentication_requests_per_second=self.__authentication_requests_per_second,
+			authentication_requests_burst_total=self.__authentication_requests_burst_total,
+			server_busy_retry_after_seconds=self.__server_busy_retry_after_seconds,
+			log_handler=self.__log_handler,
 			is_debug=self.__is_debug
 		)
@@ -0,0 +1,773 @@
+from __future__ import annotations
+from typing import List, Tuple, Dict, Set, Callable, Type
+import heapq
+from enum import Enum
+import numpy as np
+
+
+class Dot():
+
+	def __init__(self, position: Tuple[float, float], velocity: Tuple[float, float], acceleration: Tuple[float, float]):
+
+		self.__position = position
+		self.__velocity = velocity
+		self.__acceleration = acceleration
+		self.__time_index_offset = 0
+
+		self.__acceleration_delta = None  # type: Tuple[float, float]
+		self.__acceleration_delta_end_time_index = None  # type: float
+		self.__acceleration_delta_end_time_index_acceleration = None  # type: Tuple[float, float]
+
+	def set_positiion(self, *, position: Tuple[float, float]):
+		self.__position = position
+
+	def set_velocity(self, *, velocity: Tuple[float, float]):
+		self.__velocity = velocity
+
+	def set_acceleration(self, *, acceleration: Tuple[float, float]):
+		self.__acceleration = acceleration
+
+	def get_position(self, *, time_index: float) -> Tuple[float, float]:
+		calculated_time_index = time_index + self.__time_index_offset
+		position = list(self.__position)
+		for dimension_index in range(len(position)):
+			position[dimension_index] += self.__velocity[dimension_index] * calculated_time_index
+			if self.__acceleration_delta_end_time_index is None:
+				position[dimension_index] += (self.__acceleration[dimension_index] * calculated_time_index ** 2) / 2.0
+			else:
+				if calculated_time_index < self.__acceleration_delta_end_time_index:
+					position[dimension_index] += (self.__acceleration[dimension_index] * calculated_time_index ** 2) / 2.0
+					position[dimension_index] += (self.__acceleration_delta[dimension_index] * calculated_time_index ** 3) / 6.0
+				else:
+					position[dimension_index] += (self.__acceleration[dimension_index] * self.__acceleration_delta_end_time_index ** 2) / 2.0
+					position[dimension_index] += (self.__acceleration_delta_end_time_index_acceleration[dimension_index] * (calculated_time_index - self.__acceleration_delta_end_time_index) ** 2) / 2.0
+					position[dimension_index] += (self.__acceleration_delta[dimension_index] * self.__acceleration_delta_end_time_index ** 3) / 6.0
+		return tuple(position)
+
+	def get_velocity(self, *, time_index: float) -> Tuple[float, float]:
+		calculated_time_index = time_index + self.__time_index_offset
+		velocity = list(self.__velocity)
+		for dimension_index in range(len(velocity)):
+			if self.__acceleration_delta_end_time_index is None:
+				velocity[dimension_index] += self.__acceleration[dimension_index] * calculated_time_index
+			else:
+				if calculated_time_index < self.__acceleration_delta_end_time_index:
+					velocity[dimension_index] += self.__acceleration[dimension_index] * calculated_time_index
+					velocity[dimension_index] += (self.__acceleration_delta[dimension_index] * calculated_time_index**2) / 2.0
+				else:
+					velocity[dimension_index] += self.__acceleration[dimension_index] * self.__acceleration_delta_end_time_index
+					velocity[dimension_index] += self.__acceleration_delta_end_time_index_acceleration[dimension_index] * (calculated_time_index - self.__acceleration_delta_end_time_index)
+					velocity[dimension_index] += (self.__acceleration_delta[dimension_index] * self.__acceleration_delta_end_time_index**2) / 2.0
+		return tuple(velocity)
+
+	def get_acceleration(self, *, time_index: float) -> Tuple[float, float]:
+		calculated_time_index = time_index + self.__time_index_offset
+		acceleration = [0] * len(self.__position)
+		for dimension_index in range(len(acceleration)):
+			if self.__acceleration_delta_end_time_index is None:
+				acceleration[dimension_index] += self.__acceleration[dimension_index]
+			else:
+				if calculated_time_index < self.__acceleration_delta_end_time_index:
+					acceleration[dimension_index] += self.__acceleration[dimension_index]
+					acceleration[dimension_index] += (self.__acceleration_delta[dimension_index] * calculated_time_index)
+				else:
+					acceleration[dimension_index] += self.__acceleration_delta_end_time_index_acceleration[dimension_index]
+					acceleration[dimension_index] += (self.__acceleration_delta[dimension_index] * self.__acceleration_delta_end_time_index)
+		return tuple(acceleration)
+
+	def bounce(self, *, time_index: float):
+		bounce_position = self.get_position(
+			time_index=time_index
+		)
+		bounce_velocity = self.get_velocity(
+			time_index=time_index
+		)
+		bounce_acceleration = self.get_acceleration(
+			time_index=time_index
+		)
+		self.__position = bounce_position
+		self.__velocity = (bounce_velocity[0], -bounce_velocity[1])
+		self.__acceleration = bounce_acceleration
+		calculated_time_index = time_index + self.__time_index_offset
+		if self.__acceleration_delta_end_time_index is not None:
+			self.__acceleration_delta_end_time_index -= calculated_time_index
+			if self.__acceleration_delta_end_time_index <= 0:
+				self.__acceleration_delta = None
+				self.__acceleration_delta_end_time_index = None
+				self.__acceleration_delta_end_time_index_acceleration = None
+		self.__time_index_offset = -time_index
+
+	def reflect(self, *, time_index: float):
+		reflect_position = self.get_position(
+			time_index=time_index
+		)
+		reflect_velocity = self.get_velocity(
+			time_index=time_index
+		)
+		reflect_acceleration = self.get_acceleration(
+			time_index=time_index
+		)
+		self.__position = reflect_position
+		self.__velocity = (-reflect_velocity[0], reflect_velocity[1])
+		self.__acceleration = reflect_acceleration
+		calculated_time_index = time_index + self.__time_index_offset
+		if self.__acceleration_delta_end_time_index is not None:
+			self.__acceleration_delta_end_time_index -= calculated_time_index
+			if self.__acceleration_delta_end_time_index <= 0:
+				self.__acceleration_delta = None
+				self.__acceleration_delta_end_time_index = None
+				self.__acceleration_delta_end_time_index_acceleration = None
+		self.__time_index_offset = -time_index
+
+	def set_state(self, *, position: Tuple[float, float], velocity: Tuple[float, float], acceleration: Tuple[float, float], time_index: float):
+		self.__position = position
+		self.__velocity = velocity
+		self.__acceleration = acceleration
+		calculated_time_index = time_index + self.__time_index_offset
+		if self.__acceleration_delta_end_time_index is not None:
+			self.__acceleration_delta_end_time_index -= calculated_time_index
+			if self.__acceleration_delta_end_time_index <= 0:
+				self.__acceleration_delta = None
+				self.__acceleration_delta_end_time_index = None
+				self.__acceleration_delta_end_time_index_acceleration = None
+		self.__time_index_offset = -time_index
+
+	def set_acceleration_delta(self, *, time_index: float, acceleration_delta: Tuple[float, float], end_time_index: float):
+		time_index_position = self.get_position(
+			time_index=time_index
+		)
+		time_index_velocity = self.get_velocity(
+			time_index=time_index
+		)
+		time_index_acceleration = self.get_acceleration(
+			time_index=time_index
+		)
+		self.__position = time_index_position
+		self.__velocity = time_index_velocity
+		self.__acceleration = time_index_acceleration
+		self.__time_index_offset = -time_index
+		self.__acceleration_delta = acceleration_delta
+		self.__acceleration_delta_end_time_index = end_time_index
+		self.__acceleration_delta_end_time_index_acceleration = time_index_acceleration
+
+	def merge(self, *, dot: Dot, current_time_index: float, merge_time_index_offset: float):
+		self_position = self.get_position(
+			time_index=current_time_index
+		)
+		self_velocity = self.get_velocity(
+			time_index=current_time_index
+		)
+		destination_position = dot.get_position(
+			time_index=current_time_index + merge_time_index_offset
+		)
+		destination_velocity = dot.get_velocity(
+			time_index=current_time_index + merge_time_index_offset
+		)
+		destination_acceleration = dot.get_acceleration(
+			time_index=current_time_index + merge_time_index_offset
+		)
+
+		acceleration_delta = []
+		acceleration = []
+		for dimension_index in range(len(self.__position)):
+			temp_acceleration_delta = (-12 * destination_position[dimension_index] + 6 * destination_velocity[dimension_index] * merge_time_index_offset + 12 * self_position[dimension_index] + 6 * self_velocity[dimension_index] * merge_time_index_offset) / (merge_time_index_offset**3)
+			temp_acceleration = (destination_velocity[dimension_index] - self_velocity[dimension_index]) / merge_time_index_offset - 0.5 * temp_acceleration_delta * merge_time_index_offset
+			acceleration_delta.append(temp_acceleration_delta)
+			acceleration.append(temp_acceleration)
+
+		self.__position = self_position
+		self.__velocity = self_velocity
+		self.__acceleration = tuple(acceleration)
+		self.__acceleration_delta = tuple(acceleration_delta)
+		self.__acceleration_delta_end_time_index = merge_time_index_offset
+		self.__acceleration_delta_end_time_index_acceleration = destination_acceleration
+		self.__time_index_offset = -current_time_index
+
+
+class DotSystem():
+
+	def __init__(self, *, dimensions_total: int, initial_capacity: int = 16):
+
+		self.__dimensions_total = dimensions_total
+
+		self.__dots_total = 0
+		self.__positions = np.zeros((initial_capacity, dimensions_total), dtype=np.float64)
+		self.__velocities = np.zeros((initial_capacity, dimensions_total), dtype=np.float64)
+		self.__accelerations = np.zeros((initial_capacity, dimensions_total), dtype=np.float64)
+		self.__time_index_offsets = np.zeros((initial_capacity, ), dtype=np.float64)
+		self.__is_acceleration_delta_active = np.zeros((initial_capacity, ), dtype=np.bool_)
+		self.__acceleration_deltas = np.zeros((initial_capacity, dimensions_total), dtype=np.float64)
+		self.__acceleration_delta_end_time_indexes = np.zeros((initial_capacity, ), dtype=np.float64)
+		self.__acceleration_delta_end_time_index_accelerations = np.zeros((initial_capacity, dimensions_total), dtype=np.float64)
+
+	def __ensure_capacity(self, *, dots_total: int):
+		capacity = self.__positions.shape[0]
+		if dots_total > capacity:
+			next_capacity = max(dots_total, capacity * 2, 1)
+
+			def grow(array: np.ndarray) -> np.ndarray:
+				grown_array = np.zeros((next_capacity, ) + array.shape[1:], dtype=array.dtype)
+				grown_array[:self.__dots_total] = array[:self.__dots_total]
+				return grown_array
+
+			self.__positions = grow(self.__positions)
+			self.__velocities = grow(self.__velocities)
+			self.__accelerations = grow(self.__accelerations)
+			self.__time_index_offsets = grow(self.__time_index_offsets)
+			self.__is_acceleration_delta_active = grow(self.__is_acceleration_delta_active)
+			self.__acceleration_deltas = grow(self.__acceleration_deltas)
+			self.__acceleration_delta_end_time_indexes = grow(self.__acceleration_delta_end_time_indexes)
+			self.__acceleration_delta_end_time_index_accelerations = grow(self.__acceleration_delta_end_time_index_accelerations)
+
+	def get_dimensions_total(self) -> int:
+		return self.__dimensions_total
+
+	def get_dots_total(self) -> int:
+		return self.__dots_total
+
+	def add_dot(self, *, position: Tuple[float, ...], velocity: Tuple[float, ...], acceleration: Tuple[float, ...]) -> int:
+		self.__ensure_capacity(
+			dots_total=self.__dots_total + 1
+		)
+		dot_index = self.__dots_total
+		self.__positions[dot_index] = position
+		self.__velocities[dot_index] = velocity
+		self.__accelerations[dot_index] = acceleration
+		self.__time_index_offsets[dot_index] = 0
+		self.__is_acceleration_delta_active[dot_index] = False
+		self.__acceleration_deltas[dot_index] = 0
+		self.__acceleration_delta_end_time_indexes[dot_index] = 0
+		self.__acceleration_delta_end_time_index_accelerations[dot_index] = 0
+		self.__dots_total += 1
+		return dot_index
+
+	def __get_dot_indexes(self, *, dot_indexes: np.ndarray) -> np.ndarray:
+		if dot_indexes is None:
+			return np.arange(self.__dots_total)
+		dot_indexes = np.asarray(dot_indexes, dtype=np.intp)
+		if dot_indexes.size != 0 and (dot_indexes.min() < 0 or dot_indexes.max() >= self.__dots_total):
+			raise IndexError(f"Dot index out of range for {self.__dots_total} dots.")
+		return dot_indexes
+
+	def __get_segments(self, *, dot_indexes: np.ndarray, time_index) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+		calculated_time_indexes = (np.asarray(time_index, dtype=np.float64) + self.__time_index_offsets[dot_indexes])[:, np.newaxis]
+		end_time_indexes = self.__acceleration_delta_end_time_indexes[dot_indexes][:, np.newaxis]
+		is_acceleration_delta_active = self.__is_acceleration_delta_active[dot_indexes][:, np.newaxis]
+		is_before_end_time_index = calculated_time_indexes < end_time_indexes
+		is_within_acceleration_delta = is_acceleration_delta_active & is_before_end_time_index
+		is_after_acceleration_delta = is_acceleration_delta_active & ~is_before_end_time_index
+		return calculated_time_indexes, end_time_indexes, is_within_acceleration_delta, is_after_acceleration_delta
+
+	def get_positions(self, *, time_index, dot_indexes: np.ndarray = None) -> np.ndarray:
+		dot_indexes = self.__get_dot_indexes(
+			dot_indexes=dot_indexes
+		)
+		t, end_t, is_within, is_after = self.__get_segments(
+			dot_indexes=dot_indexes,
+			time_index=time_index
+		)
+		accelerations = self.__accelerations[dot_indexes]
+		acceleration_deltas = self.__acceleration_deltas[dot_indexes]
+		positions = self.__positions[dot_indexes] + self.__velocities[dot_indexes] * t
+		positions = positions + np.where(is_after, (accelerations * end_t ** 2) / 2.0, (accelerations * t ** 2) / 2.0)
+		positions = np.where(is_within, positions + (acceleration_deltas * t ** 3) / 6.0, positions)
+		positions = np.where(is_after, positions + (self.__acceleration_delta_end_time_index_accelerations[dot_indexes] * (t - end_t) ** 2) / 2.0 + (acceleration_deltas * end_t ** 3) / 6.0, positions)
+		return positions
+
+	def get_velocities(self, *, time_index, dot_indexes: np.ndarray = None) -> np.ndarray:
+		dot_indexes = self.__get_dot_indexes(
+			dot_indexes=dot_indexes
+		)
+		t, end_t, is_within, is_after = self.__get_segments(
+			dot_indexes=dot_indexes,
+			time_index=time_index
+		)
+		accelerations = self.__accelerations[dot_indexes]
+		acceleration_deltas = self.__acceleration_deltas[dot_indexes]
+		velocities = self.__velocities[dot_indexes] + np.where(is_after, accelerations * end_t, accelerations * t)
+		velocities = np.where(is_within, velocities + (acceleration_deltas * t ** 2) / 2.0, velocities)
+		velocities = np.where(is_after, velocities + self.__acceleration_delta_end_time_index_accelerations[dot_indexes] * (t - end_t) + (acceleration_deltas * end_t ** 2) / 2.0, velocities)
+		return velocities
+
+	def get_accelerations(self, *, time_index, dot_indexes: np.ndarray = None) -> np.ndarray:
+		dot_indexes = self.__get_dot_indexes(
+			dot_indexes=dot_indexes
+		)
+		t, end_t, is_within, is_after = self.__get_segments(
+			dot_indexes=dot_indexes,
+			time_index=time_index
+		)
+		accelerations = self.__accelerations[dot_indexes]
+		acceleration_deltas = self.__acceleration_deltas[dot_indexes]
+		accelerations = np.where(is_within, accelerations + acceleration_deltas * t, accelerations)
+		accelerations = np.where(is_after, self.__acceleration_delta_end_time_index_accelerations[dot_indexes] + acceleration_deltas * end_t, accelerations)
+		return accelerations
+
+	def get_time_index_offsets(self, *, dot_indexes: np.ndarray = None) -> np.ndarray:
+		dot_indexes = self.__get_dot_indexes(
+			dot_indexes=dot_indexes
+		)
+		return self.__time_index_offsets[dot_indexes].copy()
+
+	def get_acceleration_delta_end_time_indexes(self, *, dot_indexes: np.ndarray = None) -> np.ndarray:
+		dot_indexes = self.__get_dot_indexes(
+			dot_indexes=dot_indexes
+		)
+		return np.where(self.__is_acceleration_delta_active[dot_indexes], self.__acceleration_delta_end_time_indexes[dot_indexes] - self.__time_index_offsets[dot_indexes], np.inf)
+
+	def get_position_polynomial_coefficients(self, *, dot_indexes: np.ndarray = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+		# coefficients are ascending powers of the local time index (time_index + time index offset)
+		# the first piece applies before the end time index and the second piece from it onwards
+		dot_indexes = self.__get_dot_indexes(
+			dot_indexes=dot_indexes
+		)
+		positions = self.__positions[dot_indexes]
+		velocities = self.__velocities[dot_indexes]
+		accelerations = self.__accelerations[dot_indexes]
+		is_acceleration_delta_active = self.__is_acceleration_delta_active[dot_indexes]
+		acceleration_deltas = self.__acceleration_deltas[dot_indexes]
+		end_time_index_accelerations = self.__acceleration_delta_end_time_index_accelerations[dot_indexes]
+		end_t = self.__acceleration_delta_end_time_indexes[dot_indexes][:, np.newaxis]
+
+		first_piece_coefficients = np.stack((positions, velocities, accelerations / 2.0, acceleration_deltas / 6.0), axis=-1)
+		second_piece_coefficients = np.stack((
+			positions + (accelerations * end_t ** 2) / 2.0 + (end_time_index_accelerations * end_t ** 2) / 2.0 + (acceleration_deltas * end_t ** 3) / 6.0,
+			velocities - end_time_index_accelerations * end_t,
+			end_time_index_accelerations / 2.0,
+			np.zeros_like(positions)
+		), axis=-1)
+		end_time_indexes = np.where(is_acceleration_delta_active, self.__acceleration_delta_end_time_indexes[dot_indexes], np.inf)
+		return first_piece_coefficients, second_piece_coefficients, end_time_indexes
+
+	def __rebase(self, *, dot_indexes: np.ndarray, time_index, positions: np.ndarray, velocities: np.ndarray, accelerations: np.ndarray):
+		time_indexes = np.broadcast_to(np.asarray(time_index, dtype=np.float64), dot_indexes.shape)
+		calculated_time_indexes = time_indexes + self.__time_index_offsets[dot_indexes]
+		self.__positions[dot_indexes] = positions
+		self.__velocities[dot_indexes] = velocities
+		self.__accelerations[dot_indexes] = accelerations
+		is_acceleration_delta_active = self.__is_acceleration_delta_active[dot_indexes]
+		end_time_indexes = np.where(is_acceleration_delta_active, self.__acceleration_delta_end_time_indexes[dot_indexes] - calculated_time_indexes, 0.0)
+		is_acceleration_delta_active = is_acceleration_delta_active & (end_time_indexes > 0)
+		self.__is_acceleration_delta_active[dot_indexes] = is_acceleration_delta_active
+		self.__acceleration_delta_end_time_indexes[dot_indexes] = np.where(is_acceleration_delta_active, end_time_indexes, 0.0)
+		self.__acceleration_deltas[dot_indexes] = np.where(is_acceleration_delta_active[:, np.newaxis], self.__acceleration_deltas[dot_indexes], 0.0)
+		self.__acceleration_delta_end_time_index_accelerations[dot_indexes] = np.where(is_acceleration_delta_active[:, np.newaxis], self.__acceleration_delta_end_time_index_accelerations[dot_indexes], 0.0)
+		self.__time_index_offsets[dot_indexes] = -time_indexes
+
+	def reflect_dimension(self, *, dot_indexes: np.ndarray, dimension_index: int, time_index):
+		dot_indexes = self.__get_dot_indexes(
+			dot_indexes=dot_indexes
+		)
+		positions = self.get_positions(
+			time_index=time_index,
+			dot_indexes=dot_indexes
+		)
+		velocities = self.get_velocities(
+			time_index=time_index,
+			dot_indexes=dot_indexes
+		)
+		accelerations = self.get_accelerations(
+			time_index=time_index,
+			dot_indexes=dot_indexes
+		)
+		velocities[:, dimension_index] = -velocities[:, dimension_index]
+		self.__rebase(
+			dot_indexes=dot_indexes,
+			time_index=time_index,
+			positions=positions,
+			velocities=velocities,
+			accelerations=accelerations
+		)
+
+	def bounce(self, *, dot_indexes: np.ndarray, time_index):
+		self.reflect_dimension(
+			dot_indexes=dot_indexes,
+			dimension_index=1,
+			time_index=time_index
+		)
+
+	def reflect(self, *, dot_indexes: np.ndarray, time_index):
+		self.reflect_dimension(
+			dot_indexes=dot_indexes,
+			dimension_index=0,
+			time_index=time_index
+		)
+
+	def set_state(self, *, dot_indexes: np.ndarray, positions: np.ndarray, velocities: np.ndarray, accelerations: np.ndarray, time_index):
+		dot_indexes = self.__get_dot_indexes(
+			dot_indexes=dot_indexes
+		)
+		self.__rebase(
+			dot_indexes=dot_indexes,
+			time_index=time_index,
+			positions=positions,
+			velocities=velocities,
+			accelerations=accelerations
+		)
+
+	def set_acceleration_delta(self, *, dot_indexes: np.ndarray, time_index, acceleration_deltas: np.ndarray, end_time_index):
+		dot_indexes = self.__get_dot_indexes(
+			dot_indexes=dot_indexes
+		)
+		positions = self.get_positions(
+			time_index=time_index,
+			dot_indexes=dot_indexes
+		)
+		velocities = self.get_velocities(
+			time_index=time_index,
+			dot_indexes=dot_indexes
+		)
+		accelerations = self.get_accelerations(
+			time_index=time_index,
+			dot_indexes=dot_indexes
+		)
+		self.__positions[dot_indexes] = positions
+		self.__velocities[dot_indexes] = velocities
+		self.__accelerations[dot_indexes] = accelerations
+		self.__time_index_offsets[dot_indexes] = -np.broadcast_to(np.asarray(time_index, dtype=np.float64), dot_indexes.shape)
+		self.__is_acceleration_delta_active[dot_indexes] = True
+		self.__acceleration_deltas[dot_indexes] = acceleration_deltas
+		self.__acceleration_delta_end_time_indexes[dot_indexes] = end_time_index
+		self.__acceleration_delta_end_time_index_accelerations[dot_indexes] = accelerations
+
+	def end_acceleration_deltas(self, *, dot_indexes: np.ndarray):
+		# replaces each active acceleration delta by its trailing quadratic piece rebased at the end time index, leaving positions unchanged
+		dot_indexes = self.__get_dot_indexes(
+			dot_indexes=dot_indexes
+		)
+		dot_indexes = dot_indexes[self.__is_acceleration_delta_active[dot_indexes]]
+		_, second_piece_coefficients, end_time_indexes = self.get_position_polynomial_coefficients(
+			dot_indexes=dot_indexes
+		)
+		end_t = end_time_indexes[:, np.newaxis]
+		c0, c1, c2 = second_piece_coefficients[..., 0], second_piece_coefficients[..., 1], second_piece_coefficients[..., 2]
+		self.__positions[dot_indexes] = c0 + end_t * (c1 + end_t * c2)
+		self.__velocities[dot_indexes] = c1 + 2.0 * c2 * end_t
+		self.__accelerations[dot_indexes] = 2.0 * c2
+		self.__time_index_offsets[dot_indexes] = -(end_time_indexes - self.__time_index_offsets[dot_indexes])
+		self.__is_acceleration_delta_active[dot_indexes] = False
+		self.__acceleration_deltas[dot_indexes] = 0
+		self.__acceleration_delta_end_time_indexes[dot_indexes] = 0
+		self.__acceleration_delta_end_time_index_accelerations[dot_indexes] = 0
+
+	def merge(self, *, dot_indexes: np.ndarray, destination_dot_indexes: np.ndarray, current_time_index: float, merge_time_index_offset: float):
+		dot_indexes = self.__get_dot_indexes(
+			dot_indexes=dot_indexes
+		)
+		destination_dot_indexes = self.__get_dot_indexes(
+			dot_indexes=destination_dot_indexes
+		)
+		self_positions = self.get_positions(
+			time_index=current_time_index,
+			dot_indexes=dot_indexes
+		)
+		self_velocities = self.get_velocities(
+			time_index=current_time_index,
+			dot_indexes=dot_indexes
+		)
+		destination_positions = self.get_positions(
+			time_index=current_time_index + merge_time_index_offset,
+			dot_indexes=destination_dot_indexes
+		)
+		destination_velocities = self.get_velocities(
+			time_index=current_time_index + merge_time_index_offset,
+			dot_indexes=destination_dot_indexes
+		)
+		destination_accelerations = self.get_accelerations(
+			time_index=current_time_index + merge_time_index_offset,
+			dot_indexes=destination_dot_indexes
+		)
+
+		acceleration_deltas = (-12 * destination_positions + 6 * destination_velocities * merge_time_index_offset + 12 * self_positions + 6 * self_velocities * merge_time_index_offset) / (merge_time_index_offset**3)
+		accelerations = (destination_velocities - self_velocities) / merge_time_index_offset - 0.5 * acceleration_deltas * merge_time_index_offset
+
+		self.__positions[dot_indexes] = self_positions
+		self.__velocities[dot_indexes] = self_velocities
+		self.__accelerations[dot_indexes] = accelerations
+		self.__is_acceleration_delta_active[dot_indexes] = True
+		self.__acceleration_deltas[dot_indexes] = acceleration_deltas
+		self.__acceleration_delta_end_time_indexes[dot_indexes] = merge_time_index_offset
+		self.__acceleration_delta_end_time_index_accelerations[dot_indexes] = destination_accelerations
+		self.__time_index_offsets[dot_indexes] = -current_time_index
+
+
+def get_polynomial_real_roots(*, coefficients: np.ndarray, newton_iterations_total: int = 2) -> np.ndarray:
+	# coefficients are ascending powers of shape (n, 4) and the real roots are returned as (n, 3) padded with nan
+	coefficients = np.asarray(coefficients, dtype=np.float64)
+	polynomials_total = coefficients.shape[0]
+	roots = np.full((polynomials_total, 3), np.nan)
+	c0, c1, c2, c3 = coefficients[:, 0], coefficients[:, 1], coefficients[:, 2], coefficients[:, 3]
+
+	is_cubic = c3 != 0
+	if is_cubic.any():
+		monic_coefficients = coefficients[is_cubic, :3] / c3[is_cubic, np.newaxis]
+		companion_matrices = np.zeros((monic_coefficients.shape[0], 3, 3))
+		companion_matrices[:, 0, :] = -monic_coefficients[:, ::-1]
+		companion_matrices[:, 1, 0] = 1.0
+		companion_matrices[:, 2, 1] = 1.0
+		eigenvalues = np.linalg.eigvals(companion_matrices)
+		is_real = np.abs(eigenvalues.imag) <= 1e-7 * (1.0 + np.abs(eigenvalues.real))
+		roots[is_cubic] = np.where(is_real, eigenvalues.real, np.nan)
+
+	is_quadratic = ~is_cubic & (c2 != 0)
+	if is_quadratic.any():
+		a, b, c = c2[is_quadratic], c1[is_quadratic], c0[is_quadratic]
+		discriminants = b * b - 4.0 * a * c
+		is_real = discriminants >= 0
+		square_roots = np.sqrt(np.where(is_real, discriminants, 0.0))
+		q = -0.5 * (b + np.copysign(square_roots, b))
+		first_roots = q / a
+		with np.errstate(divide="ignore", invalid="ignore"):
+			second_roots = np.where(q != 0, c / q, first_roots)
+		roots[is_quadratic, 0] = np.where(is_real, first_roots, np.nan)
+		roots[is_quadratic, 1] = np.where(is_real, second_roots, np.nan)
+
+	is_linear = ~is_cubic & ~is_quadratic & (c1 != 0)
+	if is_linear.any():
+		roots[is_linear, 0] = -c0[is_linear] / c1[is_linear]
+
+	for newton_iteration_index in range(newton_iterations_total):
+		values = c0[:, np.newaxis] + roots * (c1[:, np.newaxis] + roots * (c2[:, np.newaxis] + roots * c3[:, np.newaxis]))
+		derivatives = c1[:, np.newaxis] + roots * (2.0 * c2[:, np.newaxis] + roots * 3.0 * c3[:, np.newaxis])
+		with np.errstate(divide="ignore", invalid="ignore"):
+			roots = np.where(derivatives != 0, roots - values / derivatives, roots)
+
+	return roots
+
+
+class DotSystemBoundaryCollisionEngine():
+
+	def __init__(self, *, dot_system: DotSystem, minimum_position: Tuple[float, ...], maximum_position: Tuple[float, ...], maximum_collision_iterations_total: int = 64, start_tolerance: float = 1e-9):
+
+		if len(minimum_position) != dot_system.get_dimensions_total() or len(maximum_position) != dot_system.get_dimensions_total():
+			raise Exception(f"Bounds must have {dot_system.get_dimensions_total()} dimensions.")
+
+		self.__dot_system = dot_system
+		self.__minimum_position = np.asarray(minimum_position, dtype=np.float64)
+		self.__maximum_position = np.asarray(maximum_position, dtype=np.float64)
+		self.__maximum_collision_iterations_total = maximum_collision_iterations_total
+		self.__start_tolerance = start_tolerance
+
+	def get_next_collisions(self, *, time_index, dot_indexes: np.ndarray = None) -> Tuple[np.ndarray, np.ndarray]:
+		# returns the earliest time index at or after time_index at which each dot crosses a bound while moving outward, or inf, and the dimension crossed
+		if dot_indexes is None:
+			dot_indexes = np.arange(self.__dot_system.get_dots_total())
+		dot_indexes = np.asarray(dot_indexes, dtype=np.intp)
+		dots_total = dot_indexes.shape[0]
+		dimensions_total = self.__dot_system.get_dimensions_total()
+
+		first_piece_coefficients, second_piece_coefficients, end_time_indexes = self.__dot_system.get_position_polynomial_coefficients(
+			dot_indexes=dot_indexes
+		)
+		time_index_offsets = self.__dot_system.get_time_index_offsets(
+			dot_indexes=dot_indexes
+		)
+		start_time_indexes = np.broadcast_to(np.asarray(time_index, dtype=np.float64), (dots_total, )) + time_index_offsets
+
+		# shape (dots, pieces, dimensions, bounds, coefficients)
+		piece_coefficients = np.stack((first_piece_coefficients, second_piece_coefficients), axis=1)
+		coefficients = np.repeat(piece_coefficients[:, :, :, np.newaxis, :], 2, axis=3)
+		coefficients[:, :, :, 0, 0] -= self.__minimum_position
+		coefficients[:, :, :, 1, 0] -= self.__maximum_position
+
+		roots = get_polynomial_real_roots(
+			coefficients=coefficients.reshape(-1, 4)
+		).reshape(dots_total, 2, dimensions_total, 2, 3)
+
+		c1 = coefficients[..., 1, np.newaxis]
+		c2 = coefficients[..., 2, np.newaxis]
+		c3 = coefficients[..., 3, np.newaxis]
+		derivatives = c1 + roots * (2.0 * c2 + roots * 3.0 * c3)
+		outward_directions = np.array([-1.0, 1.0])[np.newaxis, np.newaxis, np.newaxis, :, np.newaxis]
+
+		start_t = start_time_indexes[:, np.newaxis, np.newaxis, np.newaxis, np.newaxis]
+		end_t = end_time_indexes[:, np.newaxis, np.newaxis, np.newaxis, np.newaxis]
+		with np.errstate(invalid="ignore"):
+			is_within_piece = np.concatenate((
+				roots[:, :1] < end_t,
+				roots[:, 1:] >= end_t
+			), axis=1)
+			# a root at the start is kept so that the other axis of a corner is still reflected after the first one, while the outward test skips the axis that was just reflected
+			is_valid = is_within_piece & (roots >= start_t - self.__start_tolerance * (1.0 + np.abs(start_t))) & (derivatives * outward_directions > 0)
+		candidate_roots = np.where(is_valid, np.maximum(roots, start_t), np.inf)
+
+		# collapse the root and bound axes, then the piece axis, keeping the dimension for the earliest root
+		candidate_roots = candidate_roots.min(axis=(1, 3, 4))
+		dimension_indexes = np.argmin(candidate_roots, axis=1)
+		collision_time_indexes = candidate_roots[np.arange(dots_total), dimension_indexes] - time_index_offsets
+		dimension_indexes = np.where(np.isfinite(collision_time_indexes), dimension_indexes, -1)
+		return collision_time_indexes, dimension_indexes
+
+	def advance(self, *, from_time_index: float, to_time_index: float) -> int:
+		dots_total = self.__dot_system.get_dots_total()
+		current_time_indexes = np.full((dots_total, ), from_time_index, dtype=np.float64)
+		dot_indexes = np.arange(dots_total)
+		collisions_total = 0
+		for collision_iteration_index in range(self.__maximum_collision_iterations_total):
+			if dot_indexes.shape[0] == 0:
+				break
+			collision_time_indexes, dimension_indexes = self.get_next_collisions(
+				time_index=current_time_indexes[dot_indexes],
+				dot_indexes=dot_indexes
+			)
+			is_due = collision_time_indexes <= to_time_index
+			dot_indexes = dot_indexes[is_due]
+			collision_time_indexes = collision_time_indexes[is_due]
+			dimension_indexes = dimension_indexes[is_due]
+			for dimension_index in np.unique(dimension_indexes):
+				is_dimension = dimension_indexes == dimension_index
+				self.__dot_system.reflect_dimension(
+					dot_indexes=dot_indexes[is_dimension],
+					dimension_index=int(dimension_index),
+					time_index=collision_time_indexes[is_dimension]
+				)
+			current_time_indexes[dot_indexes] = collision_time_indexes
+			collisions_total += dot_indexes.shape[0]
+		return collisions_total
+
+
+class DotSystemEventTypeEnum(Enum):
+	BoundaryCollision = "boundary_collision"
+	AccelerationDeltaEnd = "acceleration_delta_end"
+
+
+class DotSystemEventDrivenSimulator():
+
+	def __init__(self, *, dot_system: DotSystem, collision_engine: DotSystemBoundaryCollisionEngine, time_index: float = 0.0):
+
+		self.__dot_system = dot_system
+		self.__collision_engine = collision_engine
+		self.__time_index = time_index
+
+		self.__events = []  # type: List[Tuple[float, int, int, DotSystemEventTypeEnum, int]]
+		self.__version_per_dot_index = []  # type: List[int]
+		self.__processed_events_total = 0
+		self.__stale_events_total = 0
+
+		self.invalidate_dots(
+			dot_indexes=np.arange(self.__dot_system.get_dots_total())
+		)
+
+	def get_time_index(self) -> float:
+		return self.__time_index
+
+	def get_processed_events_total(self) -> int:
+		return self.__processed_events_total
+
+	def get_stale_events_total(self) -> int:
+		return self.__stale_events_total
+
+	def get_pending_events_total(self) -> int:
+		return len(self.__events)
+
+	def get_next_event_time_index(self) -> float:
+		while self.__events and self.__events[0][2] != self.__version_per_dot_index[self.__events[0][1]]:
+			heapq.heappop(self.__events)
+			self.__stale_events_total += 1
+		if not self.__events:
+			return np.inf
+		return self.__events[0][0]
+
+	def add_dot(self, *, position: Tuple[float, ...], velocity: Tuple[float, ...], acceleration: Tuple[float, ...]) -> int:
+		# the dot starts at the current time index of the simulator
+		dot_index = self.__dot_system.add_dot(
+			position=position,
+			velocity=velocity,
+			acceleration=acceleration
+		)
+		self.__dot_system.set_state(
+			dot_indexes=[dot_index],
+			positions=[position],
+			velocities=[velocity],
+			accelerations=[acceleration],
+			time_index=self.__time_index
+		)
+		self.invalidate_dots(
+			dot_indexes=[dot_index]
+		)
+		return dot_index
+
+	def invalidate_dots(self, *, dot_indexes: np.ndarray):
+		# must be called after the trajectories of these dots are changed directly on the dot system
+		dot_indexes = np.asarray(dot_indexes, dtype=np.intp)
+		self.__schedule_dots(
+			dot_indexes=dot_indexes,
+			time_indexes=np.full(dot_indexes.shape, self.__time_index, dtype=np.float64)
+		)
+
+	def __schedule_dots(self, *, dot_indexes: np.ndarray, time_indexes: np.ndarray):
+		while len(self.__version_per_dot_index) < self.__dot_system.get_dots_total():
+			self.__version_per_dot_index.append(0)
+		if dot_indexes.shape[0] == 0:
+			return
+		collision_time_indexes, dimension_indexes = self.__collision_engine.get_next_collisions(
+			time_index=time_indexes,
+			dot_indexes=dot_indexes
+		)
+		end_time_indexes = np.maximum(self.__dot_system.get_acceleration_delta_end_time_indexes(
+			dot_indexes=dot_indexes
+		), time_indexes)
+		for dot_index, collision_time_index, dimension_index, end_time_index in zip(dot_indexes.tolist(), collision_time_indexes.tolist(), dimension_indexes.tolist(), end_time_indexes.tolist()):
+			version = self.__version_per_dot_index[dot_index] + 1
+			self.__version_per_dot_index[dot_index] = version
+			if collision_time_index <= end_time_index:
+				if collision_time_index != np.inf:
+					heapq.heappush(self.__events, (collision_time_index, dot_index, version, DotSystemEventTypeEnum.BoundaryCollision, dimension_index))
+			else:
+				heapq.heappush(self.__events, (end_time_index, dot_index, version, DotSystemEventTypeEnum.AccelerationDeltaEnd, -1))
+
+	def advance(self, *, time_index: float) -> int:
+		if time_index < self.__time_index:
+			raise Exception(f"Cannot advance backwards from time index {self.__time_index} to {time_index}.")
+		processed_events_total = 0
+		while self.__events and self.__events[0][0] <= time_index:
+			# dots are independent, so every due event can be applied in one vectorized round before rescheduling
+			due_events = []
+			while self.__events and self.__events[0][0] <= time_index:
+				event = heapq.heappop(self.__events)
+				if event[2] != self.__version_per_dot_index[event[1]]:
+					self.__stale_events_total += 1
+				else:
+					due_events.append(event)
+			if not due_events:
+				break
+			event_time_indexes = np.array([event[0] for event in due_events], dtype=np.float64)
+			dot_indexes = np.array([event[1] for event in due_events], dtype=np.intp)
+			is_collision = np.array([event[3] == DotSystemEventTypeEnum.BoundaryCollision for event in due_events], dtype=np.bool_)
+			dimension_indexes = np.array([event[4] for event in due_events], dtype=np.intp)
+			for dimension_index in np.unique(dimension_indexes[is_collision]):
+				is_dimension = is_collision & (dimension_indexes == dimension_index)
+				self.__dot_system.reflect_dimension(
+					dot_indexes=dot_indexes[is_dimension],
+					dimension_index=int(dimension_index),
+					time_index=event_time_indexes[is_dimension]
+				)
+			self.__dot_system.end_acceleration_deltas(
+				dot_indexes=dot_indexes[~is_collision]
+			)
+			self.__schedule_dots(
+				dot_indexes=dot_indexes,
+				time_indexes=event_time_indexes
+			)
+			processed_events_total += len(due_events)
+		self.__time_index = time_index
+		self.__processed_events_total += processed_events_total
+		return processed_events_total
+
+	def get_positions(self, *, time_index: float, dot_indexes: np.ndarray = None) -> np.ndarray:
+		self.advance(
+			time_index=time_index
+		)
+		return self.__dot_system.get_positions(
+			time_index=time_index,
+			dot_indexes=dot_indexes
+		)
+
+	def get_velocities(self, *, time_index: float, dot_indexes: np.ndarray = None) -> np.ndarray:
+		self.advance(
+			time_index=time_index
+		)
+		return self.__dot_system.get_velocities(
+			time_index=time_index,
+			dot_indexes=dot_indexes
+		)
@@ -0,0 +1,407 @@
+from __future__ import annotations
+from typing import List, Tuple, Dict, Set, Callable, Type, Iterator
+import itertools
+import numpy as np
+
+
+class UniformGridSpatialIndex():
+
+	def __init__(self, *, dimensions_total: int, cell_size: float, initial_capacity: int = 16):
+
+		if cell_size <= 0:
+			raise Exception(f"Cell size must be positive, not {cell_size}.")
+
+		self.__dimensions_total = dimensions_total
+		self.__cell_size = float(cell_size)
+
+		self.__entities_total = 0
+		self.__positions = np.zeros((initial_capacity, dimensions_total), dtype=np.float64)
+		self.__cells = np.zeros((initial_capacity, dimensions_total), dtype=np.int64)
+		self.__is_present = np.zeros((initial_capacity, ), dtype=np.bool_)
+		self.__entity_indexes_per_cell = {}  # type: Dict[Tuple[int, ...], Set[int]]
+
+		# only grows while any entity is present, so it bounds the occupied cells without scanning the entities
+		self.__minimum_occupied_cell = None  # type: np.ndarray
+		self.__maximum_occupied_cell = None  # type: np.ndarray
+
+		# every entity is listed at most once between pops, so the moved entities never take more memory than the positions
+		self.__is_moved = np.zeros((initial_capacity, ), dtype=np.bool_)
+		self.__moved_entity_indexes = []  # type: List[np.ndarray]
+
+	def __ensure_capacity(self, *, entity_index: int):
+		capacity = self.__positions.shape[0]
+		if entity_index >= capacity:
+			next_capacity = max(entity_index + 1, capacity * 2)
+
+			def grow(array: np.ndarray) -> np.ndarray:
+				grown_array = np.zeros((next_capacity, ) + array.shape[1:], dtype=array.dtype)
+				grown_array[:capacity] = array
+				return grown_array
+
+			self.__positions = grow(self.__positions)
+			self.__cells = grow(self.__cells)
+			self.__is_present = grow(self.__is_present)
+			self.__is_moved = grow(self.__is_moved)
+
+	def __get_cells(self, *, positions: np.ndarray) -> np.ndarray:
+		return np.floor(positions / self.__cell_size).astype(np.int64)
+
+	def __add_moved_entity_indexes(self, *, entity_indexes: np.ndarray):
+		entity_indexes = entity_indexes[~self.__is_moved[entity_indexes]]
+		if entity_indexes.shape[0] != 0:
+			self.__is_moved[entity_indexes] = True
+			self.__moved_entity_indexes.append(entity_indexes)
+
+	def get_cell_size(self) -> float:
+		return self.__cell_size
+
+	def get_entities_total(self) -> int:
+		return self.__entities_total
+
+	def get_occupied_cells_total(self) -> int:
+		return len(self.__entity_indexes_per_cell)
+
+	def get_positions(self, *, entity_indexes: np.ndarray) -> np.ndarray:
+		return self.__positions[np.asarray(entity_indexes, dtype=np.intp)].copy()
+
+	def is_present(self, *, entity_indexes: np.ndarray) -> np.ndarray:
+		entity_indexes = np.asarray(entity_indexes, dtype=np.intp)
+		is_present = np.zeros(entity_indexes.shape, dtype=np.bool_)
+		is_within_capacity = entity_indexes < self.__is_present.shape[0]
+		is_present[is_within_capacity] = self.__is_present[entity_indexes[is_within_capacity]]
+		return is_present
+
+	def pop_moved_entity_indexes(self) -> np.ndarray:
+		# returns the sorted entities that were added, moved or removed since the previous pop, so the index should have a single consumer of this
+		if not self.__moved_entity_indexes:
+			return np.zeros((0, ), dtype=np.intp)
+		moved_entity_indexes = np.unique(np.concatenate(self.__moved_entity_indexes))
+		self.__moved_entity_indexes.clear()
+		self.__is_moved[moved_entity_indexes] = False
+		return moved_entity_indexes
+
+	def set_positions(self, *, entity_indexes: np.ndarray, positions: np.ndarray):
+		# inserts new entities and moves existing ones, only touching the cell buckets of entities that changed cell
+		entity_indexes = np.asarray(entity_indexes, dtype=np.intp)
+		positions = np.asarray(positions, dtype=np.float64).reshape(-1, self.__dimensions_total)
+		if entity_indexes.shape[0] == 0:
+			return
+		self.__ensure_capacity(
+			entity_index=int(entity_indexes.max())
+		)
+		cells = self.__get_cells(
+			positions=positions
+		)
+		is_present = self.__is_present[entity_indexes]
+		is_changed = ~is_present | (cells != self.__cells[entity_indexes]).any(axis=1)
+		for entity_index, was_present, previous_cell, cell in zip(entity_indexes[is_changed].tolist(), is_present[is_changed].tolist(), self.__cells[entity_indexes[is_changed]].tolist(), cells[is_changed].tolist()):
+			if was_present:
+				previous_cell_key = tuple(previous_cell)
+				previous_cell_entity_indexes = self.__entity_indexes_per_cell[previous_cell_key]
+				previous_cell_entity_indexes.discard(entity_index)
+				if not previous_cell_entity_indexes:
+					del self.__entity_indexes_per_cell[previous_cell_key]
+			else:
+				self.__entities_total += 1
+			cell_key = tuple(cell)
+			cell_entity_indexes = self.__entity_indexes_per_cell.get(cell_key)
+			if cell_entity_indexes is None:
+				self.__entity_indexes_per_cell[cell_key] = {entity_index}
+			else:
+				cell_entity_indexes.add(entity_index)
+		self.__positions[entity_indexes] = positions
+		self.__cells[entity_indexes] = cells
+		self.__is_present[entity_indexes] = True
+		if self.__minimum_occupied_cell is None:
+			self.__minimum_occupied_cell = cells.min(axis=0)
+			self.__maximum_occupied_cell = cells.max(axis=0)
+		else:
+			self.__minimum_occupied_cell = np.minimum(self.__minimum_occupied_cell, cells.min(axis=0))
+			self.__maximum_occupied_cell = np.maximum(self.__maximum_occupied_cell, cells.max(axis=0))
+		self.__add_moved_entity_indexes(
+			entity_indexes=entity_indexes
+		)
+
+	def remove_entities(self, *, entity_indexes: np.ndarray):
+		entity_indexes = np.asarray(entity_indexes, dtype=np.intp)
+		entity_indexes = entity_indexes[entity_indexes < self.__is_present.shape[0]]
+		entity_indexes = np.unique(entity_indexes[self.__is_present[entity_indexes]])
+		for entity_index, cell in zip(entity_indexes.tolist(), self.__cells[entity_indexes].tolist()):
+			cell_key = tuple(cell)
+			cell_entity_indexes = self.__entity_indexes_per_cell[cell_key]
+			cell_entity_indexes.discard(entity_index)
+			if not cell_entity_indexes:
+				del self.__entity_indexes_per_cell[cell_key]
+		self.__is_present[entity_indexes] = False
+		self.__entities_total -= entity_indexes.shape[0]
+		if self.__entities_total == 0:
+			self.__minimum_occupied_cell = None
+			self.__maximum_occupied_cell = None
+		self.__add_moved_entity_indexes(
+			entity_indexes=entity_indexes
+		)
+
+	def __get_present_entity_indexes(self) -> np.ndarray:
+		return np.flatnonzero(self.__is_present)
+
+	def __get_entity_indexes_in_cells(self, *, minimum_cell: np.ndarray, maximum_cell: np.ndarray) -> np.ndarray:
+		cells_total = int(np.prod(maximum_cell - minimum_cell + 1))
+		if cells_total > len(self.__entity_indexes_per_cell):
+			# the box covers more cells than are occupied, so walk the occupied cells instead
+			entity_indexes = self.__get_present_entity_indexes()
+			cells = self.__cells[entity_indexes]
+			return entity_indexes[((cells >= minimum_cell) & (cells <= maximum_cell)).all(axis=1)]
+		entity_indexes = []  # type: List[int]
+		for cell_key in itertools.product(*[range(minimum, maximum + 1) for minimum, maximum in zip(minimum_cell.tolist(), maximum_cell.tolist())]):
+			cell_entity_indexes = self.__entity_indexes_per_cell.get(cell_key)
+			if cell_entity_indexes is not None:
+				entity_indexes.extend(cell_entity_indexes)
+		return np.array(entity_indexes, dtype=np.intp)
+
+	def query_box(self, *, minimum_position: Tuple[float, ...], maximum_position: Tuple[float, ...]) -> np.ndarray:
+		minimum_position = np.asarray(minimum_position, dtype=np.float64)
+		maximum_position = np.asarray(maximum_position, dtype=np.float64)
+		entity_indexes = self.__get_entity_indexes_in_cells(
+			minimum_cell=self.__get_cells(
+				positions=minimum_position
+			),
+			maximum_cell=self.__get_cells(
+				positions=maximum_position
+			)
+		)
+		positions = self.__positions[entity_indexes]
+		return np.sort(entity_indexes[((positions >= minimum_position) & (positions <= maximum_position)).all(axis=1)])
+
+	def query_radius(self, *, position: Tuple[float, ...], radius: float) -> np.ndarray:
+		position = np.asarray(position, dtype=np.float64)
+		entity_indexes = self.__get_entity_indexes_in_cells(
+			minimum_cell=self.__get_cells(
+				positions=position - radius
+			),
+			maximum_cell=self.__get_cells(
+				positions=position + radius
+			)
+		)
+		distances_squared = ((self.__positions[entity_indexes] - position) ** 2).sum(axis=1)
+		return np.sort(entity_indexes[distances_squared <= radius * radius])
+
+	def __get_ring_cell_keys(self, *, center_cell: List[int], ring_index: int) -> Iterator[Tuple[int, ...]]:
+		# yields each cell of the ring's shell once, skipping cells outside the occupied extent
+		if ring_index == 0:
+			yield tuple(center_cell)
+			return
+		minimum_cell = self.__minimum_occupied_cell.tolist()
+		maximum_cell = self.__maximum_occupied_cell.tolist()
+		for face_dimension_index in range(self.__dimensions_total):
+			for face_cell in (center_cell[face_dimension_index] - ring_index, center_cell[face_dimension_index] + ring_index):
+				if face_cell < minimum_cell[face_dimension_index] or face_cell > maximum_cell[face_dimension_index]:
+					continue
+				cell_ranges = []  # type: List[range]
+				for dimension_index in range(self.__dimensions_total):
+					if dimension_index == face_dimension_index:
+						cell_ranges.append(range(face_cell, face_cell + 1))
+					else:
+						# the faces of earlier dimensions already hold their edges
+						edge_offset = ring_index - 1 if dimension_index < face_dimension_index else ring_index
+						cell_ranges.append(range(max(center_cell[dimension_index] - edge_offset, minimum_cell[dimension_index]), min(center_cell[dimension_index] + edge_offset, maximum_cell[dimension_index]) + 1))
+				yield from itertools.product(*cell_ranges)
+
+	def query_nearest(self, *, position: Tuple[float, ...], neighbors_total: int = 1) -> np.ndarray:
+		# searches rings of cells outwards until no unsearched cell can hold anything closer than the current candidates
+		position = np.asarray(position, dtype=np.float64)
+		neighbors_total = min(neighbors_total, self.__entities_total)
+		if neighbors_total == 0:
+			return np.zeros((0, ), dtype=np.intp)
+		center_cell = self.__get_cells(
+			positions=position
+		)
+		maximum_ring_index = int(max(np.abs(self.__minimum_occupied_cell - center_cell).max(), np.abs(self.__maximum_occupied_cell - center_cell).max()))
+		nearest_entity_indexes = np.zeros((0, ), dtype=np.intp)
+		nearest_distances = np.zeros((0, ), dtype=np.float64)
+		for ring_index in range(maximum_ring_index + 1):
+			if ring_index != 0 and (2 * ring_index + 1) ** self.__dimensions_total - (2 * ring_index - 1) ** self.__dimensions_total > self.__entities_total:
+				# the ring has more cells than there are entities, so check every entity instead
+				entity_indexes = self.__get_present_entity_indexes()
+				distances = np.sqrt(((self.__positions[entity_indexes] - position) ** 2).sum(axis=1))
+				return entity_indexes[np.argsort(distances, kind="stable")[:neighbors_total]]
+			ring_entity_indexes = []  # type: List[int]
+			for cell_key in self.__get_ring_cell_keys(center_cell=center_cell.tolist(), ring_index=ring_index):
+				cell_entity_indexes = self.__entity_indexes_per_cell.get(cell_key)
+				if cell_entity_indexes is not None:
+					ring_entity_indexes.extend(cell_entity_indexes)
+			if ring_entity_indexes:
+				ring_entity_indexes = np.array(ring_entity_indexes, dtype=np.intp)
+				nearest_entity_indexes = np.concatenate((nearest_entity_indexes, ring_entity_indexes))
+				nearest_distances = np.concatenate((nearest_distances, np.sqrt(((self.__positions[ring_entity_indexes] - position) ** 2).sum(axis=1))))
+				nearest_indexes = np.argsort(nearest_distances, kind="stable")[:neighbors_total]
+				nearest_entity_indexes = nearest_entity_indexes[nearest_indexes]
+				nearest_distances = nearest_distances[nearest_indexes]
+			if nearest_entity_indexes.shape[0] == neighbors_total:
+				# the closest unsearched point lies just past the nearest face of the searched cells
+				unsearched_distance = min(float((position - (center_cell - ring_index) * self.__cell_size).min()), float(((center_cell + ring_index + 1) * self.__cell_size - position).min()))
+				if nearest_distances[-1] <= unsearched_distance:
+					break
+		return nearest_entity_indexes
+
+	def get_collision_pairs(self, *, maximum_distance: float) -> np.ndarray:
+		# broad phase over sorted cell keys, then an exact distance check, returning (n, 2) entity index pairs with the lower index first
+		entity_indexes = self.__get_present_entity_indexes()
+		if entity_indexes.shape[0] < 2:
+			return np.zeros((0, 2), dtype=np.intp)
+		reach = max(1, int(np.ceil(maximum_distance / self.__cell_size)))
+		cells = self.__cells[entity_indexes]
+		minimum_cell = cells.min(axis=0) - reach
+		extents = cells.max(axis=0) - minimum_cell + reach + 1
+		if np.prod(extents.astype(np.float64)) >= 2 ** 62:
+			raise Exception(f"Occupied cell extents {extents.tolist()} are too large to linearize.")
+		strides = np.ones((self.__dimensions_total, ), dtype=np.int64)
+		for dimension_index in range(self.__dimensions_total - 2, -1, -1):
+			strides[dimension_index] = strides[dimension_index + 1] * extents[dimension_index + 1]
+		keys = ((cells - minimum_cell) * strides).sum(axis=1)
+
+		order = np.argsort(keys, kind="stable")
+		sorted_entity_indexes = entity_indexes[order]
+		sorted_positions = self.__positions[sorted_entity_indexes]
+		unique_keys, cell_starts, cell_counts = np.unique(keys[order], return_index=True, return_counts=True)
+
+		first_entity_indexes = []  # type: List[np.ndarray]
+		second_entity_indexes = []  # type: List[np.ndarray]
+		for cell_offset in itertools.product(range(-reach, reach + 1), repeat=self.__dimensions_total):
+			# only one of each opposing pair of offsets is needed
+			first_nonzero_offset = next((offset for offset in cell_offset if offset != 0), 0)
+			if first_nonzero_offset < 0:
+				continue
+			is_same_cell = first_nonzero_offset == 0
+			neighbor_keys = unique_keys + int(np.dot(cell_offset, strides))
+			neighbor_indexes = np.minimum(np.searchsorted(unique_keys, neighbor_keys), unique_keys.shape[0] - 1)
+			is_occupied = unique_keys[neighbor_indexes] == neighbor_keys
+			first_starts = cell_starts[is_occupied]
+			first_counts = cell_counts[is_occupied]
+			second_starts = cell_starts[neighbor_indexes[is_occupied]]
+			second_counts = cell_counts[neighbor_indexes[is_occupied]]
+			pair_counts = first_counts * second_counts
+			pairs_total = int(pair_counts.sum())
+			if pairs_total == 0:
+				continue
+			pair_cell_indexes = np.repeat(np.arange(pair_counts.shape[0]), pair_counts)
+			pair_offsets = np.arange(pairs_total) - np.repeat(np.cumsum(pair_counts) - pair_counts, pair_counts)
+			first_local_indexes = pair_offsets // second_counts[pair_cell_indexes]
+			second_local_indexes = pair_offsets % second_counts[pair_cell_indexes]
+			if is_same_cell:
+				is_unique_pair = first_local_indexes < second_local_indexes
+				pair_cell_indexes = pair_cell_indexes[is_unique_pair]
+				first_local_indexes = first_local_indexes[is_unique_pair]
+				second_local_indexes = second_local_indexes[is_unique_pair]
+			first_sorted_indexes = first_starts[pair_cell_indexes] + first_local_indexes
+			second_sorted_indexes = second_starts[pair_cell_indexes] + second_local_indexes
+			distances_squared = ((sorted_positions[first_sorted_indexes] - sorted_positions[second_sorted_indexes]) ** 2).sum(axis=1)
+			is_within_distance = distances_squared <= maximum_distance * maximum_distance
+			first_entity_indexes.append(sorted_entity_indexes[first_sorted_indexes[is_within_distance]])
+			second_entity_indexes.append(sorted_entity_indexes[second_sorted_indexes[is_within_distance]])
+
+		if not first_entity_indexes:
+			return np.zeros((0, 2), dtype=np.intp)
+		first_entity_indexes = np.concatenate(first_entity_indexes)
+		second_entity_indexes = np.concatenate(second_entity_indexes)
+		return np.stack((np.minimum(first_entity_indexes, second_entity_indexes), np.maximum(first_entity_indexes, second_entity_indexes)), axis=1)
+
+
+class ClientInterestUpdate():
+
+	def __init__(self, *, client_uuid: str, entered_entity_indexes: np.ndarray, left_entity_indexes: np.ndarray, visible_entity_indexes: np.ndarray):
+
+		self.__client_uuid = client_uuid
+		self.__entered_entity_indexes = entered_entity_indexes
+		self.__left_entity_indexes = left_entity_indexes
+		self.__visible_entity_indexes = visible_entity_indexes
+
+	def get_client_uuid(self) -> str:
+		return self.__client_uuid
+
+	def get_entered_entity_indexes(self) -> np.ndarray:
+		return self.__entered_entity_indexes
+
+	def get_left_entity_indexes(self) -> np.ndarray:
+		return self.__left_entity_indexes
+
+	def get_visible_entity_indexes(self) -> np.ndarray:
+		return self.__visible_entity_indexes
+
+
+class ClientInterestManager():
+
+	def __init__(self, *, spatial_index: UniformGridSpatialIndex, maximum_incremental_moved_entities_total: int = 1024):
+
+		self.__spatial_index = spatial_index
+		self.__maximum_incremental_moved_entities_total = maximum_incremental_moved_entities_total
+
+		self.__position_per_client_uuid = {}  # type: Dict[str, np.ndarray]
+		self.__radius_per_client_uuid = {}  # type: Dict[str, float]
+		self.__visible_entity_indexes_per_client_uuid = {}  # type: Dict[str, np.ndarray]
+		self.__changed_client_uuids = set()  # type: Set[str]
+
+	def set_client_interest(self, *, client_uuid: str, position: Tuple[float, ...], radius: float):
+		self.__position_per_client_uuid[client_uuid] = np.asarray(position, dtype=np.float64)
+		self.__radius_per_client_uuid[client_uuid] = radius
+		if client_uuid not in self.__visible_entity_indexes_per_client_uuid:
+			self.__visible_entity_indexes_per_client_uuid[client_uuid] = np.zeros((0, ), dtype=np.intp)
+		self.__changed_client_uuids.add(client_uuid)
+
+	def remove_client(self, *, client_uuid: str) -> bool:
+		if client_uuid not in self.__position_per_client_uuid:
+			return False
+		del self.__position_per_client_uuid[client_uuid]
+		del self.__radius_per_client_uuid[client_uuid]
+		del self.__visible_entity_indexes_per_client_uuid[client_uuid]
+		self.__changed_client_uuids.discard(client_uuid)
+		return True
+
+	def get_client_uuids(self) -> List[str]:
+		return list(self.__position_per_client_uuid.keys())
+
+	def get_visible_entity_indexes(self, *, client_uuid: str) -> np.ndarray:
+		return self.__visible_entity_indexes_per_client_uuid.get(client_uuid, np.zeros((0, ), dtype=np.intp))
+
+	def update(self) -> List[ClientInterestUpdate]:
+		# clients whose interest changed are queried again, while every other client only checks the entities that moved since the previous update
+		moved_entity_indexes = self.__spatial_index.pop_moved_entity_indexes()
+		# past this many moved entities it is cheaper for every client to query its own cells again
+		is_incremental = moved_entity_indexes.shape[0] <= self.__maximum_incremental_moved_entities_total
+		if is_incremental and moved_entity_indexes.shape[0] != 0:
+			moved_positions = self.__spatial_index.get_positions(
+				entity_indexes=moved_entity_indexes
+			)
+			is_moved_present = self.__spatial_index.is_present(
+				entity_indexes=moved_entity_indexes
+			)
+		empty_entity_indexes = np.zeros((0, ), dtype=np.intp)
+		# visible sets are kept sorted so that the enter and leave differences are linear merges
+		client_interest_updates = []  # type: List[ClientInterestUpdate]
+		for client_uuid, position in self.__position_per_client_uuid.items():
+			previous_visible_entity_indexes = self.__visible_entity_indexes_per_client_uuid[client_uuid]
+			radius = self.__radius_per_client_uuid[client_uuid]
+			if not is_incremental or client_uuid in self.__changed_client_uuids:
+				visible_entity_indexes = self.__spatial_index.query_radius(
+					position=position,
+					radius=radius
+				)
+			elif moved_entity_indexes.shape[0] == 0:
+				client_interest_updates.append(ClientInterestUpdate(
+					client_uuid=client_uuid,
+					entered_entity_indexes=empty_entity_indexes,
+					left_entity_indexes=empty_entity_indexes,
+					visible_entity_indexes=previous_visible_entity_indexes
+				))
+				continue
+			else:
+				is_moved_visible = is_moved_present & (((moved_positions - position) ** 2).sum(axis=1) <= radius * radius)
+				visible_entity_indexes = np.union1d(np.setdiff1d(previous_visible_entity_indexes, moved_entity_indexes, assume_unique=True), moved_entity_indexes[is_moved_visible])
+			client_interest_updates.append(ClientInterestUpdate(
+				client_uuid=client_uuid,
+				entered_entity_indexes=np.setdiff1d(visible_entity_indexes, previous_visible_entity_indexes, assume_unique=True),
+				left_entity_indexes=np.setdiff1d(previous_visible_entity_indexes, visible_entity_indexes, assume_unique=True),
+				visible_entity_indexes=visible_entity_indexes
+			))
+			self.__visible_entity_indexes_per_client_uuid[client_uuid] = visible_entity_indexes
+		self.__changed_client_uuids.clear()
+		return client_interest_updates
@@ -0,0 +1,153 @@
+from __future__ import annotations
+import unittest
+from typing import List, Tuple, Dict, Callable, Type, Set
+import asyncio
+from austin_heller_repo.socket_queued_message_framework import ClientServerMessage, StructureInfluence
+from austin_heller_repo.client_authentication_manager import AuthenticationResponseClientAuthenticationClientServerMessage
+from src.austin_heller_repo.game_manager import AsyncioGameManagerStructureFactory, AuthenticateClientRequestGameManagerClientServerMessage, AuthenticationTimeoutErrorGameManagerClientServerMessage, ServerBusyErrorGameManagerClientServerMessage, AuthenticateClientResponseGameManagerClientServerMessage
+
+
+class RecordingClientMessenger():
+
+	def __init__(self):
+
+		self.sent_client_server_messages = []  # type: List[ClientServerMessage]
+		self.callback = None  # type: Callable[[ClientServerMessage], None]
+
+	def connect_to_server(self):
+		pass
+
+	def receive_from_server(self, *, callback: Callable[[ClientServerMessage], None], on_exception: Callable[[Exception], None]):
+		self.callback = callback
+
+	def send_to_server(self, *, request_client_server_message: ClientServerMessage):
+		self.sent_client_server_messages.append(request_client_server_message)
+
+	def dispose(self):
+		pass
+
+
+class RecordingClientMessengerFactory():
+
+	def __init__(self):
+
+		self.client_messengers = []  # type: List[RecordingClientMessenger]
+
+	def get_client_messenger(self) -> RecordingClientMessenger:
+		client_messenger = RecordingClientMessenger()
+		self.client_messengers.append(client_messenger)
+		return client_messenger
+
+
+class AsyncioGameManagerTest(unittest.IsolatedAsyncioTestCase):
+
+	async def test_authentication_timeout_and_coalescing(self):
+
+		sent_client_server_messages = []  # type: List[ClientServerMessage]
+		client_messenger_factory = RecordingClientMessengerFactory()
+
+		asyncio_game_manager_structure = AsyncioGameManagerStructureFactory(
+			authentication_timeout_seconds=0.2,
+			client_authentication_client_messenger_factory=client_messenger_factory
+		).get_structure(
+			send_response=sent_client_server_messages.append
+		)
+		await asyncio_game_manager_structure.start()
+
+		for client_uuid in ["first", "first", "second"]:
+			await asyncio_game_manager_structure.update_structure(
+				structure_influence=StructureInfluence(
+					client_server_message=AuthenticateClientRequestGameManagerClientServerMessage(),
+					source_uuid=client_uuid
+				)
+			)
+
+		self.assertEqual(2, len(client_messenger_factory.client_messengers[0].sent_client_server_messages))
+		self.assertEqual(0, len(sent_client_server_messages))
+
+		await asyncio.sleep(0.4)
+
+		self.assertEqual({"first", "second"}, {client_server_message.get_destination_uuid() for client_server_message in sent_client_server_messages})
+		for client_server_message in sent_client_server_messages:
+			self.assertIsInstance(client_server_message, AuthenticationTimeoutErrorGameManagerClientServerMessage)
+
+		metrics_snapshot = asyncio_game_manager_structure.get_metrics_snapshot()
+		self.assertEqual(1, metrics_snapshot["counters"]["authentication_requests_coalesced_total"])
+		self.assertEqual(2, metrics_snapshot["counters"]["authentication_timeouts_total"])
+		self.assertEqual(0, metrics_snapshot["gauges"]["pending_authentications_total"])
+
+		await asyncio_game_manager_structure.dispose()
+
+	async def test_rate_limited(self):
+
+		sent_client_server_messages = []  # type: List[ClientServerMessage]
+
+		asyncio_game_manager_structure = AsyncioGameManagerStructureFactory(
+			authentication_timeout_seconds=10.0,
+			client_authentication_client_messenger_factory=RecordingClientMessengerFactory(),
+			authentication_requests_per_second=1.0,
+			authentication_requests_burst_total=1
+		).get_structure(
+			send_response=sent_client_server_messages.append
+		)
+		await asyncio_game_manager_structure.start()
+
+		for _ in range(2):
+			await asyncio_game_manager_structure.update_structure(
+				structure_influence=StructureInfluence(
+					client_server_message=AuthenticateClientRequestGameManagerClientServerMessage(),
+					source_uuid="first"
+				)
+			)
+
+		self.assertEqual(1, len(sent_client_server_messages))
+		self.assertIsInstance(sent_client_server_messages[0], ServerBusyErrorGameManagerClientServerMessage)
+
+		asyncio_game_manager_structure.client_disconnected(
+			client_uuid="first"
+		)
+
+		self.assertEqual(0, asyncio_game_manager_structure.get_metrics_snapshot()["gauges"]["scheduled_deadlines_total"])
+
+		await asyncio_game_manager_structure.dispose()
+
+	async def test_authentication_response_completes_on_event_loop(self):
+
+		sent_client_server_messages = []  # type: List[ClientServerMessage]
+		client_messenger_factory = RecordingClientMessengerFactory()
+
+		asyncio_game_manager_structure = AsyncioGameManagerStructureFactory(
+			authentication_timeout_seconds=0.2,
+			client_authentication_client_messenger_factory=client_messenger_factory
+		).get_structure(
+			send_response=sent_client_server_messages.append
+		)
+		await asyncio_game_manager_structure.start()
+
+		await asyncio_game_manager_structure.update_structure(
+			structure_influence=StructureInfluence(
+				client_server_message=AuthenticateClientRequestGameManagerClientServerMessage(),
+				source_uuid="first"
+			)
+		)
+
+		client_messenger = client_messenger_factory.client_messengers[0]
+		client_messenger.callback(AuthenticationResponseClientAuthenticationClientServerMessage(
+			is_successful=True,
+			authentication_id="first_authentication_id",
+			external_metadata_json=client_messenger.sent_client_server_messages[0].get_external_metadata_json()
+		))
+
+		# the response and the router completion are both handed back to the loop before the timeout could fire
+		await asyncio.sleep(0.4)
+
+		self.assertEqual([AuthenticateClientResponseGameManagerClientServerMessage], [type(client_server_message) for client_server_message in sent_client_server_messages])
+		self.assertEqual("first_authentication_id", asyncio_game_manager_structure.get_authentication_id(
+			client_uuid="first"
+		))
+		metrics_snapshot = asyncio_game_manager_structure.get_metrics_snapshot()
+		self.assertEqual([0], metrics_snapshot["gauges"]["outstanding_authentications_per_replica"])
+		self.assertEqual(0, metrics_snapshot["gauges"]["scheduled_deadlines_total"])
+		self.assertEqual(0, metrics_snapshot["counters"]["authentication_timeouts_total"])
+
+		await asyncio_game_manager_structure.dispose()
@@ -0,0 +1,513 @@
+from __future__ import annotations
+import unittest
+from typing import List, Tuple, Dict, Callable, Type, Set
+import time
+from datetime import datetime
+import uuid
+import os
+import tempfile
+import multiprocessing
+from src.austin_heller_repo.game_manager import ShardedAuthenticationStateStore, ShardedAuthenticationStateStoreFactory, SqliteAuthenticationStateStoreFactory, AuthenticationCompletionResultEnum, PendingAuthenticationResultEnum, AuthenticationSessionTokenCache
+from austin_heller_repo.threading import start_thread
+
+
+def complete_pending_authentication_in_process(database_file_path: str, client_uuid: str, authentication_uuid: str):
+	authentication_state_store = SqliteAuthenticationStateStoreFactory(
+		database_file_path=database_file_path
+	).get_authentication_state_store()
+	authentication_state_store.try_complete_pending_authentication(
+		client_uuid=client_uuid,
+		authentication_uuid=authentication_uuid,
+		authentication_id="authentication_id"
+	)
+	authentication_state_store.dispose()
+
+
+class AuthenticationStateStoreTest(unittest.TestCase):
+
+	def test_initialize(self):
+
+		authentication_state_store = ShardedAuthenticationStateStoreFactory(
+			shards_total=4
+		).get_authentication_state_store()
+
+		self.assertIsNotNone(authentication_state_store)
+
+		with self.assertRaises(Exception):
+			ShardedAuthenticationStateStore(
+				shards_total=0
+			)
+
+	def test_complete_pending_authentication(self):
+
+		authentication_state_store = ShardedAuthenticationStateStore(
+			shards_total=4
+		)
+
+		client_uuid = str(uuid.uuid4())
+		authentication_uuid = str(uuid.uuid4())
+
+		self.assertEqual(PendingAuthenticationResultEnum.Added, authentication_state_store.try_add_pending_authentication(
+			client_uuid=client_uuid,
+			authentication_uuid=authentication_uuid
+		))
+		self.assertTrue(authentication_state_store.is_pending_authentication(
+			client_uuid=client_uuid,
+			authentication_uuid=authentication_uuid
+		))
+		self.assertEqual(1, authentication_state_store.get_pending_authentications_total())
+
+		self.assertEqual(AuthenticationCompletionResultEnum.Completed, authentication_state_store.try_complete_pending_authentication(
+			client_uuid=client_uuid,
+			authentication_uuid=authentication_uuid,
+			authentication_id="authentication_id"
+		))
+		self.assertEqual(AuthenticationCompletionResultEnum.NotPending, authentication_state_store.try_complete_pending_authentication(
+			client_uuid=client_uuid,
+			authentication_uuid=authentication_uuid,
+			authentication_id="authentication_id"
+		))
+		self.assertFalse(authentication_state_store.try_remove_pending_authentication(
+			client_uuid=client_uuid,
+			authentication_uuid=authentication_uuid
+		))
+		self.assertEqual("authentication_id", authentication_state_store.get_authentication_id(
+			client_uuid=client_uuid
+		))
+		self.assertEqual(0, authentication_state_store.get_pending_authentications_total())
+		self.assertEqual(1, authentication_state_store.get_authenticated_clients_total())
+
+		self.assertEqual(PendingAuthenticationResultEnum.ClientAlreadyAuthenticated, authentication_state_store.try_add_pending_authentication(
+			client_uuid=client_uuid,
+			authentication_uuid=str(uuid.uuid4())
+		))
+
+	def test_complete_pending_authentication_already_authenticated(self):
+
+		authentication_state_store = ShardedAuthenticationStateStore(
+			shards_total=4
+		)
+
+		client_uuid = str(uuid.uuid4())
+		authentication_uuid = str(uuid.uuid4())
+
+		authentication_state_store.try_add_pending_authentication(
+			client_uuid=client_uuid,
+			authentication_uuid=authentication_uuid
+		)
+		authentication_state_store.try_add_authentication(
+			client_uuid=client_uuid,
+			authentication_id="first"
+		)
+
+		self.assertEqual(AuthenticationCompletionResultEnum.ClientAlreadyAuthenticated, authentication_state_store.try_complete_pending_authentication(
+			client_uuid=client_uuid,
+			authentication_uuid=authentication_uuid,
+			authentication_id="second"
+		))
+		self.assertEqual("first", authentication_state_store.get_authentication_id(
+			client_uuid=client_uuid
+		))
+
+	def test_duplicate_pending_authentication(self):
+
+		authentication_state_store = ShardedAuthenticationStateStore(
+			shards_total=4
+		)
+
+		client_uuid = str(uuid.uuid4())
+		authentication_uuids = [str(uuid.uuid4()) for index in range(2)]
+
+		self.assertEqual(PendingAuthenticationResultEnum.Added, authentication_state_store.try_add_pending_authentication(
+			client_uuid=client_uuid,
+			authentication_uuid=authentication_uuids[0]
+		))
+		self.assertEqual(PendingAuthenticationResultEnum.AlreadyPending, authentication_state_store.try_add_pending_authentication(
+			client_uuid=client_uuid,
+			authentication_uuid=authentication_uuids[1]
+		))
+		self.assertEqual(1, authentication_state_store.get_pending_authentications_total())
+		self.assertFalse(authentication_state_store.is_pending_authentication(
+			client_uuid=client_uuid,
+			authentication_uuid=authentication_uuids[1]
+		))
+		self.assertTrue(authentication_state_store.is_pending_authentication(
+			client_uuid=client_uuid,
+			authentication_uuid=authentication_uuids[0]
+		))
+
+		self.assertTrue(authentication_state_store.try_remove_pending_authentication(
+			client_uuid=client_uuid,
+			authentication_uuid=authentication_uuids[0]
+		))
+		self.assertFalse(authentication_state_store.is_pending_authentication(
+			client_uuid=client_uuid,
+			authentication_uuid=authentication_uuids[0]
+		))
+		self.assertEqual(PendingAuthenticationResultEnum.Added, authentication_state_store.try_add_pending_authentication(
+			client_uuid=client_uuid,
+			authentication_uuid=authentication_uuids[1]
+		))
+
+	def test_unsuccessful_authentication_is_not_stored(self):
+
+		authentication_state_store = ShardedAuthenticationStateStore(
+			shards_total=1
+		)
+
+		client_uuid = str(uuid.uuid4())
+		authentication_uuid = str(uuid.uuid4())
+
+		authentication_state_store.try_add_pending_authentication(
+			client_uuid=client_uuid,
+			authentication_uuid=authentication_uuid
+		)
+
+		self.assertEqual(AuthenticationCompletionResultEnum.Completed, authentication_state_store.try_complete_pending_authentication(
+			client_uuid=client_uuid,
+			authentication_uuid=authentication_uuid,
+			authentication_id=None
+		))
+		self.assertIsNone(authentication_state_store.get_authentication_id(
+			client_uuid=client_uuid
+		))
+		self.assertEqual(0, authentication_state_store.get_authenticated_clients_total())
+
+	def test_add_authentication(self):
+
+		authentication_state_store = ShardedAuthenticationStateStore(
+			shards_total=4
+		)
+
+		client_uuid = str(uuid.uuid4())
+
+		self.assertTrue(authentication_state_store.try_add_authentication(
+			client_uuid=client_uuid,
+			authentication_id="first"
+		))
+		self.assertFalse(authentication_state_store.try_add_authentication(
+			client_uuid=client_uuid,
+			authentication_id="second"
+		))
+		self.assertEqual("first", authentication_state_store.get_authentication_id(
+			client_uuid=client_uuid
+		))
+
+	def test_remove_client(self):
+
+		authentication_state_store = ShardedAuthenticationStateStore(
+			shards_total=4
+		)
+
+		authenticated_client_uuid = str(uuid.uuid4())
+		pending_client_uuid = str(uuid.uuid4())
+		authentication_uuid = str(uuid.uuid4())
+
+		authentication_state_store.try_add_authentication(
+			client_uuid=authenticated_client_uuid,
+			authentication_id="authentication_id"
+		)
+		authentication_state_store.try_add_pending_authentication(
+			client_uuid=pending_client_uuid,
+			authentication_uuid=authentication_uuid
+		)
+
+		self.assertEqual([], authentication_state_store.remove_client(
+			client_uuid=authenticated_client_uuid
+		))
+		self.assertEqual([authentication_uuid], authentication_state_store.remove_client(
+			client_uuid=pending_client_uuid
+		))
+		self.assertEqual(0, authentication_state_store.get_authenticated_clients_total())
+		self.assertEqual(0, authentication_state_store.get_pending_authentications_total())
+
+	def test_remove_idle_clients(self):
+
+		authentication_state_store = ShardedAuthenticationStateStore(
+			shards_total=4
+		)
+
+		idle_client_uuid = str(uuid.uuid4())
+		active_client_uuid = str(uuid.uuid4())
+
+		for client_uuid in [idle_client_uuid, active_client_uuid]:
+			authentication_state_store.try_add_authentication(
+				client_uuid=client_uuid,
+				authentication_id=client_uuid
+			)
+
+		time.sleep(0.2)
+
+		authentication_state_store.refresh_client(
+			client_uuid=active_client_uuid
+		)
+
+		self.assertEqual([idle_client_uuid], authentication_state_store.remove_idle_clients(
+			idle_seconds=0.1
+		))
+		self.assertIsNone(authentication_state_store.get_authentication_id(
+			client_uuid=idle_client_uuid
+		))
+		self.assertEqual(active_client_uuid, authentication_state_store.get_authentication_id(
+			client_uuid=active_client_uuid
+		))
+
+	def test_session_token_cache(self):
+
+		authentication_session_token_cache = AuthenticationSessionTokenCache(
+			time_to_live_seconds=10,
+			maximum_session_tokens_total=2
+		)
+
+		session_tokens = []  # type: List[str]
+		for authentication_id in ["first", "second", "third"]:
+			session_tokens.append(authentication_session_token_cache.add_authentication_id(
+				authentication_id=authentication_id
+			))
+
+		self.assertEqual(2, authentication_session_token_cache.get_session_tokens_total())
+		self.assertIsNone(authentication_session_token_cache.try_pop_authentication_id(
+			session_token=session_tokens[0]
+		))
+		self.assertEqual("second", authentication_session_token_cache.try_pop_authentication_id(
+			session_token=session_tokens[1]
+		))
+		self.assertIsNone(authentication_session_token_cache.try_pop_authentication_id(
+			session_token=session_tokens[1]
+		))
+		self.assertEqual("third", authentication_session_token_cache.try_pop_authentication_id(
+			session_token=session_tokens[2]
+		))
+
+	def test_session_token_cache_expires(self):
+
+		authentication_session_token_cache = AuthenticationSessionTokenCache(
+			time_to_live_seconds=0.1,
+			maximum_session_tokens_total=10
+		)
+
+		session_token = authentication_session_token_cache.add_authentication_id(
+			authentication_id="first"
+		)
+
+		time.sleep(0.2)
+
+		self.assertIsNone(authentication_session_token_cache.try_pop_authentication_id(
+			session_token=session_token
+		))
+
+	def test_throughput_per_shards_total(self):
+
+		authentications_per_thread_total = 5000
+
+		for shards_total in [1, 4, 16, 64]:
+			for threads_total in [1, 2, 4, 8, 16]:
+
+				authentication_state_store = ShardedAuthenticationStateStore(
+					shards_total=shards_total
+				)
+
+				def authenticating_thread_method():
+					for authentication_index in range(authentications_per_thread_total):
+						client_uuid = str(uuid.uuid4())
+						authentication_uuid = str(uuid.uuid4())
+						authentication_state_store.try_add_pending_authentication(
+							client_uuid=client_uuid,
+							authentication_uuid=authentication_uuid
+						)
+						authentication_state_store.is_pending_authentication(
+							client_uuid=client_uuid,
+							authentication_uuid=authentication_uuid
+						)
+						authentication_state_store.try_complete_pending_authentication(
+							client_uuid=client_uuid,
+							authentication_uuid=authentication_uuid,
+							authentication_id=authentication_uuid
+						)
+
+				start_time = datetime.utcnow()
+				authenticating_threads = []
+				for thread_index in range(threads_total):
+					authenticating_threads.append(start_thread(authenticating_thread_method))
+				for authenticating_thread in authenticating_threads:
+					authenticating_thread.join()
+				end_time = datetime.utcnow()
+
+				authentications_total = authentications_per_thread_total * threads_total
+				seconds_total = (end_time - start_time).total_seconds()
+				print(f"{datetime.utcnow()}: test: shards: {shards_total}, threads: {threads_total}, authentications per second: {authentications_total / seconds_total}")
+
+				self.assertEqual(authentications_total, authentication_state_store.get_authenticated_clients_total())
+				self.assertEqual(0, authentication_state_store.get_pending_authentications_total())
+
+
+	def test_maximum_pending_authentications_is_never_exceeded(self):
+
+		authentication_state_store = ShardedAuthenticationStateStore(
+			shards_total=16
+		)
+		pending_authentication_results = []  # type: List[PendingAuthenticationResultEnum]
+
+		def adding_thread_method():
+			for authentication_index in range(200):
+				pending_authentication_results.append(authentication_state_store.try_add_pending_authentication(
+					client_uuid=str(uuid.uuid4()),
+					authentication_uuid=str(uuid.uuid4()),
+					maximum_pending_authentications_total=50
+				))
+
+		adding_threads = [start_thread(adding_thread_method) for thread_index in range(8)]
+		for adding_thread in adding_threads:
+			adding_thread.join()
+
+		self.assertEqual(50, pending_authentication_results.count(PendingAuthenticationResultEnum.Added))
+		self.assertEqual(1550, pending_authentication_results.count(PendingAuthenticationResultEnum.MaximumPendingAuthenticationsReached))
+		self.assertEqual(50, authentication_state_store.get_pending_authentications_total())
+
+
+class SqliteAuthenticationStateStoreTest(unittest.TestCase):
+
+	def test_shared_between_stores(self):
+
+		with tempfile.TemporaryDirectory() as directory_path:
+
+			authentication_state_store_factory = SqliteAuthenticationStateStoreFactory(
+				database_file_path=os.path.join(directory_path, "authentication_state.db")
+			)
+			first_authentication_state_store = authentication_state_store_factory.get_authentication_state_store()
+			second_authentication_state_store = authentication_state_store_factory.get_authentication_state_store()
+
+			client_uuid = str(uuid.uuid4())
+			authentication_uuid = str(uuid.uuid4())
+
+			self.assertEqual(PendingAuthenticationResultEnum.Added, first_authentication_state_store.try_add_pending_authentication(
+				client_uuid=client_uuid,
+				authentication_uuid=authentication_uuid
+			))
+			self.assertEqual(PendingAuthenticationResultEnum.AlreadyPending, second_authentication_state_store.try_add_pending_authentication(
+				client_uuid=client_uuid,
+				authentication_uuid=str(uuid.uuid4())
+			))
+			self.assertTrue(second_authentication_state_store.is_pending_authentication(
+				client_uuid=client_uuid,
+				authentication_uuid=authentication_uuid
+			))
+			self.assertEqual(AuthenticationCompletionResultEnum.Completed, second_authentication_state_store.try_complete_pending_authentication(
+				client_uuid=client_uuid,
+				authentication_uuid=authentication_uuid,
+				authentication_id="authentication_id"
+			))
+			self.assertEqual("authentication_id", first_authentication_state_store.get_authentication_id(
+				client_uuid=client_uuid
+			))
+			self.assertEqual(PendingAuthenticationResultEnum.ClientAlreadyAuthenticated, first_authentication_state_store.try_add_pending_authentication(
+				client_uuid=client_uuid,
+				authentication_uuid=str(uuid.uuid4())
+			))
+			self.assertFalse(first_authentication_state_store.try_add_authentication(
+				client_uuid=client_uuid,
+				authentication_id="other_authentication_id"
+			))
+
+			time.sleep(0.1)
+
+			self.assertEqual([client_uuid], second_authentication_state_store.remove_idle_clients(
+				idle_seconds=0.05
+			))
+			self.assertEqual(0, first_authentication_state_store.get_authenticated_clients_total())
+
+			first_authentication_state_store.dispose()
+			second_authentication_state_store.dispose()
+
+	def test_complete_in_other_process(self):
+
+		with tempfile.TemporaryDirectory() as directory_path:
+
+			database_file_path = os.path.join(directory_path, "authentication_state.db")
+
+			authentication_state_store = SqliteAuthenticationStateStoreFactory(
+				database_file_path=database_file_path
+			).get_authentication_state_store()
+
+			client_uuid = str(uuid.uuid4())
+			authentication_uuid = str(uuid.uuid4())
+
+			authentication_state_store.try_add_pending_authentication(
+				client_uuid=client_uuid,
+				authentication_uuid=authentication_uuid
+			)
+
+			process = multiprocessing.Process(
+				target=complete_pending_authentication_in_process,
+				args=(database_file_path, client_uuid, authentication_uuid)
+			)
+			process.start()
+			process.join()
+
+			self.assertEqual(0, process.exitcode)
+			self.assertEqual("authentication_id", authentication_state_store.get_authentication_id(
+				client_uuid=client_uuid
+			))
+			self.assertFalse(authentication_state_store.try_remove_pending_authentication(
+				client_uuid=client_uuid,
+				authentication_uuid=authentication_uuid
+			))
+
+			authentication_state_store.dispose()
+
+	def test_maximum_pending_authentications_is_shared_between_stores(self):
+
+		with tempfile.TemporaryDirectory() as directory_path:
+
+			authentication_state_store_factory = SqliteAuthenticationStateStoreFactory(
+				database_file_path=os.path.join(directory_path, "authentication_state.db")
+			)
+			first_authentication_state_store = authentication_state_store_factory.get_authentication_state_store()
+			second_authentication_state_store = authentication_state_store_factory.get_authentication_state_store()
+
+			client_uuids = [str(uuid.uuid4()) for index in range(3)]
+			authentication_uuids = [str(uuid.uuid4()) for index in range(3)]
+
+			for client_uuid, authentication_uuid, authentication_state_store in zip(client_uuids[:2], authentication_uuids[:2], [first_authentication_state_store, second_authentication_state_store]):
+				self.assertEqual(PendingAuthenticationResultEnum.Added, authentication_state_store.try_add_pending_authentication(
+					client_uuid=client_uuid,
+					authentication_uuid=authentication_uuid,
+					maximum_pending_authentications_total=2
+				))
+			self.assertEqual(PendingAuthenticationResultEnum.MaximumPendingAuthenticationsReached, first_authentication_state_store.try_add_pending_authentication(
+				client_uuid=client_uuids[2],
+				authentication_uuid=authentication_uuids[2],
+				maximum_pending_authentications_total=2
+			))
+			self.assertEqual(PendingAuthenticationResultEnum.AlreadyPending, first_authentication_state_store.try_add_pending_authentication(
+				client_uuid=client_uuids[1],
+				authentication_uuid=authentication_uuids[2],
+				maximum_pending_authentications_total=2
+			))
+			self.assertEqual(2, second_authentication_state_store.get_pending_authentications_total())
+
+			# every way of leaving the pending state releases its place under the cap
+			self.assertEqual(AuthenticationCompletionResultEnum.Completed, second_authentication_state_store.try_complete_pending_authentication(
+				client_uuid=client_uuids[0],
+				authentication_uuid=authentication_uuids[0],
+				authentication_id="authentication_id"
+			))
+			self.assertEqual([authentication_uuids[1]], first_authentication_state_store.remove_client(
+				client_uuid=client_uuids[1]
+			))
+			self.assertEqual(0, first_authentication_state_store.get_pending_authentications_total())
+			self.assertEqual(PendingAuthenticationResultEnum.Added, first_authentication_state_store.try_add_pending_authentication(
+				client_uuid=client_uuids[2],
+				authentication_uuid=authentication_uuids[2],
+				maximum_pending_authentications_total=2
+			))
+
+			first_authentication_state_store.dispose()
+			second_authentication_state_store.dispose()
+
+			# the total is kept in the database, so a reopened store continues from it
+			reopened_authentication_state_store = authentication_state_store_factory.get_authentication_state_store()
+
+			self.assertEqual(1, reopened_authentication_state_store.get_pending_authentications_total())
+
+			reopened_authentication_state_store.dispose()
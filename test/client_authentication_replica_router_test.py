@@ -0,0 +1,219 @@
+from __future__ import annotations
+import unittest
+from typing import List, Tuple, Dict, Callable, Type, Set
+import time
+import threading
+from austin_heller_repo.socket_queued_message_framework import ClientServerMessage
+from src.austin_heller_repo.game_manager import ClientAuthenticationReplicaRouter, AuthenticationTimeoutErrorGameManagerClientServerMessage
+
+
+class FailingClientMessenger():
+
+	def __init__(self, *, client_messenger_factory: FailingClientMessengerFactory):
+
+		self.__client_messenger_factory = client_messenger_factory
+
+		self.sent_client_server_messages = []  # type: List[ClientServerMessage]
+
+	def connect_to_server(self):
+		self.__client_messenger_factory.connect_attempts_total += 1
+		if self.__client_messenger_factory.is_connect_failing:
+			raise Exception(f"Connection refused.")
+
+	def receive_from_server(self, *, callback: Callable[[ClientServerMessage], None], on_exception: Callable[[Exception], None]):
+		pass
+
+	def send_to_server(self, *, request_client_server_message: ClientServerMessage):
+		if self.__client_messenger_factory.send_blocking_event is not None:
+			self.__client_messenger_factory.send_started_event.set()
+			self.__client_messenger_factory.send_blocking_event.wait()
+		if self.__client_messenger_factory.is_send_failing:
+			raise Exception(f"Connection reset.")
+		self.sent_client_server_messages.append(request_client_server_message)
+
+	def dispose(self):
+		pass
+
+
+class FailingClientMessengerFactory():
+
+	def __init__(self):
+
+		self.is_connect_failing = False
+		self.is_send_failing = False
+		self.send_blocking_event = None  # type: threading.Event
+		self.send_started_event = threading.Event()
+		self.connect_attempts_total = 0
+		self.client_messengers = []  # type: List[FailingClientMessenger]
+
+	def get_client_messenger(self) -> FailingClientMessenger:
+		client_messenger = FailingClientMessenger(
+			client_messenger_factory=self
+		)
+		self.client_messengers.append(client_messenger)
+		return client_messenger
+
+	def get_sent_client_server_messages_total(self) -> int:
+		return sum(len(client_messenger.sent_client_server_messages) for client_messenger in self.client_messengers)
+
+
+def get_client_authentication_replica_router(*, client_messenger_factories: List[FailingClientMessengerFactory], backoff_seconds: float = 10.0, maximum_backoff_seconds: float = 60.0) -> ClientAuthenticationReplicaRouter:
+	client_authentication_replica_router = ClientAuthenticationReplicaRouter(
+		client_authentication_client_messenger_factories=client_messenger_factories,
+		client_messengers_total=1,
+		callback=lambda client_server_message: None,
+		on_exception=lambda exception: None,
+		backoff_seconds=backoff_seconds,
+		maximum_backoff_seconds=maximum_backoff_seconds
+	)
+	client_authentication_replica_router.connect_to_server()
+	return client_authentication_replica_router
+
+
+def send_to_server(*, client_authentication_replica_router: ClientAuthenticationReplicaRouter, authentication_uuid: str):
+	client_authentication_replica_router.send_to_server(
+		authentication_uuid=authentication_uuid,
+		request_client_server_message=AuthenticationTimeoutErrorGameManagerClientServerMessage(
+			destination_uuid=authentication_uuid
+		)
+	)
+
+
+class ClientAuthenticationReplicaRouterTest(unittest.TestCase):
+
+	def test_least_outstanding_replica_is_selected(self):
+
+		client_messenger_factories = [FailingClientMessengerFactory(), FailingClientMessengerFactory()]
+		client_authentication_replica_router = get_client_authentication_replica_router(
+			client_messenger_factories=client_messenger_factories
+		)
+
+		for authentication_index in range(4):
+			send_to_server(
+				client_authentication_replica_router=client_authentication_replica_router,
+				authentication_uuid=f"authentication_{authentication_index}"
+			)
+
+		self.assertEqual([2, 2], client_authentication_replica_router.get_outstanding_authentications_totals())
+
+		for authentication_index in [0, 2]:
+			client_authentication_replica_router.complete_authentication(
+				authentication_uuid=f"authentication_{authentication_index}"
+			)
+
+		self.assertEqual([0, 2], client_authentication_replica_router.get_outstanding_authentications_totals())
+
+		send_to_server(
+			client_authentication_replica_router=client_authentication_replica_router,
+			authentication_uuid="authentication_4"
+		)
+
+		self.assertEqual([1, 2], client_authentication_replica_router.get_outstanding_authentications_totals())
+
+		client_authentication_replica_router.dispose()
+
+	def test_failed_send_fails_over_to_other_replica(self):
+
+		client_messenger_factories = [FailingClientMessengerFactory(), FailingClientMessengerFactory()]
+		client_messenger_factories[0].is_send_failing = True
+		client_authentication_replica_router = get_client_authentication_replica_router(
+			client_messenger_factories=client_messenger_factories
+		)
+
+		send_to_server(
+			client_authentication_replica_router=client_authentication_replica_router,
+			authentication_uuid="first"
+		)
+
+		self.assertEqual(0, client_messenger_factories[0].get_sent_client_server_messages_total())
+		self.assertEqual(1, client_messenger_factories[1].get_sent_client_server_messages_total())
+		self.assertEqual([0, 1], client_authentication_replica_router.get_outstanding_authentications_totals())
+		self.assertEqual(1, client_authentication_replica_router.get_healthy_replicas_total())
+
+		client_messenger_factories[1].is_send_failing = True
+
+		with self.assertRaises(Exception):
+			send_to_server(
+				client_authentication_replica_router=client_authentication_replica_router,
+				authentication_uuid="second"
+			)
+
+		self.assertEqual([0, 1], client_authentication_replica_router.get_outstanding_authentications_totals())
+		self.assertEqual(0, client_authentication_replica_router.get_healthy_replicas_total())
+
+		client_authentication_replica_router.dispose()
+
+	def test_unhealthy_replica_reconnects_with_backoff(self):
+
+		client_messenger_factory = FailingClientMessengerFactory()
+		client_authentication_replica_router = get_client_authentication_replica_router(
+			client_messenger_factories=[client_messenger_factory],
+			backoff_seconds=0.1,
+			maximum_backoff_seconds=0.2
+		)
+		client_messenger_factory.is_send_failing = True
+		client_messenger_factory.is_connect_failing = True
+
+		with self.assertRaises(Exception):
+			send_to_server(
+				client_authentication_replica_router=client_authentication_replica_router,
+				authentication_uuid="first"
+			)
+
+		self.assertEqual(1, client_messenger_factory.connect_attempts_total)
+
+		# the reconnects happen in the background after 0.1 then 0.2 seconds, with the backoff capped at the maximum after that
+		time.sleep(0.2)
+
+		self.assertEqual(2, client_messenger_factory.connect_attempts_total)
+
+		time.sleep(0.2)
+
+		self.assertEqual(3, client_messenger_factory.connect_attempts_total)
+		self.assertEqual(0, client_authentication_replica_router.get_healthy_replicas_total())
+
+		client_messenger_factory.is_send_failing = False
+		client_messenger_factory.is_connect_failing = False
+
+		time.sleep(0.3)
+
+		self.assertEqual(1, client_authentication_replica_router.get_healthy_replicas_total())
+
+		send_to_server(
+			client_authentication_replica_router=client_authentication_replica_router,
+			authentication_uuid="second"
+		)
+
+		self.assertEqual(1, client_messenger_factory.get_sent_client_server_messages_total())
+
+		client_authentication_replica_router.dispose()
+
+	def test_slow_replica_does_not_block_other_replicas(self):
+
+		client_messenger_factories = [FailingClientMessengerFactory(), FailingClientMessengerFactory()]
+		client_messenger_factories[0].send_blocking_event = threading.Event()
+		client_authentication_replica_router = get_client_authentication_replica_router(
+			client_messenger_factories=client_messenger_factories
+		)
+
+		slow_thread = threading.Thread(target=lambda: send_to_server(
+			client_authentication_replica_router=client_authentication_replica_router,
+			authentication_uuid="slow"
+		))
+		slow_thread.start()
+
+		self.assertTrue(client_messenger_factories[0].send_started_event.wait(1.0))
+
+		send_to_server(
+			client_authentication_replica_router=client_authentication_replica_router,
+			authentication_uuid="fast"
+		)
+
+		self.assertEqual(1, client_messenger_factories[1].get_sent_client_server_messages_total())
+
+		client_messenger_factories[0].send_blocking_event.set()
+		slow_thread.join()
+
+		self.assertEqual([1, 1], client_authentication_replica_router.get_outstanding_authentications_totals())
+
+		client_authentication_replica_router.dispose()
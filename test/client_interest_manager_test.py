@@ -0,0 +1,138 @@
+from __future__ import annotations
+import unittest
+import uuid
+from typing import List, Tuple, Dict, Callable, Type, Set
+import numpy as np
+from src.austin_heller_repo.spatial_index import UniformGridSpatialIndex, ClientInterestManager, ClientInterestUpdate
+
+
+def get_client_interest_update_per_client_uuid(*, client_interest_manager: ClientInterestManager) -> Dict[str, ClientInterestUpdate]:
+	return dict((client_interest_update.get_client_uuid(), client_interest_update) for client_interest_update in client_interest_manager.update())
+
+
+class ClientInterestManagerTest(unittest.TestCase):
+
+	def test_initialize(self):
+
+		client_interest_manager = ClientInterestManager(
+			spatial_index=UniformGridSpatialIndex(
+				dimensions_total=2,
+				cell_size=1.0
+			)
+		)
+
+		self.assertIsNotNone(client_interest_manager)
+		self.assertEqual([], client_interest_manager.update())
+
+	def test_enter_and_leave(self):
+
+		spatial_index = UniformGridSpatialIndex(
+			dimensions_total=2,
+			cell_size=5.0
+		)
+		spatial_index.set_positions(
+			entity_indexes=[0, 1, 2],
+			positions=[(0, 0), (3, 0), (20, 0)]
+		)
+		client_interest_manager = ClientInterestManager(
+			spatial_index=spatial_index
+		)
+		first_client_uuid = str(uuid.uuid4())
+		second_client_uuid = str(uuid.uuid4())
+		client_interest_manager.set_client_interest(
+			client_uuid=first_client_uuid,
+			position=(0, 0),
+			radius=5.0
+		)
+		client_interest_manager.set_client_interest(
+			client_uuid=second_client_uuid,
+			position=(20, 0),
+			radius=5.0
+		)
+
+		client_interest_update_per_client_uuid = get_client_interest_update_per_client_uuid(
+			client_interest_manager=client_interest_manager
+		)
+
+		self.assertEqual([0, 1], client_interest_update_per_client_uuid[first_client_uuid].get_entered_entity_indexes().tolist())
+		self.assertEqual([], client_interest_update_per_client_uuid[first_client_uuid].get_left_entity_indexes().tolist())
+		self.assertEqual([2], client_interest_update_per_client_uuid[second_client_uuid].get_visible_entity_indexes().tolist())
+
+		spatial_index.set_positions(
+			entity_indexes=[1, 2],
+			positions=[(18, 0), (4, 0)]
+		)
+
+		client_interest_update_per_client_uuid = get_client_interest_update_per_client_uuid(
+			client_interest_manager=client_interest_manager
+		)
+
+		self.assertEqual([2], client_interest_update_per_client_uuid[first_client_uuid].get_entered_entity_indexes().tolist())
+		self.assertEqual([1], client_interest_update_per_client_uuid[first_client_uuid].get_left_entity_indexes().tolist())
+		self.assertEqual([0, 2], client_interest_update_per_client_uuid[first_client_uuid].get_visible_entity_indexes().tolist())
+		self.assertEqual([1], client_interest_update_per_client_uuid[second_client_uuid].get_entered_entity_indexes().tolist())
+		self.assertEqual([2], client_interest_update_per_client_uuid[second_client_uuid].get_left_entity_indexes().tolist())
+
+		spatial_index.remove_entities(
+			entity_indexes=[0]
+		)
+
+		client_interest_update_per_client_uuid = get_client_interest_update_per_client_uuid(
+			client_interest_manager=client_interest_manager
+		)
+
+		self.assertEqual([], client_interest_update_per_client_uuid[first_client_uuid].get_entered_entity_indexes().tolist())
+		self.assertEqual([0], client_interest_update_per_client_uuid[first_client_uuid].get_left_entity_indexes().tolist())
+		self.assertEqual([2], client_interest_manager.get_visible_entity_indexes(client_uuid=first_client_uuid).tolist())
+
+	def test_moving_client_interest(self):
+
+		spatial_index = UniformGridSpatialIndex(
+			dimensions_total=2,
+			cell_size=2.0
+		)
+		spatial_index.set_positions(
+			entity_indexes=np.arange(100),
+			positions=np.stack((np.arange(100, dtype=np.float64), np.zeros(100)), axis=1)
+		)
+		client_interest_manager = ClientInterestManager(
+			spatial_index=spatial_index
+		)
+		client_uuid = str(uuid.uuid4())
+
+		visible_entity_indexes = set()  # type: Set[int]
+		for x in range(0, 100, 3):
+			client_interest_manager.set_client_interest(
+				client_uuid=client_uuid,
+				position=(x, 0),
+				radius=4.0
+			)
+			client_interest_update = client_interest_manager.update()[0]
+			visible_entity_indexes |= set(client_interest_update.get_entered_entity_indexes().tolist())
+			visible_entity_indexes -= set(client_interest_update.get_left_entity_indexes().tolist())
+			self.assertEqual(set(range(max(0, x - 4), min(100, x + 5))), visible_entity_indexes)
+			self.assertEqual(sorted(visible_entity_indexes), client_interest_update.get_visible_entity_indexes().tolist())
+
+	def test_remove_client(self):
+
+		client_interest_manager = ClientInterestManager(
+			spatial_index=UniformGridSpatialIndex(
+				dimensions_total=2,
+				cell_size=1.0
+			)
+		)
+		client_uuid = str(uuid.uuid4())
+		client_interest_manager.set_client_interest(
+			client_uuid=client_uuid,
+			position=(0, 0),
+			radius=1.0
+		)
+
+		self.assertEqual([client_uuid], client_interest_manager.get_client_uuids())
+		self.assertTrue(client_interest_manager.remove_client(
+			client_uuid=client_uuid
+		))
+		self.assertFalse(client_interest_manager.remove_client(
+			client_uuid=client_uuid
+		))
+		self.assertEqual([], client_interest_manager.update())
@@ -0,0 +1,161 @@
+from __future__ import annotations
+import unittest
+from typing import List, Tuple, Dict, Callable, Type, Set
+import time
+import socket
+from src.austin_heller_repo.game_manager import DatagramChannelServer, DatagramChannelClient, DatagramChannelPacket, DatagramChannelPacketTypeEnum
+
+
+class DatagramChannelTest(unittest.TestCase):
+
+	def test_is_newer_sequence(self):
+
+		self.assertTrue(DatagramChannelPacket.is_newer_sequence(
+			sequence=2,
+			previous_sequence=1
+		))
+		self.assertFalse(DatagramChannelPacket.is_newer_sequence(
+			sequence=1,
+			previous_sequence=1
+		))
+		self.assertFalse(DatagramChannelPacket.is_newer_sequence(
+			sequence=1,
+			previous_sequence=2
+		))
+		self.assertTrue(DatagramChannelPacket.is_newer_sequence(
+			sequence=0,
+			previous_sequence=DatagramChannelPacket.maximum_sequence
+		))
+
+	def test_bind_and_send(self):
+
+		server_received_datagrams = []  # type: List[Tuple[str, bytes]]
+		client_received_datagrams = []  # type: List[bytes]
+
+		datagram_channel_server = DatagramChannelServer(
+			host="127.0.0.1",
+			port=0,
+			bind_token_time_to_live_seconds=5.0,
+			on_datagram_received=lambda client_uuid, datagram_bytes: server_received_datagrams.append((client_uuid, datagram_bytes))
+		)
+		datagram_channel_server.start()
+
+		datagram_channel_client = DatagramChannelClient(
+			host="127.0.0.1",
+			port=datagram_channel_server.get_port(),
+			bind_token=datagram_channel_server.add_bind_token(
+				client_uuid="client"
+			),
+			on_datagram_received=client_received_datagrams.append
+		)
+		datagram_channel_client.connect_to_server()
+
+		self.assertTrue(datagram_channel_server.is_client_bound(
+			client_uuid="client"
+		))
+
+		for index in range(3):
+			datagram_channel_client.send_to_server(
+				datagram_bytes=bytes([index])
+			)
+		self.assertTrue(datagram_channel_server.send_to_client(
+			client_uuid="client",
+			datagram_bytes=b"state"
+		))
+		self.assertFalse(datagram_channel_server.send_to_client(
+			client_uuid="unbound",
+			datagram_bytes=b"state"
+		))
+
+		time.sleep(0.2)
+
+		self.assertEqual([("client", b"\x00"), ("client", b"\x01"), ("client", b"\x02")], server_received_datagrams)
+		self.assertEqual([b"state"], client_received_datagrams)
+
+		datagram_channel_client.dispose()
+		datagram_channel_server.dispose()
+
+	def test_stale_and_unbound_datagrams_are_dropped(self):
+
+		server_received_datagrams = []  # type: List[Tuple[str, bytes]]
+
+		datagram_channel_server = DatagramChannelServer(
+			host="127.0.0.1",
+			port=0,
+			bind_token_time_to_live_seconds=5.0,
+			on_datagram_received=lambda client_uuid, datagram_bytes: server_received_datagrams.append((client_uuid, datagram_bytes))
+		)
+		datagram_channel_server.start()
+
+		client_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+		client_socket.settimeout(1.0)
+		client_socket.connect(("127.0.0.1", datagram_channel_server.get_port()))
+
+		client_socket.send(DatagramChannelPacket.header_struct.pack(DatagramChannelPacketTypeEnum.Data.value, 1) + b"unbound")
+		client_socket.send(DatagramChannelPacket.header_struct.pack(DatagramChannelPacketTypeEnum.Bind.value, 0) + b"wrong token")
+		client_socket.send(DatagramChannelPacket.header_struct.pack(DatagramChannelPacketTypeEnum.Bind.value, 0) + datagram_channel_server.add_bind_token(
+			client_uuid="client"
+		).encode())
+
+		packet_type_value, _ = DatagramChannelPacket.header_struct.unpack(client_socket.recv(65535))
+		self.assertEqual(DatagramChannelPacketTypeEnum.BindAcknowledgement.value, packet_type_value)
+
+		for sequence in [5, 3, 5, 6]:
+			client_socket.send(DatagramChannelPacket.header_struct.pack(DatagramChannelPacketTypeEnum.Data.value, sequence) + bytes([sequence]))
+
+		time.sleep(0.2)
+
+		self.assertEqual([("client", b"\x05"), ("client", b"\x06")], server_received_datagrams)
+		self.assertEqual(4, datagram_channel_server.get_dropped_datagrams_total())
+
+		datagram_channel_server.remove_client(
+			client_uuid="client"
+		)
+		client_socket.send(DatagramChannelPacket.header_struct.pack(DatagramChannelPacketTypeEnum.Data.value, 7) + b"\x07")
+
+		time.sleep(0.2)
+
+		self.assertEqual(2, len(server_received_datagrams))
+
+		client_socket.close()
+		datagram_channel_server.dispose()
+
+	def test_removed_client_bind_tokens_are_revoked(self):
+
+		datagram_channel_server = DatagramChannelServer(
+			host="127.0.0.1",
+			port=0,
+			bind_token_time_to_live_seconds=5.0,
+			on_datagram_received=lambda client_uuid, datagram_bytes: None
+		)
+		datagram_channel_server.start()
+
+		removed_bind_token = datagram_channel_server.add_bind_token(
+			client_uuid="removed client"
+		)
+		kept_bind_token = datagram_channel_server.add_bind_token(
+			client_uuid="kept client"
+		)
+		datagram_channel_server.remove_client(
+			client_uuid="removed client"
+		)
+
+		client_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+		client_socket.settimeout(1.0)
+		client_socket.connect(("127.0.0.1", datagram_channel_server.get_port()))
+
+		client_socket.send(DatagramChannelPacket.header_struct.pack(DatagramChannelPacketTypeEnum.Bind.value, 0) + removed_bind_token.encode())
+		client_socket.send(DatagramChannelPacket.header_struct.pack(DatagramChannelPacketTypeEnum.Bind.value, 0) + kept_bind_token.encode())
+
+		packet_type_value, _ = DatagramChannelPacket.header_struct.unpack(client_socket.recv(65535))
+		self.assertEqual(DatagramChannelPacketTypeEnum.BindAcknowledgement.value, packet_type_value)
+		self.assertFalse(datagram_channel_server.is_client_bound(
+			client_uuid="removed client"
+		))
+		self.assertTrue(datagram_channel_server.is_client_bound(
+			client_uuid="kept client"
+		))
+		self.assertEqual(1, datagram_channel_server.get_dropped_datagrams_total())
+
+		client_socket.close()
+		datagram_channel_server.dispose()
@@ -0,0 +1,156 @@
+from __future__ import annotations
+import unittest
+from typing import List, Tuple, Dict, Callable, Type, Set
+import time
+import logging
+from datetime import datetime
+from src.austin_heller_repo.game_manager import DeadlineScheduler
+from austin_heller_repo.threading import Semaphore
+
+
+class DeadlineSchedulerTest(unittest.TestCase):
+
+	def test_initialize(self):
+
+		deadline_scheduler = DeadlineScheduler(
+			worker_threads_total=1
+		)
+
+		self.assertIsNotNone(deadline_scheduler)
+
+	def test_deadlines_expire_in_order(self):
+
+		deadline_scheduler = DeadlineScheduler(
+			worker_threads_total=1
+		)
+		deadline_scheduler.start()
+
+		expired_deadline_keys = []  # type: List[str]
+		expired_deadline_keys_semaphore = Semaphore()
+
+		def get_callback(deadline_key: str):
+			def callback():
+				expired_deadline_keys_semaphore.acquire()
+				expired_deadline_keys.append(deadline_key)
+				expired_deadline_keys_semaphore.release()
+			return callback
+
+		for deadline_key, delay_seconds in [("third", 0.3), ("first", 0.1), ("second", 0.2)]:
+			deadline_scheduler.schedule(
+				deadline_key=deadline_key,
+				delay_seconds=delay_seconds,
+				callback=get_callback(deadline_key)
+			)
+
+		self.assertEqual(3, deadline_scheduler.get_pending_deadlines_total())
+
+		time.sleep(0.5)
+
+		deadline_scheduler.dispose()
+
+		self.assertEqual(["first", "second", "third"], expired_deadline_keys)
+		self.assertEqual(0, deadline_scheduler.get_pending_deadlines_total())
+
+	def test_cancel(self):
+
+		deadline_scheduler = DeadlineScheduler(
+			worker_threads_total=2
+		)
+		deadline_scheduler.start()
+
+		callback_total = 0
+
+		def callback():
+			nonlocal callback_total
+			callback_total += 1
+
+		deadline_scheduler.schedule(
+			deadline_key="cancelled",
+			delay_seconds=0.1,
+			callback=callback
+		)
+
+		self.assertTrue(deadline_scheduler.cancel(
+			deadline_key="cancelled"
+		))
+		self.assertFalse(deadline_scheduler.cancel(
+			deadline_key="cancelled"
+		))
+
+		time.sleep(0.3)
+
+		deadline_scheduler.dispose()
+
+		self.assertEqual(0, callback_total)
+
+	def test_many_deadlines(self):
+
+		deadlines_total = 10000
+
+		deadline_scheduler = DeadlineScheduler(
+			worker_threads_total=4
+		)
+		deadline_scheduler.start()
+
+		callback_total = 0
+		callback_total_semaphore = Semaphore()
+
+		def callback():
+			nonlocal callback_total
+			callback_total_semaphore.acquire()
+			callback_total += 1
+			callback_total_semaphore.release()
+
+		start_time = datetime.utcnow()
+		for deadline_index in range(deadlines_total):
+			deadline_scheduler.schedule(
+				deadline_key=str(deadline_index),
+				delay_seconds=0.5,
+				callback=callback
+			)
+		end_time = datetime.utcnow()
+
+		print(f"{datetime.utcnow()}: test: scheduled {deadlines_total} deadlines in {(end_time - start_time).total_seconds()} seconds")
+
+		for deadline_index in range(0, deadlines_total, 2):
+			deadline_scheduler.cancel(
+				deadline_key=str(deadline_index)
+			)
+
+		time.sleep(1.5)
+
+		deadline_scheduler.dispose()
+
+		self.assertEqual(deadlines_total // 2, callback_total)
+
+	def test_failing_callback_is_logged(self):
+
+		log_records = []  # type: List[logging.LogRecord]
+		logger = logging.Logger("deadline_scheduler_test")
+		log_handler = logging.Handler()
+		log_handler.emit = log_records.append
+		logger.addHandler(log_handler)
+
+		deadline_scheduler = DeadlineScheduler(
+			worker_threads_total=1,
+			logger=logger
+		)
+		deadline_scheduler.start()
+
+		def callback():
+			raise Exception(f"Failed callback.")
+
+		deadline_scheduler.schedule(
+			deadline_key="failing",
+			delay_seconds=0.05,
+			callback=callback
+		)
+
+		time.sleep(0.2)
+
+		deadline_scheduler.dispose()
+
+		self.assertEqual(1, len(log_records))
+		self.assertEqual(logging.ERROR, log_records[0].levelno)
+		self.assertIn("Failed callback.", log_records[0].getMessage())
+		self.assertIsNotNone(log_records[0].exc_info)
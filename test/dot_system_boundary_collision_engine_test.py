@@ -0,0 +1,204 @@
+from __future__ import annotations
+import unittest
+import math
+import random
+from typing import List, Tuple, Dict, Callable, Type, Set
+import numpy as np
+from src.austin_heller_repo.kinematics import DotSystem, DotSystemBoundaryCollisionEngine, get_polynomial_real_roots
+
+
+def get_dot_system(*, dots_total: int, seed: int) -> DotSystem:
+	random_instance = random.Random(seed)
+	dot_system = DotSystem(
+		dimensions_total=2
+	)
+	for dot_index in range(dots_total):
+		dot_system.add_dot(
+			position=(random_instance.uniform(1, 9), random_instance.uniform(1, 9)),
+			velocity=(random_instance.uniform(-3, 3), random_instance.uniform(-3, 3)),
+			acceleration=(0, -1)
+		)
+	return dot_system
+
+
+class DotSystemBoundaryCollisionEngineTest(unittest.TestCase):
+
+	def test_polynomial_real_roots(self):
+
+		roots = get_polynomial_real_roots(
+			coefficients=[
+				(-6, 11, -6, 1),  # (t - 1)(t - 2)(t - 3)
+				(-4, 0, 1, 0),  # (t - 2)(t + 2)
+				(1, 0, 1, 0),  # no real roots
+				(-3, 2, 0, 0),  # 2t - 3
+				(5, 0, 0, 0)  # constant
+			]
+		)
+
+		np.testing.assert_allclose([1, 2, 3], np.sort(roots[0]))
+		np.testing.assert_allclose([-2, 2], np.sort(roots[1][~np.isnan(roots[1])]))
+		self.assertTrue(np.isnan(roots[2]).all())
+		np.testing.assert_allclose([1.5], roots[3][~np.isnan(roots[3])])
+		self.assertTrue(np.isnan(roots[4]).all())
+
+	def test_falling_dot_bounces_at_exact_impact_time(self):
+
+		dot_system = DotSystem(
+			dimensions_total=2
+		)
+		dot_system.add_dot(
+			position=(1, 9),
+			velocity=(1, 0),
+			acceleration=(0, -1)
+		)
+		collision_engine = DotSystemBoundaryCollisionEngine(
+			dot_system=dot_system,
+			minimum_position=(0, 0),
+			maximum_position=(10, 10)
+		)
+
+		collision_time_indexes, dimension_indexes = collision_engine.get_next_collisions(
+			time_index=0.0
+		)
+
+		self.assertAlmostEqual(math.sqrt(18), collision_time_indexes[0])
+		self.assertEqual(1, dimension_indexes[0])
+
+		collisions_total = collision_engine.advance(
+			from_time_index=0.0,
+			to_time_index=5.0
+		)
+
+		self.assertEqual(1, collisions_total)
+		positions = dot_system.get_positions(
+			time_index=math.sqrt(18)
+		)
+		self.assertAlmostEqual(0.0, positions[0][1])
+		velocities = dot_system.get_velocities(
+			time_index=math.sqrt(18)
+		)
+		self.assertAlmostEqual(math.sqrt(18), velocities[0][1])
+
+	def test_dot_moving_away_from_bounds_has_no_collision(self):
+
+		dot_system = DotSystem(
+			dimensions_total=2
+		)
+		dot_system.add_dot(
+			position=(5, 5),
+			velocity=(0, 0),
+			acceleration=(0, 0)
+		)
+		collision_engine = DotSystemBoundaryCollisionEngine(
+			dot_system=dot_system,
+			minimum_position=(0, 0),
+			maximum_position=(10, 10)
+		)
+
+		collision_time_indexes, dimension_indexes = collision_engine.get_next_collisions(
+			time_index=0.0
+		)
+
+		self.assertEqual(math.inf, collision_time_indexes[0])
+		self.assertEqual(-1, dimension_indexes[0])
+
+	def test_collision_during_acceleration_delta_segment(self):
+
+		dot_system = DotSystem(
+			dimensions_total=2
+		)
+		dot_system.add_dot(
+			position=(5, 5),
+			velocity=(0, 0),
+			acceleration=(0, 0)
+		)
+		dot_system.set_acceleration_delta(
+			dot_indexes=[0],
+			time_index=0.0,
+			acceleration_deltas=[(6, 0)],
+			end_time_index=10.0
+		)
+		collision_engine = DotSystemBoundaryCollisionEngine(
+			dot_system=dot_system,
+			minimum_position=(0, 0),
+			maximum_position=(10, 10)
+		)
+
+		collision_time_indexes, dimension_indexes = collision_engine.get_next_collisions(
+			time_index=0.0
+		)
+
+		# 5 + t ** 3 == 10
+		self.assertAlmostEqual(5 ** (1 / 3), collision_time_indexes[0])
+		self.assertEqual(0, dimension_indexes[0])
+
+	def test_coarse_and_fine_ticks_agree(self):
+
+		dots_total = 200
+		maximum_time_index = 20.0
+		positions_per_time_index_delta = []
+		for time_index_delta in [0.05, 0.5, maximum_time_index]:
+			dot_system = get_dot_system(
+				dots_total=dots_total,
+				seed=1
+			)
+			collision_engine = DotSystemBoundaryCollisionEngine(
+				dot_system=dot_system,
+				minimum_position=(0, 0),
+				maximum_position=(10, 10)
+			)
+			time_index = 0.0
+			while time_index < maximum_time_index:
+				next_time_index = min(time_index + time_index_delta, maximum_time_index)
+				collision_engine.advance(
+					from_time_index=time_index,
+					to_time_index=next_time_index
+				)
+				time_index = next_time_index
+			positions_per_time_index_delta.append(dot_system.get_positions(
+				time_index=maximum_time_index
+			))
+
+		for positions in positions_per_time_index_delta[1:]:
+			np.testing.assert_allclose(positions_per_time_index_delta[0], positions, atol=1e-6)
+
+		self.assertTrue((positions_per_time_index_delta[0] >= -1e-9).all())
+		self.assertTrue((positions_per_time_index_delta[0] <= 10 + 1e-9).all())
+
+	def test_dot_heading_into_corner_reflects_both_dimensions(self):
+
+		dot_system = DotSystem(
+			dimensions_total=2
+		)
+		dot_system.add_dot(
+			position=(5, 5),
+			velocity=(1, 1),
+			acceleration=(0, 0)
+		)
+		collision_engine = DotSystemBoundaryCollisionEngine(
+			dot_system=dot_system,
+			minimum_position=(0, 0),
+			maximum_position=(10, 10)
+		)
+
+		collisions_total = collision_engine.advance(
+			from_time_index=0.0,
+			to_time_index=10.0
+		)
+
+		self.assertEqual(2, collisions_total)
+		np.testing.assert_allclose([(5, 5)], dot_system.get_positions(time_index=10.0))
+		np.testing.assert_allclose([(-1, -1)], dot_system.get_velocities(time_index=10.0))
+
+	def test_mismatched_bounds(self):
+
+		dot_system = DotSystem(
+			dimensions_total=2
+		)
+
+		with self.assertRaises(Exception):
+			DotSystemBoundaryCollisionEngine(
+				dot_system=dot_system,
+				minimum_position=(0, 0, 0),
+				maximum_position=(10, 10, 10)
+			)
@@ -0,0 +1,225 @@
+from __future__ import annotations
+import unittest
+import math
+import random
+from typing import List, Tuple, Dict, Callable, Type, Set
+import numpy as np
+from src.austin_heller_repo.kinematics import DotSystem, DotSystemBoundaryCollisionEngine, DotSystemEventDrivenSimulator
+
+
+def get_dot_system(*, dots_total: int, seed: int) -> DotSystem:
+	random_instance = random.Random(seed)
+	dot_system = DotSystem(
+		dimensions_total=2
+	)
+	for dot_index in range(dots_total):
+		dot_system.add_dot(
+			position=(random_instance.uniform(1, 9), random_instance.uniform(1, 9)),
+			velocity=(random_instance.uniform(-3, 3), random_instance.uniform(-3, 3)),
+			acceleration=(0, -1)
+		)
+	return dot_system
+
+
+def get_simulator(*, dot_system: DotSystem) -> DotSystemEventDrivenSimulator:
+	return DotSystemEventDrivenSimulator(
+		dot_system=dot_system,
+		collision_engine=DotSystemBoundaryCollisionEngine(
+			dot_system=dot_system,
+			minimum_position=(0, 0),
+			maximum_position=(10, 10)
+		)
+	)
+
+
+class DotSystemEventDrivenSimulatorTest(unittest.TestCase):
+
+	def test_initialize(self):
+
+		simulator = get_simulator(
+			dot_system=DotSystem(
+				dimensions_total=2
+			)
+		)
+
+		self.assertIsNotNone(simulator)
+		self.assertEqual(0.0, simulator.get_time_index())
+		self.assertEqual(math.inf, simulator.get_next_event_time_index())
+
+	def test_matches_ticked_collision_engine(self):
+
+		dots_total = 200
+		maximum_time_index = 20.0
+
+		ticked_dot_system = get_dot_system(
+			dots_total=dots_total,
+			seed=3
+		)
+		collision_engine = DotSystemBoundaryCollisionEngine(
+			dot_system=ticked_dot_system,
+			minimum_position=(0, 0),
+			maximum_position=(10, 10)
+		)
+		time_index = 0.0
+		collisions_total = 0
+		while time_index < maximum_time_index:
+			next_time_index = min(time_index + 0.05, maximum_time_index)
+			collisions_total += collision_engine.advance(
+				from_time_index=time_index,
+				to_time_index=next_time_index
+			)
+			time_index = next_time_index
+
+		simulator = get_simulator(
+			dot_system=get_dot_system(
+				dots_total=dots_total,
+				seed=3
+			)
+		)
+		positions = simulator.get_positions(
+			time_index=maximum_time_index
+		)
+
+		np.testing.assert_allclose(ticked_dot_system.get_positions(time_index=maximum_time_index), positions, atol=1e-6)
+		self.assertEqual(collisions_total, simulator.get_processed_events_total())
+		self.assertEqual(maximum_time_index, simulator.get_time_index())
+
+	def test_dot_heading_into_corner_reflects_both_dimensions(self):
+
+		dot_system = DotSystem(
+			dimensions_total=2
+		)
+		dot_system.add_dot(
+			position=(5, 5),
+			velocity=(1, 1),
+			acceleration=(0, 0)
+		)
+		simulator = get_simulator(
+			dot_system=dot_system
+		)
+
+		np.testing.assert_allclose([(5, 5)], simulator.get_positions(time_index=10.0))
+		self.assertEqual(2, simulator.get_processed_events_total())
+		self.assertEqual(15.0, simulator.get_next_event_time_index())
+
+	def test_idle_dots_have_no_events(self):
+
+		dot_system = DotSystem(
+			dimensions_total=2
+		)
+		for dot_index in range(1000):
+			dot_system.add_dot(
+				position=(5, 5),
+				velocity=(0, 0),
+				acceleration=(0, 0)
+			)
+		simulator = get_simulator(
+			dot_system=dot_system
+		)
+
+		self.assertEqual(0, simulator.get_pending_events_total())
+		self.assertEqual(0, simulator.advance(
+			time_index=1000.0
+		))
+
+	def test_cannot_advance_backwards(self):
+
+		simulator = get_simulator(
+			dot_system=get_dot_system(
+				dots_total=1,
+				seed=0
+			)
+		)
+		simulator.advance(
+			time_index=1.0
+		)
+
+		with self.assertRaises(Exception):
+			simulator.advance(
+				time_index=0.5
+			)
+
+	def test_invalidate_dots_replaces_pending_event(self):
+
+		dot_system = DotSystem(
+			dimensions_total=2
+		)
+		dot_system.add_dot(
+			position=(5, 5),
+			velocity=(1, 0),
+			acceleration=(0, 0)
+		)
+		simulator = get_simulator(
+			dot_system=dot_system
+		)
+
+		self.assertEqual(5.0, simulator.get_next_event_time_index())
+
+		simulator.advance(
+			time_index=1.0
+		)
+		dot_system.set_state(
+			dot_indexes=[0],
+			positions=[(6, 5)],
+			velocities=[(2, 0)],
+			accelerations=[(0, 0)],
+			time_index=1.0
+		)
+		simulator.invalidate_dots(
+			dot_indexes=[0]
+		)
+
+		self.assertEqual(3.0, simulator.get_next_event_time_index())
+		self.assertEqual(1, simulator.advance(
+			time_index=6.0
+		))
+		self.assertEqual(1, simulator.get_stale_events_total())
+		self.assertEqual(8.0, simulator.get_next_event_time_index())
+
+	def test_acceleration_delta_end_keeps_trajectory(self):
+
+		dot_system = DotSystem(
+			dimensions_total=2
+		)
+		dot_system.add_dot(
+			position=(5, 5),
+			velocity=(0, 0),
+			acceleration=(0, 0)
+		)
+		dot_system.set_acceleration_delta(
+			dot_indexes=[0],
+			time_index=0.0,
+			acceleration_deltas=[(0.1, 0)],
+			end_time_index=2.0
+		)
+		expected_positions = np.array([dot_system.get_positions(time_index=time_index)[0] for time_index in [1.0, 2.0, 3.0, 4.0]])
+		simulator = get_simulator(
+			dot_system=dot_system
+		)
+
+		self.assertEqual(2.0, simulator.get_next_event_time_index())
+
+		actual_positions = np.array([simulator.get_positions(time_index=time_index)[0] for time_index in [1.0, 2.0, 3.0, 4.0]])
+
+		np.testing.assert_allclose(expected_positions, actual_positions)
+		self.assertEqual(1, simulator.get_processed_events_total())
+		self.assertEqual(math.inf, dot_system.get_acceleration_delta_end_time_indexes()[0])
+
+	def test_add_dot_starts_at_current_time_index(self):
+
+		simulator = get_simulator(
+			dot_system=DotSystem(
+				dimensions_total=2
+			)
+		)
+		simulator.advance(
+			time_index=10.0
+		)
+		dot_index = simulator.add_dot(
+			position=(5, 5),
+			velocity=(1, 0),
+			acceleration=(0, 0)
+		)
+
+		self.assertEqual(15.0, simulator.get_next_event_time_index())
+		np.testing.assert_allclose((6, 5), simulator.get_positions(time_index=11.0)[dot_index])
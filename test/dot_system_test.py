@@ -0,0 +1,251 @@
+from __future__ import annotations
+import unittest
+import random
+from typing import List, Tuple, Dict, Callable, Type, Set
+import numpy as np
+from src.austin_heller_repo.kinematics import Dot, DotSystem
+
+
+def get_random_vector(*, random_instance: random.Random) -> Tuple[float, float]:
+	return (random_instance.uniform(-10, 10), random_instance.uniform(-10, 10))
+
+
+class DotSystemTest(unittest.TestCase):
+
+	def assert_dots_match(self, *, dots: List[Dot], dot_system: DotSystem, time_index: float):
+		positions = dot_system.get_positions(
+			time_index=time_index
+		)
+		velocities = dot_system.get_velocities(
+			time_index=time_index
+		)
+		accelerations = dot_system.get_accelerations(
+			time_index=time_index
+		)
+		for dot_index, dot in enumerate(dots):
+			np.testing.assert_allclose(dot.get_position(time_index=time_index), positions[dot_index], rtol=1e-9, atol=1e-9)
+			np.testing.assert_allclose(dot.get_velocity(time_index=time_index), velocities[dot_index], rtol=1e-9, atol=1e-9)
+			np.testing.assert_allclose(dot.get_acceleration(time_index=time_index), accelerations[dot_index], rtol=1e-9, atol=1e-9)
+
+	def test_initialize(self):
+
+		dot_system = DotSystem(
+			dimensions_total=2
+		)
+
+		self.assertIsNotNone(dot_system)
+		self.assertEqual(0, dot_system.get_dots_total())
+		self.assertEqual((0, 2), dot_system.get_positions(time_index=1.0).shape)
+
+	def test_add_dot_grows_capacity(self):
+
+		dot_system = DotSystem(
+			dimensions_total=2,
+			initial_capacity=1
+		)
+
+		for dot_index in range(100):
+			self.assertEqual(dot_index, dot_system.add_dot(
+				position=(dot_index, 0),
+				velocity=(1, 0),
+				acceleration=(0, -1)
+			))
+
+		self.assertEqual(100, dot_system.get_dots_total())
+		positions = dot_system.get_positions(
+			time_index=2.0
+		)
+		self.assertEqual((99 + 2.0, -2.0), tuple(positions[99]))
+
+	def test_dot_index_out_of_range(self):
+
+		dot_system = DotSystem(
+			dimensions_total=2
+		)
+
+		dot_system.add_dot(
+			position=(0, 0),
+			velocity=(0, 0),
+			acceleration=(0, 0)
+		)
+
+		with self.assertRaises(IndexError):
+			dot_system.get_positions(
+				time_index=0.0,
+				dot_indexes=[1]
+			)
+
+	def test_acceleration_delta_segment_matches_dot(self):
+
+		dot = Dot(
+			position=(1, 9),
+			velocity=(1, 0),
+			acceleration=(0, -1)
+		)
+		dot_system = DotSystem(
+			dimensions_total=2
+		)
+		dot_system.add_dot(
+			position=(1, 9),
+			velocity=(1, 0),
+			acceleration=(0, -1)
+		)
+
+		dot.set_acceleration_delta(
+			time_index=10.0,
+			acceleration_delta=(0, 0.5),
+			end_time_index=5.0
+		)
+		dot_system.set_acceleration_delta(
+			dot_indexes=[0],
+			time_index=10.0,
+			acceleration_deltas=[(0, 0.5)],
+			end_time_index=5.0
+		)
+
+		for time_index in [10.0, 12.5, 14.99, 15.0, 15.01, 20.0]:
+			self.assert_dots_match(
+				dots=[dot],
+				dot_system=dot_system,
+				time_index=time_index
+			)
+
+		np.testing.assert_allclose((0.0, -1.0 + 0.5 * 2.5), dot_system.get_accelerations(time_index=12.5)[0])
+
+	def test_random_operations_match_dot(self):
+
+		random_instance = random.Random(0)
+
+		dots_total = 50
+		dots = []  # type: List[Dot]
+		dot_system = DotSystem(
+			dimensions_total=2
+		)
+		for dot_index in range(dots_total):
+			position = get_random_vector(
+				random_instance=random_instance
+			)
+			velocity = get_random_vector(
+				random_instance=random_instance
+			)
+			acceleration = get_random_vector(
+				random_instance=random_instance
+			)
+			dots.append(Dot(
+				position=position,
+				velocity=velocity,
+				acceleration=acceleration
+			))
+			dot_system.add_dot(
+				position=position,
+				velocity=velocity,
+				acceleration=acceleration
+			)
+
+		time_index = 0.0
+		for step_index in range(200):
+			time_index += random_instance.uniform(0.01, 0.5)
+			dot_index = random_instance.randrange(dots_total)
+			operation_index = random_instance.randrange(5)
+			if operation_index == 0:
+				dots[dot_index].bounce(
+					time_index=time_index
+				)
+				dot_system.bounce(
+					dot_indexes=[dot_index],
+					time_index=time_index
+				)
+			elif operation_index == 1:
+				dots[dot_index].reflect(
+					time_index=time_index
+				)
+				dot_system.reflect(
+					dot_indexes=[dot_index],
+					time_index=time_index
+				)
+			elif operation_index == 2:
+				acceleration_delta = get_random_vector(
+					random_instance=random_instance
+				)
+				end_time_index = random_instance.uniform(0.1, 3.0)
+				dots[dot_index].set_acceleration_delta(
+					time_index=time_index,
+					acceleration_delta=acceleration_delta,
+					end_time_index=end_time_index
+				)
+				dot_system.set_acceleration_delta(
+					dot_indexes=[dot_index],
+					time_index=time_index,
+					acceleration_deltas=[acceleration_delta],
+					end_time_index=end_time_index
+				)
+			elif operation_index == 3:
+				position = get_random_vector(
+					random_instance=random_instance
+				)
+				velocity = get_random_vector(
+					random_instance=random_instance
+				)
+				acceleration = get_random_vector(
+					random_instance=random_instance
+				)
+				dots[dot_index].set_state(
+					position=position,
+					velocity=velocity,
+					acceleration=acceleration,
+					time_index=time_index
+				)
+				dot_system.set_state(
+					dot_indexes=[dot_index],
+					positions=[position],
+					velocities=[velocity],
+					accelerations=[acceleration],
+					time_index=time_index
+				)
+			else:
+				destination_dot_index = (dot_index + 1) % dots_total
+				merge_time_index_offset = random_instance.uniform(0.5, 2.0)
+				dots[dot_index].merge(
+					dot=dots[destination_dot_index],
+					current_time_index=time_index,
+					merge_time_index_offset=merge_time_index_offset
+				)
+				dot_system.merge(
+					dot_indexes=[dot_index],
+					destination_dot_indexes=[destination_dot_index],
+					current_time_index=time_index,
+					merge_time_index_offset=merge_time_index_offset
+				)
+
+			self.assert_dots_match(
+				dots=dots,
+				dot_system=dot_system,
+				time_index=time_index + random_instance.uniform(0.0, 1.0)
+			)
+
+	def test_bounce_many_dots_in_one_call(self):
+
+		dots_total = 1000
+		dot_system = DotSystem(
+			dimensions_total=2
+		)
+		for dot_index in range(dots_total):
+			dot_system.add_dot(
+				position=(dot_index, 10),
+				velocity=(1, 0),
+				acceleration=(0, -1)
+			)
+
+		dot_system.bounce(
+			dot_indexes=np.arange(dots_total),
+			time_index=2.0
+		)
+
+		velocities = dot_system.get_velocities(
+			time_index=2.0
+		)
+		self.assertTrue(np.array_equal(np.full(dots_total, 2.0), velocities[:, 1]))
+		positions = dot_system.get_positions(
+			time_index=2.0
+		)
+		self.assertTrue(np.array_equal(np.full(dots_total, 8.0), positions[:, 1]))
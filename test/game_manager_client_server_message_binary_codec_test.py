@@ -0,0 +1,147 @@
+from __future__ import annotations
+import unittest
+from typing import List, Tuple, Dict, Callable, Type, Set
+import time
+import json
+import uuid
+from datetime import datetime
+from src.austin_heller_repo.game_manager import GameManagerClientServerMessage, GameManagerClientServerMessageBinaryCodec, GameManagerErrorGameManagerClientServerMessage, AuthenticateClientRequestGameManagerClientServerMessage, UrlNavigationNeededResponseGameManagerClientServerMessage, AuthenticateClientResponseGameManagerClientServerMessage, AuthenticationTimeoutErrorGameManagerClientServerMessage, ClientAlreadyAuthenticatedErrorGameManagerClientServerMessage, ClientAuthenticationManagerErrorGameManagerClientServerMessage, ServerBusyErrorGameManagerClientServerMessage, BatchGameManagerClientServerMessage, DatagramChannelBindGameManagerClientServerMessage, EntityInterestUpdateGameManagerClientServerMessage, GameManagerStructureStateEnum
+
+
+def get_client_server_messages() -> List[GameManagerClientServerMessage]:
+	destination_uuid = str(uuid.uuid4())
+	return [
+		GameManagerErrorGameManagerClientServerMessage(
+			structure_state_name=GameManagerStructureStateEnum.UnderMaintenance.value,
+			client_server_message_json=AuthenticateClientRequestGameManagerClientServerMessage(
+				session_token=None
+			).to_json(),
+			destination_uuid=destination_uuid
+		),
+		AuthenticateClientRequestGameManagerClientServerMessage(
+			session_token="Lz3v8q0p8vQn4cC1mT2x7k9aR5eYb6uWd0sJf1hGiKo"
+		),
+		UrlNavigationNeededResponseGameManagerClientServerMessage(
+			url="https://accounts.example.com/o/oauth2/v2/auth?client_id=game&state=1",
+			destination_uuid=destination_uuid
+		),
+		AuthenticateClientResponseGameManagerClientServerMessage(
+			is_successful=True,
+			destination_uuid=destination_uuid,
+			session_token="Lz3v8q0p8vQn4cC1mT2x7k9aR5eYb6uWd0sJf1hGiKo"
+		),
+		AuthenticationTimeoutErrorGameManagerClientServerMessage(
+			destination_uuid=destination_uuid
+		),
+		ClientAlreadyAuthenticatedErrorGameManagerClientServerMessage(
+			destination_uuid=destination_uuid
+		),
+		ClientAuthenticationManagerErrorGameManagerClientServerMessage(
+			message="Unexpected authentication request while in state ünder_maintenance",
+			destination_uuid=destination_uuid
+		),
+		ServerBusyErrorGameManagerClientServerMessage(
+			retry_after_milliseconds=1500,
+			destination_uuid="not-a-uuid"
+		),
+		BatchGameManagerClientServerMessage(
+			client_server_message_jsons=[
+				UrlNavigationNeededResponseGameManagerClientServerMessage(
+					url="https://accounts.example.com/o/oauth2/v2/auth?client_id=game&state=2",
+					destination_uuid=destination_uuid
+				).to_json(),
+				AuthenticateClientResponseGameManagerClientServerMessage(
+					is_successful=False,
+					destination_uuid=destination_uuid
+				).to_json()
+			],
+			destination_uuid=destination_uuid
+		),
+		DatagramChannelBindGameManagerClientServerMessage(
+			bind_token="Q2l2cVd4Yk5uT3VkQ3lqZ2tUZ0x1a2Rk",
+			port=35124,
+			destination_uuid=destination_uuid
+		),
+		EntityInterestUpdateGameManagerClientServerMessage(
+			entered_entity_indexes=[4, 17],
+			left_entity_indexes=[2],
+			entity_jsons=[
+				{"entity_index": 4, "position": [1.5, -2.25]},
+				{"entity_index": 9, "position": [0.0, 3.0]},
+				{"entity_index": 17, "position": [12.0, 7.75]}
+			],
+			destination_uuid=destination_uuid
+		)
+	]
+
+
+class GameManagerClientServerMessageBinaryCodecTest(unittest.TestCase):
+
+	def test_round_trip(self):
+
+		binary_codec = GameManagerClientServerMessageBinaryCodec()
+
+		client_server_messages = get_client_server_messages()
+
+		self.assertEqual(len(GameManagerClientServerMessageBinaryCodec._GameManagerClientServerMessageBinaryCodec__type_id_per_client_server_message_type), len(client_server_messages))
+
+		for client_server_message in client_server_messages:
+			client_server_message_bytes = binary_codec.encode(
+				client_server_message=client_server_message
+			)
+			decoded_client_server_message = binary_codec.decode(
+				client_server_message_bytes=client_server_message_bytes
+			)
+			self.assertIs(type(client_server_message), type(decoded_client_server_message))
+			self.assertEqual(client_server_message.to_json(), decoded_client_server_message.to_json())
+			self.assertLess(len(client_server_message_bytes), len(json.dumps(client_server_message.to_json()).encode()))
+
+	def test_trailing_bytes(self):
+
+		binary_codec = GameManagerClientServerMessageBinaryCodec()
+
+		client_server_message_bytes = binary_codec.encode(
+			client_server_message=AuthenticationTimeoutErrorGameManagerClientServerMessage(
+				destination_uuid=str(uuid.uuid4())
+			)
+		)
+
+		with self.assertRaises(Exception):
+			binary_codec.decode(
+				client_server_message_bytes=client_server_message_bytes + b"\x00"
+			)
+
+	def test_benchmark_against_json(self):
+
+		binary_codec = GameManagerClientServerMessageBinaryCodec()
+
+		client_server_messages = get_client_server_messages()
+		iterations_total = 2000
+
+		json_bytes_total = sum(len(json.dumps(client_server_message.to_json()).encode()) for client_server_message in client_server_messages)
+		binary_bytes_total = sum(len(binary_codec.encode(client_server_message=client_server_message)) for client_server_message in client_server_messages)
+
+		print(f"{datetime.utcnow()}: test: bytes per message: json: {json_bytes_total / len(client_server_messages)}, binary: {binary_bytes_total / len(client_server_messages)}")
+
+		start_time = time.perf_counter()
+		for _ in range(iterations_total):
+			for client_server_message in client_server_messages:
+				GameManagerClientServerMessage.parse_from_json(
+					json_object=json.loads(json.dumps(client_server_message.to_json()).encode())
+				)
+		json_seconds_total = time.perf_counter() - start_time
+
+		start_time = time.perf_counter()
+		for _ in range(iterations_total):
+			for client_server_message in client_server_messages:
+				binary_codec.decode(
+					client_server_message_bytes=binary_codec.encode(
+						client_server_message=client_server_message
+					)
+				)
+		binary_seconds_total = time.perf_counter() - start_time
+
+		messages_total = iterations_total * len(client_server_messages)
+		print(f"{datetime.utcnow()}: test: round trips per second: json: {messages_total / json_seconds_total}, binary: {messages_total / binary_seconds_total}")
+
+		self.assertLess(binary_bytes_total, json_bytes_total)
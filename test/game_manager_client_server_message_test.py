@@ -0,0 +1,77 @@
+from __future__ import annotations
+import unittest
+from typing import List, Tuple, Dict, Callable, Type, Set
+import json
+from src.austin_heller_repo.game_manager import GameManagerClientServerMessage, GameManagerErrorGameManagerClientServerMessage, AuthenticateClientRequestGameManagerClientServerMessage, AuthenticateClientResponseGameManagerClientServerMessage, GameManagerStructureStateEnum, GameManagerClientServerMessageTypeEnum, GameManagerClientServerMessageMeta
+
+
+class GameManagerClientServerMessageTest(unittest.TestCase):
+
+	def test_game_manager_error_nested_client_server_message(self):
+
+		game_manager_error_client_server_message = GameManagerErrorGameManagerClientServerMessage(
+			structure_state_name=GameManagerStructureStateEnum.UnderMaintenance.value,
+			client_server_message_json=AuthenticateClientRequestGameManagerClientServerMessage(
+				session_token="token"
+			).to_json(),
+			destination_uuid="destination"
+		)
+
+		json_string = json.dumps(game_manager_error_client_server_message.to_json())
+
+		self.assertNotIn("\\\"", json_string)
+
+		parsed_client_server_message = GameManagerClientServerMessage.parse_from_json(
+			json_object=json.loads(json_string)
+		)  # type: GameManagerErrorGameManagerClientServerMessage
+
+		self.assertIsInstance(parsed_client_server_message, GameManagerErrorGameManagerClientServerMessage)
+		self.assertEqual(GameManagerStructureStateEnum.UnderMaintenance, parsed_client_server_message.get_structure_state())
+
+		nested_client_server_message = parsed_client_server_message.get_client_server_message()
+
+		self.assertIsInstance(nested_client_server_message, AuthenticateClientRequestGameManagerClientServerMessage)
+		self.assertEqual("token", nested_client_server_message.get_session_token())
+		self.assertIs(nested_client_server_message, parsed_client_server_message.get_client_server_message())
+		self.assertEqual(json.loads(json_string), parsed_client_server_message.to_json())
+
+	def test_declared_fields(self):
+
+		authenticate_client_response_client_server_message = AuthenticateClientResponseGameManagerClientServerMessage(
+			is_successful=True,
+			destination_uuid="destination"
+		)
+
+		self.assertEqual({
+			"__type": GameManagerClientServerMessageTypeEnum.AuthenticateClientResponse.value,
+			"is_successful": True,
+			"destination_uuid": "destination",
+			"session_token": None
+		}, authenticate_client_response_client_server_message.to_json())
+		self.assertTrue(authenticate_client_response_client_server_message.is_successful())
+		self.assertTrue(authenticate_client_response_client_server_message.is_response())
+		self.assertFalse(authenticate_client_response_client_server_message.is_structural_influence())
+		self.assertEqual("destination", authenticate_client_response_client_server_message.get_destination_uuid())
+		self.assertIsNone(AuthenticateClientRequestGameManagerClientServerMessage().get_destination_uuid())
+		self.assertEqual(("is_successful", "destination_uuid", "session_token"), AuthenticateClientResponseGameManagerClientServerMessage.client_server_message_field_names)
+
+		with self.assertRaises(TypeError):
+			AuthenticateClientResponseGameManagerClientServerMessage(
+				destination_uuid="destination"
+			)
+
+		with self.assertRaises(TypeError):
+			AuthenticateClientRequestGameManagerClientServerMessage(
+				destination_uuid="destination"
+			)
+
+	def test_every_client_server_message_type_has_class(self):
+
+		client_server_message_class_per_client_server_message_type = GameManagerClientServerMessageMeta.get_client_server_message_class_per_client_server_message_type()
+
+		for client_server_message_type in GameManagerClientServerMessageTypeEnum:
+			client_server_message_class = GameManagerClientServerMessage.get_client_server_message_class(
+				client_server_message_type=client_server_message_type
+			)
+			self.assertIs(client_server_message_class_per_client_server_message_type[client_server_message_type], client_server_message_class)
+			self.assertEqual(client_server_message_type, client_server_message_class.get_client_server_message_type())
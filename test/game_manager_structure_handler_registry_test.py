@@ -0,0 +1,39 @@
+from __future__ import annotations
+import unittest
+from typing import List, Tuple, Dict, Callable, Type, Set
+from austin_heller_repo.client_authentication_manager import UrlNavigationNeededResponseClientAuthenticationClientServerMessage, AuthenticationResponseClientAuthenticationClientServerMessage
+from src.austin_heller_repo.game_manager import GameManagerStructure, GameManagerClientServerMessageTypeEnum, GameManagerStructureStateEnum, client_authentication_client_server_message_handler, structure_transition
+
+
+class GameManagerStructureHandlerRegistryTest(unittest.TestCase):
+
+	def test_base_registry(self):
+
+		self.assertEqual(4, len(GameManagerStructure.client_authentication_client_server_message_handler_per_client_server_message_type))
+		self.assertIn(UrlNavigationNeededResponseClientAuthenticationClientServerMessage.get_client_server_message_type(), GameManagerStructure.client_authentication_client_server_message_handler_per_client_server_message_type)
+		self.assertEqual(1, len(GameManagerStructure.structure_transitions))
+		self.assertEqual(GameManagerClientServerMessageTypeEnum.AuthenticateClientRequest, GameManagerStructure.structure_transitions[0][0])
+
+	def test_subclass_replaces_handler(self):
+
+		class CustomGameManagerStructure(GameManagerStructure):
+
+			@client_authentication_client_server_message_handler(
+				client_server_message_class=AuthenticationResponseClientAuthenticationClientServerMessage
+			)
+			def custom_authentication_response_received(self, client_server_message: AuthenticationResponseClientAuthenticationClientServerMessage):
+				pass
+
+			@structure_transition(
+				client_server_message_type=GameManagerClientServerMessageTypeEnum.AuthenticateClientRequest,
+				start_structure_state=GameManagerStructureStateEnum.Active,
+				end_structure_state=GameManagerStructureStateEnum.Active
+			)
+			def custom_authenticate_client_request_received(self, structure_influence):
+				pass
+
+		self.assertEqual(4, len(CustomGameManagerStructure.client_authentication_client_server_message_handler_per_client_server_message_type))
+		self.assertIs(CustomGameManagerStructure.custom_authentication_response_received, CustomGameManagerStructure.client_authentication_client_server_message_handler_per_client_server_message_type[AuthenticationResponseClientAuthenticationClientServerMessage.get_client_server_message_type()])
+		self.assertEqual(1, len(CustomGameManagerStructure.structure_transitions))
+		self.assertIs(CustomGameManagerStructure.custom_authenticate_client_request_received, CustomGameManagerStructure.structure_transitions[0][3])
+		self.assertIsNot(GameManagerStructure.client_authentication_client_server_message_handler_per_client_server_message_type, CustomGameManagerStructure.client_authentication_client_server_message_handler_per_client_server_message_type)
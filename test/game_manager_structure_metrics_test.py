@@ -0,0 +1,65 @@
+from __future__ import annotations
+import unittest
+from typing import List, Tuple, Dict, Callable, Type, Set
+import time
+from src.austin_heller_repo.game_manager import LatencyHistogram, GameManagerStructureMetrics
+
+
+class GameManagerStructureMetricsTest(unittest.TestCase):
+
+	def test_latency_histogram(self):
+
+		latency_histogram = LatencyHistogram(
+			bucket_upper_bounds_seconds=(1.0, 0.1, 0.5)
+		)
+
+		for seconds in [0.05, 0.1, 0.3, 0.7, 2.0]:
+			latency_histogram.observe(
+				seconds=seconds
+			)
+
+		latency_histogram_snapshot = latency_histogram.get_snapshot()
+
+		self.assertEqual({"0.1": 2, "0.5": 3, "1.0": 4, "inf": 5}, latency_histogram_snapshot["buckets"])
+		self.assertEqual(5, latency_histogram_snapshot["count"])
+		self.assertAlmostEqual(3.15, latency_histogram_snapshot["sum"])
+
+	def test_authentication_flow(self):
+
+		game_manager_structure_metrics = GameManagerStructureMetrics()
+
+		for authentication_uuid in ["first", "second"]:
+			game_manager_structure_metrics.increment_counter(
+				name="authentication_requests_total"
+			)
+			game_manager_structure_metrics.start_authentication(
+				authentication_uuid=authentication_uuid
+			)
+
+		time.sleep(0.01)
+
+		game_manager_structure_metrics.url_navigation_received(
+			authentication_uuid="first"
+		)
+		game_manager_structure_metrics.authentication_response_received(
+			authentication_uuid="first",
+			is_successful=True
+		)
+		game_manager_structure_metrics.authentication_timed_out(
+			authentication_uuid="second"
+		)
+
+		metrics_snapshot = game_manager_structure_metrics.get_snapshot()
+
+		self.assertEqual(2, metrics_snapshot["counters"]["authentication_requests_total"])
+		self.assertEqual(1, metrics_snapshot["counters"]["authentication_responses_successful_total"])
+		self.assertEqual(1, metrics_snapshot["counters"]["authentication_timeouts_total"])
+		self.assertEqual(1, metrics_snapshot["histograms"]["request_to_url_navigation_seconds"]["count"])
+		self.assertEqual(1, metrics_snapshot["histograms"]["request_to_response_seconds"]["count"])
+		self.assertGreaterEqual(metrics_snapshot["histograms"]["request_to_response_seconds"]["sum"], 0.01)
+		self.assertEqual(0.5, metrics_snapshot["authentication_timeout_rate"])
+
+		with self.assertRaises(KeyError):
+			game_manager_structure_metrics.increment_counter(
+				name="unknown_total"
+			)
@@ -0,0 +1,785 @@
+from __future__ import annotations
+import unittest
+from typing import List, Tuple, Dict, Callable, Type, Set
+import time
+import threading
+import logging
+import os
+import json
+import tempfile
+import shutil
+from datetime import datetime, timezone
+from austin_heller_repo.socket_queued_message_framework import ClientServerMessage, StructureInfluence, Structure
+from austin_heller_repo.client_authentication_manager import AuthenticationResponseClientAuthenticationClientServerMessage, UrlNavigationNeededResponseClientAuthenticationClientServerMessage
+from src.austin_heller_repo.spatial_index import UniformGridSpatialIndex, ClientInterestManager
+from src.austin_heller_repo.game_manager import GameManagerStructure, DatagramChannelServerFactory, DatagramChannelClient, DatagramChannelBindGameManagerClientServerMessage, BatchGameManagerClientServerMessage, AuthenticationTimeoutErrorGameManagerClientServerMessage, EntityInterestUpdateGameManagerClientServerMessage, GameManagerStructureFactory, ShardedAuthenticationStateStore, AuthenticationStateStoreFactory, AuthenticationSessionTokenCacheFactory, AuthenticateClientRequestGameManagerClientServerMessage, AuthenticateClientResponseGameManagerClientServerMessage, ServerBusyErrorGameManagerClientServerMessage, UrlNavigationNeededResponseGameManagerClientServerMessage, StructuredLogFormatter
+
+
+class UnorderedAuthenticationTimeoutErrorGameManagerClientServerMessage(AuthenticationTimeoutErrorGameManagerClientServerMessage, is_ordered=False):
+	pass
+
+
+class RecordingClientMessenger():
+
+	def __init__(self, *, send_blocking_event: threading.Event = None):
+
+		self.__send_blocking_event = send_blocking_event
+
+		self.sent_client_server_messages = []  # type: List[ClientServerMessage]
+		self.send_started_event = threading.Event()
+		self.callback = None  # type: Callable[[ClientServerMessage], None]
+
+	def connect_to_server(self):
+		pass
+
+	def receive_from_server(self, *, callback: Callable[[ClientServerMessage], None], on_exception: Callable[[Exception], None]):
+		self.callback = callback
+
+	def send_to_server(self, *, request_client_server_message: ClientServerMessage):
+		self.send_started_event.set()
+		if self.__send_blocking_event is not None:
+			self.__send_blocking_event.wait()
+		self.sent_client_server_messages.append(request_client_server_message)
+
+	def dispose(self):
+		pass
+
+
+class RecordingClientMessengerFactory():
+
+	def __init__(self, *, first_send_blocking_event: threading.Event = None):
+
+		self.__first_send_blocking_event = first_send_blocking_event
+
+		self.client_messengers = []  # type: List[RecordingClientMessenger]
+
+	def get_client_messenger(self) -> RecordingClientMessenger:
+		# only the first messenger is slow so that the others show whether requests are pipelined around it
+		client_messenger = RecordingClientMessenger(
+			send_blocking_event=None if self.client_messengers else self.__first_send_blocking_event
+		)
+		self.client_messengers.append(client_messenger)
+		return client_messenger
+
+	def get_sent_client_server_messages(self) -> List[ClientServerMessage]:
+		return [client_server_message for client_messenger in self.client_messengers for client_server_message in client_messenger.sent_client_server_messages]
+
+
+class RecordingStructure(Structure):
+
+	# placed after GameManagerStructure in the mro so that it receives whatever the structure hands to the framework
+	def send_response(self, *, client_server_message: ClientServerMessage):
+		if "sent_client_server_messages" not in vars(self):
+			self.sent_client_server_messages = []  # type: List[ClientServerMessage]
+		self.sent_client_server_messages.append(client_server_message)
+
+
+class RecordingGameManagerStructure(GameManagerStructure, RecordingStructure):
+	pass
+
+
+class RecordingAuthenticationStateStore(ShardedAuthenticationStateStore):
+
+	def __init__(self):
+		super().__init__(
+			shards_total=1
+		)
+
+		self.refreshed_client_uuids = []  # type: List[str]
+
+	def refresh_client(self, *, client_uuid: str):
+		self.refreshed_client_uuids.append(client_uuid)
+		super().refresh_client(
+			client_uuid=client_uuid
+		)
+
+
+class RecordingAuthenticationStateStoreFactory(AuthenticationStateStoreFactory):
+
+	def __init__(self):
+
+		self.authentication_state_store = RecordingAuthenticationStateStore()
+
+	def get_authentication_state_store(self) -> RecordingAuthenticationStateStore:
+		return self.authentication_state_store
+
+
+class RecordingLogHandler(logging.Handler):
+
+	def __init__(self):
+		super().__init__()
+
+		self.log_records = []  # type: List[logging.LogRecord]
+
+	def emit(self, record: logging.LogRecord):
+		self.log_records.append(record)
+
+	def get_log_records(self, *, message_prefix: str) -> List[logging.LogRecord]:
+		return [log_record for log_record in self.log_records if log_record.getMessage().startswith(message_prefix)]
+
+
+class GameManagerStructureTestCase(unittest.TestCase):
+
+	def setUp(self):
+
+		self.client_messenger_factory = RecordingClientMessengerFactory()
+		self.game_manager_structure = None  # type: RecordingGameManagerStructure
+
+	def start_game_manager_structure(self, **kwargs) -> RecordingGameManagerStructure:
+		kwargs.setdefault("authentication_timeout_seconds", 10.0)
+		kwargs.setdefault("client_authentication_client_messenger_factory", self.client_messenger_factory)
+		self.game_manager_structure = RecordingGameManagerStructure(**kwargs)
+		# disposing is idempotent, so tests that dispose early to flush the structure are still cleaned up
+		self.addCleanup(self.game_manager_structure.dispose)
+		return self.game_manager_structure
+
+	def authenticate_client_request(self, *, client_uuid: str, session_token: str = None):
+		self.game_manager_structure.update_structure(
+			structure_influence=StructureInfluence(
+				client_server_message=AuthenticateClientRequestGameManagerClientServerMessage(
+					session_token=session_token
+				),
+				source_uuid=client_uuid
+			)
+		)
+
+	def receive_url_navigation_needed_response(self, *, url: str, sent_client_server_message_index: int = -1):
+		self.client_messenger_factory.client_messengers[0].callback(UrlNavigationNeededResponseClientAuthenticationClientServerMessage(
+			url=url,
+			external_metadata_json=self.client_messenger_factory.get_sent_client_server_messages()[sent_client_server_message_index].get_external_metadata_json()
+		))
+
+	def receive_authentication_response(self, *, authentication_id: str = "authentication_id", sent_client_server_message_index: int = -1, client_messenger_index: int = 0):
+		# the response is correlated by the authentication_uuid in its metadata, so it may arrive on any messenger
+		self.client_messenger_factory.client_messengers[client_messenger_index].callback(AuthenticationResponseClientAuthenticationClientServerMessage(
+			is_successful=True,
+			authentication_id=authentication_id,
+			external_metadata_json=self.client_messenger_factory.get_sent_client_server_messages()[sent_client_server_message_index].get_external_metadata_json()
+		))
+
+	def authenticate_client(self, *, client_uuid: str, authentication_id: str = "authentication_id"):
+		self.authenticate_client_request(
+			client_uuid=client_uuid
+		)
+		self.receive_authentication_response(
+			authentication_id=authentication_id
+		)
+
+	def get_sent_client_server_messages(self) -> List[ClientServerMessage]:
+		return vars(self.game_manager_structure).setdefault("sent_client_server_messages", [])
+
+	def get_unbatched_client_server_messages(self) -> List[ClientServerMessage]:
+		unbatched_client_server_messages = []  # type: List[ClientServerMessage]
+		for client_server_message in self.get_sent_client_server_messages():
+			if isinstance(client_server_message, BatchGameManagerClientServerMessage):
+				unbatched_client_server_messages.extend(client_server_message.get_client_server_messages())
+			else:
+				unbatched_client_server_messages.append(client_server_message)
+		return unbatched_client_server_messages
+
+	def get_session_token(self) -> str:
+		return [client_server_message for client_server_message in self.get_sent_client_server_messages() if isinstance(client_server_message, AuthenticateClientResponseGameManagerClientServerMessage)][-1].get_session_token()
+
+	def assert_metrics(self, *, counters: Dict[str, int] = None, gauges: Dict[str, object] = None):
+		metrics_snapshot = self.game_manager_structure.get_metrics_snapshot()
+		for metrics_name, expected_value_per_name in [("counters", counters), ("gauges", gauges)]:
+			if expected_value_per_name is not None:
+				self.assertEqual(expected_value_per_name, {name: metrics_snapshot[metrics_name][name] for name in expected_value_per_name})
+
+
+class GameManagerStructureTest(GameManagerStructureTestCase):
+
+	def test_initialize(self):
+
+		self.assertIsNotNone(self.start_game_manager_structure())
+		self.assertIsInstance(GameManagerStructureFactory(
+			authentication_timeout_seconds=1.0,
+			client_authentication_client_messenger_factory=self.client_messenger_factory
+		), GameManagerStructureFactory)
+
+	def test_pending_authentication_cap_is_checked_after_resumes(self):
+
+		self.start_game_manager_structure(
+			authentication_session_token_cache_factory=AuthenticationSessionTokenCacheFactory(
+				time_to_live_seconds=60.0,
+				maximum_session_tokens_total=10
+			),
+			maximum_pending_authentications_total=1,
+			server_busy_retry_after_seconds=0.5
+		)
+
+		self.authenticate_client(
+			client_uuid="authenticated"
+		)
+		session_token = self.get_session_token()
+		self.game_manager_structure.client_disconnected(
+			client_uuid="authenticated"
+		)
+		self.authenticate_client_request(
+			client_uuid="first"
+		)
+		self.authenticate_client_request(
+			client_uuid="second",
+			session_token="unknown_session_token"
+		)
+
+		server_busy_error = self.get_sent_client_server_messages()[-1]  # type: ServerBusyErrorGameManagerClientServerMessage
+		self.assertIsInstance(server_busy_error, ServerBusyErrorGameManagerClientServerMessage)
+		self.assertEqual("second", server_busy_error.get_destination_uuid())
+		self.assertEqual(500, server_busy_error.get_retry_after_milliseconds())
+		self.assert_metrics(
+			gauges={"pending_authentications_total": 1}
+		)
+
+		# a retry from the pending client joins its authentication and a resume needs no pending authentication, so neither is capped
+		self.authenticate_client_request(
+			client_uuid="first"
+		)
+		self.authenticate_client_request(
+			client_uuid="resumed",
+			session_token=session_token
+		)
+
+		self.assertIsInstance(self.get_sent_client_server_messages()[-1], AuthenticateClientResponseGameManagerClientServerMessage)
+		self.assertEqual("resumed", self.get_sent_client_server_messages()[-1].get_destination_uuid())
+		self.assertEqual(2, len(self.client_messenger_factory.get_sent_client_server_messages()))
+		self.assert_metrics(
+			counters={
+				"authentication_requests_rejected_busy_total": 1,
+				"authentication_requests_coalesced_total": 1,
+				"authentication_requests_resumed_total": 1
+			},
+			gauges={"pending_authentications_total": 1}
+		)
+
+	def test_resume_while_pending_cancels_pending_authentication(self):
+
+		self.start_game_manager_structure(
+			authentication_session_token_cache_factory=AuthenticationSessionTokenCacheFactory(
+				time_to_live_seconds=60.0,
+				maximum_session_tokens_total=10
+			)
+		)
+
+		self.authenticate_client(
+			client_uuid="first"
+		)
+		session_token = self.get_session_token()
+		self.game_manager_structure.client_disconnected(
+			client_uuid="first"
+		)
+
+		# the reconnected client starts a fresh authentication before remembering its session token
+		self.authenticate_client_request(
+			client_uuid="second"
+		)
+
+		self.assert_metrics(
+			gauges={"pending_authentications_total": 1}
+		)
+
+		self.authenticate_client_request(
+			client_uuid="second",
+			session_token=session_token
+		)
+
+		self.assertIsInstance(self.get_sent_client_server_messages()[-1], AuthenticateClientResponseGameManagerClientServerMessage)
+		self.assertTrue(self.get_sent_client_server_messages()[-1].is_successful())
+		self.assertEqual("authentication_id", self.game_manager_structure.get_authentication_id(
+			client_uuid="second"
+		))
+		self.assert_metrics(
+			gauges={
+				"pending_authentications_total": 0,
+				"scheduled_deadlines_total": 0,
+				"outstanding_authentications_per_replica": [0]
+			}
+		)
+
+		# the superseded authentication finishing upstream is ignored
+		sent_client_server_messages_total = len(self.get_sent_client_server_messages())
+		self.receive_authentication_response(
+			authentication_id="other_authentication_id",
+			sent_client_server_message_index=1
+		)
+
+		self.assertEqual(sent_client_server_messages_total, len(self.get_sent_client_server_messages()))
+		self.assertEqual("authentication_id", self.game_manager_structure.get_authentication_id(
+			client_uuid="second"
+		))
+
+	def test_active_client_survives_session_idle_sweep(self):
+
+		self.start_game_manager_structure(
+			session_idle_timeout_seconds=0.3,
+			session_idle_sweep_seconds=0.05
+		)
+
+		for client_uuid in ["active", "quiet"]:
+			self.authenticate_client(
+				client_uuid=client_uuid,
+				authentication_id=f"{client_uuid}_authentication_id"
+			)
+
+		# any inbound message counts as activity, even one that is answered with an error
+		for index in range(8):
+			time.sleep(0.1)
+			self.authenticate_client_request(
+				client_uuid="active"
+			)
+
+		self.assertEqual("active_authentication_id", self.game_manager_structure.get_authentication_id(
+			client_uuid="active"
+		))
+		self.assertIsNone(self.game_manager_structure.get_authentication_id(
+			client_uuid="quiet"
+		))
+		self.assertEqual(1, self.game_manager_structure.get_authenticated_sessions_total())
+
+	def test_session_refresh_is_throttled(self):
+
+		authentication_state_store_factory = RecordingAuthenticationStateStoreFactory()
+		self.start_game_manager_structure(
+			authentication_state_store_factory=authentication_state_store_factory,
+			session_idle_timeout_seconds=0.4
+		)
+
+		self.authenticate_client(
+			client_uuid="first"
+		)
+		for _ in range(10):
+			self.authenticate_client_request(
+				client_uuid="first"
+			)
+
+		# the request that started the authentication used up the refresh of its interval
+		self.assertEqual(["first"], authentication_state_store_factory.authentication_state_store.refreshed_client_uuids)
+
+		time.sleep(0.15)
+		for _ in range(10):
+			self.authenticate_client_request(
+				client_uuid="first"
+			)
+
+		self.assertEqual(["first", "first"], authentication_state_store_factory.authentication_state_store.refreshed_client_uuids)
+
+	def test_client_disconnected_releases_client_state(self):
+
+		self.start_game_manager_structure()
+
+		self.authenticate_client(
+			client_uuid="authenticated"
+		)
+		self.authenticate_client_request(
+			client_uuid="pending"
+		)
+
+		self.assert_metrics(
+			gauges={
+				"pending_authentications_total": 1,
+				"authenticated_sessions_total": 1,
+				"outstanding_authentications_per_replica": [1]
+			}
+		)
+
+		for client_uuid in ["authenticated", "pending"]:
+			self.game_manager_structure.client_disconnected(
+				client_uuid=client_uuid
+			)
+
+		self.assert_metrics(
+			gauges={
+				"pending_authentications_total": 0,
+				"authenticated_sessions_total": 0,
+				"scheduled_deadlines_total": 0,
+				"outstanding_authentications_per_replica": [0]
+			}
+		)
+
+	def test_authentication_is_logged_with_structured_fields(self):
+
+		log_handler = RecordingLogHandler()
+		self.start_game_manager_structure(
+			authentication_timeout_seconds=0.1,
+			log_handler=log_handler,
+			is_debug=True
+		)
+
+		self.authenticate_client(
+			client_uuid="successful"
+		)
+		self.authenticate_client_request(
+			client_uuid="timed_out"
+		)
+
+		time.sleep(0.3)
+
+		# disposing flushes the asynchronous log handler
+		self.game_manager_structure.dispose()
+
+		authentication_uuids = [client_server_message.get_external_metadata_json()["authentication_uuid"] for client_server_message in self.client_messenger_factory.get_sent_client_server_messages()]
+		for message_prefix, expected_client_uuids, expected_authentication_uuids in [
+			("start_authentication: started", ["successful", "timed_out"], authentication_uuids),
+			("authentication_response_received: is_successful: True", ["successful"], authentication_uuids[:1]),
+			("authentication_timeout: send_response: start", ["timed_out"], authentication_uuids[1:])
+		]:
+			log_records = log_handler.get_log_records(
+				message_prefix=message_prefix
+			)
+			self.assertEqual(expected_client_uuids, [log_record.client_uuid for log_record in log_records])
+			self.assertEqual(expected_authentication_uuids, [log_record.authentication_uuid for log_record in log_records])
+
+		started_log_record = log_handler.get_log_records(
+			message_prefix="start_authentication: started"
+		)[0]
+		formatted_json = json.loads(StructuredLogFormatter().format(started_log_record))
+		self.assertEqual("successful", formatted_json["client_uuid"])
+		self.assertEqual(datetime.fromtimestamp(started_log_record.created, tz=timezone.utc), datetime.fromisoformat(formatted_json["time"]))
+
+	def test_nothing_is_logged_without_debug(self):
+
+		log_handler = RecordingLogHandler()
+		self.start_game_manager_structure(
+			log_handler=log_handler
+		)
+
+		self.authenticate_client(
+			client_uuid="successful"
+		)
+
+		self.game_manager_structure.dispose()
+
+		self.assertEqual([], log_handler.log_records)
+
+	def test_duplicate_requests_share_one_authentication_and_are_answered_once(self):
+
+		self.start_game_manager_structure(
+			authentication_timeout_seconds=0.2,
+			response_batch_flush_seconds=0.05
+		)
+
+		for client_uuid in ["first", "first", "second"]:
+			self.authenticate_client_request(
+				client_uuid=client_uuid
+			)
+		self.receive_url_navigation_needed_response(
+			url="https://example.com/first",
+			sent_client_server_message_index=0
+		)
+		self.authenticate_client_request(
+			client_uuid="first"
+		)
+
+		self.assertEqual(["first", "second"], [client_server_message.get_external_metadata_json()["client_uuid"] for client_server_message in self.client_messenger_factory.get_sent_client_server_messages()])
+		self.assert_metrics(
+			gauges={"scheduled_deadlines_total": 2}
+		)
+
+		self.receive_authentication_response(
+			sent_client_server_message_index=0
+		)
+
+		self.assert_metrics(
+			gauges={"scheduled_deadlines_total": 1}
+		)
+
+		# only the authentication of the second client is left to time out on the shared scheduler
+		time.sleep(0.4)
+
+		unbatched_client_server_messages = self.get_unbatched_client_server_messages()
+		self.assertEqual([UrlNavigationNeededResponseGameManagerClientServerMessage, AuthenticateClientResponseGameManagerClientServerMessage], [type(client_server_message) for client_server_message in unbatched_client_server_messages if client_server_message.get_destination_uuid() == "first"])
+		self.assertEqual([AuthenticationTimeoutErrorGameManagerClientServerMessage], [type(client_server_message) for client_server_message in unbatched_client_server_messages if client_server_message.get_destination_uuid() == "second"])
+		self.assert_metrics(
+			counters={"authentication_requests_coalesced_total": 2},
+			gauges={
+				"scheduled_deadlines_total": 0,
+				"pending_authentications_total": 0
+			}
+		)
+
+	def test_responses_to_a_client_stay_ordered_beside_the_unordered_lane(self):
+
+		self.start_game_manager_structure(
+			authentication_timeout_seconds=0.1,
+			response_batch_flush_seconds=0.3,
+			unordered_response_worker_threads_total=2
+		)
+
+		self.authenticate_client_request(
+			client_uuid="first"
+		)
+		self.receive_url_navigation_needed_response(
+			url="https://example.com/first"
+		)
+
+		# the timeout fires while the url is still waiting in its batch and must not overtake it
+		time.sleep(0.2)
+
+		self.game_manager_structure.send_response(
+			client_server_message=UnorderedAuthenticationTimeoutErrorGameManagerClientServerMessage(
+				destination_uuid="first"
+			)
+		)
+
+		time.sleep(0.05)
+
+		self.assertEqual([UnorderedAuthenticationTimeoutErrorGameManagerClientServerMessage], [type(client_server_message) for client_server_message in self.get_sent_client_server_messages()])
+
+		time.sleep(0.3)
+
+		self.assertEqual([UnorderedAuthenticationTimeoutErrorGameManagerClientServerMessage, UrlNavigationNeededResponseGameManagerClientServerMessage, AuthenticationTimeoutErrorGameManagerClientServerMessage], [type(client_server_message) for client_server_message in self.get_unbatched_client_server_messages()])
+
+	def test_slow_messenger_does_not_block_authentication_of_other_clients(self):
+
+		send_blocking_event = threading.Event()
+		self.client_messenger_factory = RecordingClientMessengerFactory(
+			first_send_blocking_event=send_blocking_event
+		)
+		self.start_game_manager_structure(
+			client_authentication_client_messengers_total=3
+		)
+
+		slow_thread = threading.Thread(target=lambda: self.authenticate_client_request(
+			client_uuid="slow"
+		))
+		slow_thread.start()
+
+		self.assertTrue(self.client_messenger_factory.client_messengers[0].send_started_event.wait(1.0))
+
+		for client_uuid in ["first", "second"]:
+			self.authenticate_client_request(
+				client_uuid=client_uuid
+			)
+
+		self.assertEqual([0, 1, 1], [len(client_messenger.sent_client_server_messages) for client_messenger in self.client_messenger_factory.client_messengers])
+
+		# the response arrives on a different messenger than the request and is still correlated by its authentication_uuid
+		self.receive_authentication_response(
+			sent_client_server_message_index=0,
+			client_messenger_index=2
+		)
+
+		self.assertEqual("authentication_id", self.game_manager_structure.get_authentication_id(
+			client_uuid="first"
+		))
+		self.assertTrue(slow_thread.is_alive())
+
+		send_blocking_event.set()
+		slow_thread.join()
+
+		self.assertEqual([1, 1, 1], [len(client_messenger.sent_client_server_messages) for client_messenger in self.client_messenger_factory.client_messengers])
+		self.assert_metrics(
+			gauges={
+				"pending_authentications_total": 2,
+				"outstanding_authentications_per_replica": [2]
+			}
+		)
+
+	def test_metrics_count_each_authentication_outcome(self):
+
+		directory_path = tempfile.mkdtemp()
+		self.addCleanup(shutil.rmtree, directory_path)
+		metrics_file_path = os.path.join(directory_path, "metrics.jsonl")
+		self.start_game_manager_structure(
+			authentication_timeout_seconds=0.1,
+			authentication_session_token_cache_factory=AuthenticationSessionTokenCacheFactory(
+				time_to_live_seconds=60.0,
+				maximum_session_tokens_total=10
+			),
+			metrics_file_path=metrics_file_path,
+			metrics_dump_seconds=0.05
+		)
+
+		self.authenticate_client_request(
+			client_uuid="first"
+		)
+		self.receive_url_navigation_needed_response(
+			url="https://example.com/first"
+		)
+		self.receive_authentication_response()
+		self.authenticate_client_request(
+			client_uuid="first"
+		)
+		session_token = self.get_session_token()
+		self.game_manager_structure.client_disconnected(
+			client_uuid="first"
+		)
+		self.authenticate_client_request(
+			client_uuid="resumed",
+			session_token=session_token
+		)
+		for _ in range(2):
+			self.authenticate_client_request(
+				client_uuid="timed_out"
+			)
+
+		time.sleep(0.3)
+
+		metrics_snapshot = self.game_manager_structure.get_metrics_snapshot()
+
+		self.game_manager_structure.dispose()
+
+		self.assertEqual({
+			"authentication_requests_total": 5,
+			"authentication_requests_coalesced_total": 1,
+			"authentication_requests_resumed_total": 1,
+			"authentication_requests_rejected_busy_total": 0,
+			"authentication_requests_rejected_already_authenticated_total": 1,
+			"authentication_requests_failed_upstream_total": 0,
+			"url_navigations_total": 1,
+			"authentication_responses_total": 1,
+			"authentication_responses_successful_total": 1,
+			"authentication_timeouts_total": 1
+		}, metrics_snapshot["counters"])
+		self.assertEqual(1, metrics_snapshot["histograms"]["request_to_url_navigation_seconds"]["count"])
+		self.assertEqual(1, metrics_snapshot["histograms"]["request_to_response_seconds"]["count"])
+		self.assertEqual(0.5, metrics_snapshot["authentication_timeout_rate"])
+		self.assertEqual(0, metrics_snapshot["gauges"]["pending_authentications_total"])
+		self.assertEqual(1, metrics_snapshot["gauges"]["authenticated_sessions_total"])
+
+		with open(metrics_file_path, "r") as file_handle:
+			dumped_metrics_snapshots = [json.loads(line) for line in file_handle]
+
+		self.assertLess(0, len(dumped_metrics_snapshots))
+		self.assertEqual(5, dumped_metrics_snapshots[-1]["counters"]["authentication_requests_total"])
+
+	def test_datagram_channel_is_bound_to_authenticated_session(self):
+
+		server_received_datagrams = []  # type: List[Tuple[str, bytes]]
+		client_received_datagrams = []  # type: List[bytes]
+
+		self.start_game_manager_structure(
+			datagram_channel_server_factory=DatagramChannelServerFactory(
+				host="127.0.0.1",
+				port=0,
+				bind_token_time_to_live_seconds=5.0,
+				on_datagram_received=lambda client_uuid, datagram_bytes: server_received_datagrams.append((client_uuid, datagram_bytes))
+			)
+		)
+
+		self.assertFalse(self.game_manager_structure.send_datagram(
+			client_uuid="first",
+			datagram_bytes=b"state"
+		))
+
+		self.authenticate_client(
+			client_uuid="first"
+		)
+
+		self.assertIsInstance(self.get_sent_client_server_messages()[-2], AuthenticateClientResponseGameManagerClientServerMessage)
+		datagram_channel_bind = self.get_sent_client_server_messages()[-1]  # type: DatagramChannelBindGameManagerClientServerMessage
+		self.assertIsInstance(datagram_channel_bind, DatagramChannelBindGameManagerClientServerMessage)
+		self.assertEqual("first", datagram_channel_bind.get_destination_uuid())
+
+		datagram_channel_client = DatagramChannelClient(
+			host="127.0.0.1",
+			port=datagram_channel_bind.get_port(),
+			bind_token=datagram_channel_bind.get_bind_token(),
+			on_datagram_received=client_received_datagrams.append
+		)
+		self.addCleanup(datagram_channel_client.dispose)
+		datagram_channel_client.connect_to_server()
+
+		datagram_channel_client.send_to_server(
+			datagram_bytes=b"position"
+		)
+		self.assertTrue(self.game_manager_structure.send_datagram(
+			client_uuid="first",
+			datagram_bytes=b"state"
+		))
+
+		time.sleep(0.2)
+
+		self.assertEqual([("first", b"position")], server_received_datagrams)
+		self.assertEqual([b"state"], client_received_datagrams)
+
+		self.game_manager_structure.client_disconnected(
+			client_uuid="first"
+		)
+
+		self.assertFalse(self.game_manager_structure.send_datagram(
+			client_uuid="first",
+			datagram_bytes=b"state"
+		))
+
+	def test_entity_interest_updates_are_delivered_per_client(self):
+
+		spatial_index = UniformGridSpatialIndex(
+			dimensions_total=2,
+			cell_size=5.0
+		)
+		spatial_index.set_positions(
+			entity_indexes=[0, 1, 2],
+			positions=[(0, 0), (3, 0), (20, 0)]
+		)
+		self.start_game_manager_structure(
+			client_interest_manager=ClientInterestManager(
+				spatial_index=spatial_index
+			)
+		)
+
+		self.assertFalse(self.game_manager_structure.set_client_interest(
+			client_uuid="first",
+			position=(0, 0),
+			radius=5.0
+		))
+
+		for client_uuid, position in [("first", (0, 0)), ("second", (20, 0))]:
+			self.authenticate_client(
+				client_uuid=client_uuid
+			)
+			self.assertTrue(self.game_manager_structure.set_client_interest(
+				client_uuid=client_uuid,
+				position=position,
+				radius=5.0
+			))
+
+		requested_entity_indexes = []  # type: List[int]
+
+		def get_entity_json(entity_index: int) -> Dict:
+			requested_entity_indexes.append(entity_index)
+			return {"entity_index": entity_index}
+
+		def send_entity_interest_updates(*, expected_sent_client_server_messages_total: int) -> Dict[str, EntityInterestUpdateGameManagerClientServerMessage]:
+			requested_entity_indexes.clear()
+			self.get_sent_client_server_messages().clear()
+			self.assertEqual(expected_sent_client_server_messages_total, self.game_manager_structure.send_entity_interest_updates(
+				get_entity_json=get_entity_json
+			))
+			return {client_server_message.get_destination_uuid(): client_server_message for client_server_message in self.get_sent_client_server_messages() if isinstance(client_server_message, EntityInterestUpdateGameManagerClientServerMessage)}
+
+		entity_interest_update_per_client_uuid = send_entity_interest_updates(
+			expected_sent_client_server_messages_total=2
+		)
+
+		self.assertEqual([0, 1], entity_interest_update_per_client_uuid["first"].get_entered_entity_indexes())
+		self.assertEqual([{"entity_index": 0}, {"entity_index": 1}], entity_interest_update_per_client_uuid["first"].get_entity_jsons())
+		self.assertEqual([2], entity_interest_update_per_client_uuid["second"].get_entered_entity_indexes())
+		self.assertEqual([0, 1, 2], sorted(requested_entity_indexes))
+
+		# the moved entity enters the second client, while the disconnected first client is no longer sent anything
+		spatial_index.set_positions(
+			entity_indexes=[1],
+			positions=[(18, 0)]
+		)
+		self.game_manager_structure.client_disconnected(
+			client_uuid="first"
+		)
+
+		entity_interest_update_per_client_uuid = send_entity_interest_updates(
+			expected_sent_client_server_messages_total=1
+		)
+
+		self.assertEqual(["second"], list(entity_interest_update_per_client_uuid.keys()))
+		self.assertEqual([1], entity_interest_update_per_client_uuid["second"].get_entered_entity_indexes())
+		self.assertEqual([], entity_interest_update_per_client_uuid["second"].get_left_entity_indexes())
+		self.assertEqual([{"entity_index": 1}, {"entity_index": 2}], entity_interest_update_per_client_uuid["second"].get_entity_jsons())
+		self.assertEqual([1, 2], sorted(requested_entity_indexes))
+
+		# the visible entities are pushed again on every update even when nothing entered or left
+		entity_interest_update_per_client_uuid = send_entity_interest_updates(
+			expected_sent_client_server_messages_total=1
+		)
+
+		self.assertEqual([], entity_interest_update_per_client_uuid["second"].get_entered_entity_indexes())
+		self.assertEqual([{"entity_index": 1}, {"entity_index": 2}], entity_interest_update_per_client_uuid["second"].get_entity_jsons())
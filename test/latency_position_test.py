@@ -4,185 +4,7 @@ import time
 import matplotlib.pyplot as plt
 import numpy as np
 from typing import List, Tuple, Dict, Set, Callable, Type
-
-
-class Dot():
-
-	def __init__(self, position: Tuple[float, float], velocity: Tuple[float, float], acceleration: Tuple[float, float]):
-
-		self.__position = position
-		self.__velocity = velocity
-		self.__acceleration = acceleration
-		self.__time_index_offset = 0
-
-		self.__acceleration_delta = None  # type: Tuple[float, float]
-		self.__acceleration_delta_end_time_index = None  # type: float
-		self.__acceleration_delta_end_time_index_acceleration = None  # type: Tuple[float, float]
-
-	def set_positiion(self, *, position: Tuple[float, float]):
-		self.__position = position
-
-	def set_velocity(self, *, velocity: Tuple[float, float]):
-		self.__velocity = velocity
-
-	def set_acceleration(self, *, acceleration: Tuple[float, float]):
-		self.__acceleration = acceleration
-
-	def get_position(self, *, time_index: float) -> Tuple[float, float]:
-		calculated_time_index = time_index + self.__time_index_offset
-		position = list(self.__position)
-		for dimension_index in range(len(position)):
-			position[dimension_index] += self.__velocity[dimension_index] * calculated_time_index
-			if self.__acceleration_delta_end_time_index is None:
-				position[dimension_index] += (self.__acceleration[dimension_index] * calculated_time_index ** 2) / 2.0
-			else:
-				if calculated_time_index < self.__acceleration_delta_end_time_index:
-					position[dimension_index] += (self.__acceleration[dimension_index] * calculated_time_index ** 2) / 2.0
-					position[dimension_index] += (self.__acceleration_delta[dimension_index] * calculated_time_index ** 3) / 6.0
-				else:
-					position[dimension_index] += (self.__acceleration[dimension_index] * self.__acceleration_delta_end_time_index ** 2) / 2.0
-					position[dimension_index] += (self.__acceleration_delta_end_time_index_acceleration[dimension_index] * (calculated_time_index - self.__acceleration_delta_end_time_index) ** 2) / 2.0
-					position[dimension_index] += (self.__acceleration_delta[dimension_index] * self.__acceleration_delta_end_time_index ** 3) / 6.0
-		return tuple(position)
-
-	def get_velocity(self, *, time_index: float) -> Tuple[float, float]:
-		calculated_time_index = time_index + self.__time_index_offset
-		velocity = list(self.__velocity)
-		for dimension_index in range(len(velocity)):
-			if self.__acceleration_delta_end_time_index is None:
-				velocity[dimension_index] += self.__acceleration[dimension_index] * calculated_time_index
-			else:
-				if calculated_time_index < self.__acceleration_delta_end_time_index:
-					velocity[dimension_index] += self.__acceleration[dimension_index] * calculated_time_index
-					velocity[dimension_index] += (self.__acceleration_delta[dimension_index] * calculated_time_index**2) / 2.0
-				else:
-					velocity[dimension_index] += self.__acceleration[dimension_index] * self.__acceleration_delta_end_time_index
-					velocity[dimension_index] += self.__acceleration_delta_end_time_index_acceleration[dimension_index] * (calculated_time_index - self.__acceleration_delta_end_time_index)
-					velocity[dimension_index] += (self.__acceleration_delta[dimension_index] * self.__acceleration_delta_end_time_index**2) / 2.0
-		return tuple(velocity)
-
-	def get_acceleration(self, *, time_index: float) -> Tuple[float, float]:
-		calculated_time_index = time_index + self.__time_index_offset
-		acceleration = [0] * len(self.__position)
-		for dimension_index in range(len(acceleration)):
-			if self.__acceleration_delta_end_time_index is None:
-				acceleration[dimension_index] += self.__acceleration[dimension_index]
-			else:
-				if calculated_time_index < self.__acceleration_delta_end_time_index:
-					acceleration[dimension_index] += self.__acceleration[dimension_index]
-					acceleration[dimension_index] += (self.__acceleration_delta[dimension_index] * calculated_time_index)
-				else:
-					acceleration[dimension_index] += self.__acceleration_delta_end_time_index_acceleration[dimension_index]
-					acceleration[dimension_index] += (self.__acceleration_delta[dimension_index] * self.__acceleration_delta_end_time_index)
-		return tuple(self.__acceleration)
-
-	def bounce(self, *, time_index: float):
-		bounce_position = self.get_position(
-			time_index=time_index
-		)
-		bounce_velocity = self.get_velocity(
-			time_index=time_index
-		)
-		bounce_acceleration = self.get_acceleration(
-			time_index=time_index
-		)
-		self.__position = bounce_position
-		self.__velocity = (bounce_velocity[0], -bounce_velocity[1])
-		self.__acceleration = bounce_acceleration
-		calculated_time_index = time_index + self.__time_index_offset
-		if self.__acceleration_delta_end_time_index is not None:
-			self.__acceleration_delta_end_time_index -= calculated_time_index
-			if self.__acceleration_delta_end_time_index <= 0:
-				self.__acceleration_delta = None
-				self.__acceleration_delta_end_time_index = None
-				self.__acceleration_delta_end_time_index_acceleration = None
-		self.__time_index_offset = -time_index
-
-	def reflect(self, *, time_index: float):
-		reflect_position = self.get_position(
-			time_index=time_index
-		)
-		reflect_velocity = self.get_velocity(
-			time_index=time_index
-		)
-		reflect_acceleration = self.get_acceleration(
-			time_index=time_index
-		)
-		self.__position = reflect_position
-		self.__velocity = (-reflect_velocity[0], reflect_velocity[1])
-		self.__acceleration = reflect_acceleration
-		calculated_time_index = time_index + self.__time_index_offset
-		if self.__acceleration_delta_end_time_index is not None:
-			self.__acceleration_delta_end_time_index -= calculated_time_index
-			if self.__acceleration_delta_end_time_index <= 0:
-				self.__acceleration_delta = None
-				self.__acceleration_delta_end_time_index = None
-				self.__acceleration_delta_end_time_index_acceleration = None
-		self.__time_index_offset = -time_index
-
-	def set_state(self, *, position: Tuple[float, float], velocity: Tuple[float, float], acceleration: Tuple[float, float], time_index: float):
-		self.__position = position
-		self.__velocity = velocity
-		self.__acceleration = acceleration
-		calculated_time_index = time_index + self.__time_index_offset
-		if self.__acceleration_delta_end_time_index is not None:
-			self.__acceleration_delta_end_time_index -= calculated_time_index
-			if self.__acceleration_delta_end_time_index <= 0:
-				self.__acceleration_delta = None
-				self.__acceleration_delta_end_time_index = None
-				self.__acceleration_delta_end_time_index_acceleration = None
-		self.__time_index_offset = -time_index
-
-	def set_acceleration_delta(self, *, time_index: float, acceleration_delta: Tuple[float, float], end_time_index: float):
-		time_index_position = self.get_position(
-			time_index=time_index
-		)
-		time_index_velocity = self.get_velocity(
-			time_index=time_index
-		)
-		time_index_acceleration = self.get_acceleration(
-			time_index=time_index
-		)
-		self.__position = time_index_position
-		self.__velocity = time_index_velocity
-		self.__acceleration = time_index_acceleration
-		self.__time_index_offset = -time_index
-		self.__acceleration_delta = acceleration_delta
-		self.__acceleration_delta_end_time_index = end_time_index
-		self.__acceleration_delta_end_time_index_acceleration = time_index_acceleration
-
-	def merge(self, *, dot: Dot, current_time_index: float, merge_time_index_offset: float):
-		self_position = self.get_position(
-			time_index=current_time_index
-		)
-		self_velocity = self.get_velocity(
-			time_index=current_time_index
-		)
-		destination_position = dot.get_position(
-			time_index=current_time_index + merge_time_index_offset
-		)
-		destination_velocity = dot.get_velocity(
-			time_index=current_time_index + merge_time_index_offset
-		)
-		destination_acceleration = dot.get_acceleration(
-			time_index=current_time_index + merge_time_index_offset
-		)
-
-		acceleration_delta = []
-		acceleration = []
-		for dimension_index in range(len(self.__position)):
-			temp_acceleration_delta = (-12 * destination_position[dimension_index] + 6 * destination_velocity[dimension_index] * merge_time_index_offset + 12 * self_position[dimension_index] + 6 * self_velocity[dimension_index] * merge_time_index_offset) / (merge_time_index_offset**3)
-			temp_acceleration = (destination_velocity[dimension_index] - self_velocity[dimension_index]) / merge_time_index_offset - 0.5 * temp_acceleration_delta * merge_time_index_offset
-			acceleration_delta.append(temp_acceleration_delta)
-			acceleration.append(temp_acceleration)
-
-		self.__position = self_position
-		self.__velocity = self_velocity
-		self.__acceleration = tuple(acceleration)
-		self.__acceleration_delta = tuple(acceleration_delta)
-		self.__acceleration_delta_end_time_index = merge_time_index_offset
-		self.__acceleration_delta_end_time_index_acceleration = destination_acceleration
-		self.__time_index_offset = -current_time_index
+from src.austin_heller_repo.kinematics import Dot
 
 
 class DotPlotter():
@@ -0,0 +1,151 @@
+from __future__ import annotations
+import unittest
+from typing import List, Tuple, Dict, Callable, Type, Set
+import time
+import threading
+from src.austin_heller_repo.game_manager import ResponseClientServerMessageBatcher, DeadlineScheduler, BatchGameManagerClientServerMessage, AuthenticationTimeoutErrorGameManagerClientServerMessage, ClientAlreadyAuthenticatedErrorGameManagerClientServerMessage, GameManagerClientServerMessage, get_unbatched_callback
+
+
+class ResponseClientServerMessageBatcherTest(unittest.TestCase):
+
+	def test_flush_after_window(self):
+
+		deadline_scheduler = DeadlineScheduler(
+			worker_threads_total=1
+		)
+		deadline_scheduler.start()
+
+		sent_client_server_messages = []  # type: List[GameManagerClientServerMessage]
+
+		response_client_server_message_batcher = ResponseClientServerMessageBatcher(
+			flush_seconds=0.1,
+			maximum_client_server_messages_total=10,
+			deadline_scheduler=deadline_scheduler,
+			send_response=sent_client_server_messages.append
+		)
+
+		for destination_uuid in ["first", "second", "first"]:
+			response_client_server_message_batcher.add(
+				client_server_message=AuthenticationTimeoutErrorGameManagerClientServerMessage(
+					destination_uuid=destination_uuid
+				)
+			)
+
+		self.assertEqual(0, len(sent_client_server_messages))
+		self.assertEqual(3, response_client_server_message_batcher.get_pending_client_server_messages_total())
+
+		time.sleep(0.3)
+
+		self.assertEqual(2, len(sent_client_server_messages))
+		sent_client_server_message_per_destination_uuid = {client_server_message.get_destination_uuid(): client_server_message for client_server_message in sent_client_server_messages}
+		self.assertIsInstance(sent_client_server_message_per_destination_uuid["first"], BatchGameManagerClientServerMessage)
+		self.assertEqual(2, len(sent_client_server_message_per_destination_uuid["first"].get_client_server_messages()))
+		self.assertIsInstance(sent_client_server_message_per_destination_uuid["second"], AuthenticationTimeoutErrorGameManagerClientServerMessage)
+		self.assertEqual(0, response_client_server_message_batcher.get_pending_client_server_messages_total())
+
+		deadline_scheduler.dispose()
+
+	def test_flush_when_full(self):
+
+		deadline_scheduler = DeadlineScheduler(
+			worker_threads_total=1
+		)
+		deadline_scheduler.start()
+
+		sent_client_server_messages = []  # type: List[GameManagerClientServerMessage]
+
+		response_client_server_message_batcher = ResponseClientServerMessageBatcher(
+			flush_seconds=10.0,
+			maximum_client_server_messages_total=2,
+			deadline_scheduler=deadline_scheduler,
+			send_response=sent_client_server_messages.append
+		)
+
+		response_client_server_message_batcher.add(
+			client_server_message=AuthenticationTimeoutErrorGameManagerClientServerMessage(
+				destination_uuid="first"
+			)
+		)
+		response_client_server_message_batcher.add(
+			client_server_message=ClientAlreadyAuthenticatedErrorGameManagerClientServerMessage(
+				destination_uuid="first"
+			)
+		)
+
+		self.assertEqual(1, len(sent_client_server_messages))
+		self.assertEqual(0, deadline_scheduler.get_pending_deadlines_total())
+
+		unbatched_client_server_messages = []  # type: List[GameManagerClientServerMessage]
+		unbatched_callback = get_unbatched_callback(
+			callback=unbatched_client_server_messages.append
+		)
+		unbatched_callback(GameManagerClientServerMessage.parse_from_json(
+			json_object=sent_client_server_messages[0].to_json()
+		))
+
+		self.assertEqual([AuthenticationTimeoutErrorGameManagerClientServerMessage, ClientAlreadyAuthenticatedErrorGameManagerClientServerMessage], [type(client_server_message) for client_server_message in unbatched_client_server_messages])
+
+		response_client_server_message_batcher.add(
+			client_server_message=AuthenticationTimeoutErrorGameManagerClientServerMessage(
+				destination_uuid="second"
+			)
+		)
+		response_client_server_message_batcher.flush_all()
+
+		self.assertEqual(2, len(sent_client_server_messages))
+		self.assertEqual(0, deadline_scheduler.get_pending_deadlines_total())
+
+		deadline_scheduler.dispose()
+
+	def test_slow_destination_does_not_block_other_destinations(self):
+
+		deadline_scheduler = DeadlineScheduler(
+			worker_threads_total=1
+		)
+		deadline_scheduler.start()
+
+		sent_client_server_messages = []  # type: List[GameManagerClientServerMessage]
+		slow_send_started_event = threading.Event()
+		slow_send_released_event = threading.Event()
+
+		def send_response(client_server_message: GameManagerClientServerMessage):
+			if client_server_message.get_destination_uuid() == "slow":
+				slow_send_started_event.set()
+				slow_send_released_event.wait()
+			sent_client_server_messages.append(client_server_message)
+
+		response_client_server_message_batcher = ResponseClientServerMessageBatcher(
+			flush_seconds=10.0,
+			maximum_client_server_messages_total=1,
+			deadline_scheduler=deadline_scheduler,
+			send_response=send_response
+		)
+
+		slow_thread = threading.Thread(target=lambda: response_client_server_message_batcher.add(
+			client_server_message=AuthenticationTimeoutErrorGameManagerClientServerMessage(
+				destination_uuid="slow"
+			)
+		))
+		slow_thread.start()
+		self.assertTrue(slow_send_started_event.wait(1.0))
+
+		# the second message for the slow destination is queued behind the send in progress instead of overtaking it
+		response_client_server_message_batcher.add(
+			client_server_message=ClientAlreadyAuthenticatedErrorGameManagerClientServerMessage(
+				destination_uuid="slow"
+			)
+		)
+		response_client_server_message_batcher.add(
+			client_server_message=AuthenticationTimeoutErrorGameManagerClientServerMessage(
+				destination_uuid="fast"
+			)
+		)
+
+		self.assertEqual(["fast"], [client_server_message.get_destination_uuid() for client_server_message in sent_client_server_messages])
+
+		slow_send_released_event.set()
+		slow_thread.join()
+
+		self.assertEqual([("fast", AuthenticationTimeoutErrorGameManagerClientServerMessage), ("slow", AuthenticationTimeoutErrorGameManagerClientServerMessage), ("slow", ClientAlreadyAuthenticatedErrorGameManagerClientServerMessage)], [(client_server_message.get_destination_uuid(), type(client_server_message)) for client_server_message in sent_client_server_messages])
+
+		deadline_scheduler.dispose()
@@ -0,0 +1,275 @@
+from __future__ import annotations
+import unittest
+import time
+from typing import List, Tuple, Dict, Callable, Type, Set
+import numpy as np
+from src.austin_heller_repo.spatial_index import UniformGridSpatialIndex, ClientInterestManager
+
+
+def get_brute_force_collision_pairs(*, positions: np.ndarray, maximum_distance: float) -> Set[Tuple[int, int]]:
+	distances_squared = ((positions[:, np.newaxis, :] - positions[np.newaxis, :, :]) ** 2).sum(axis=2)
+	first_indexes, second_indexes = np.nonzero(np.triu(distances_squared <= maximum_distance ** 2, k=1))
+	return set(zip(first_indexes.tolist(), second_indexes.tolist()))
+
+
+def get_spatial_index(*, positions: np.ndarray, cell_size: float) -> UniformGridSpatialIndex:
+	spatial_index = UniformGridSpatialIndex(
+		dimensions_total=positions.shape[1],
+		cell_size=cell_size
+	)
+	spatial_index.set_positions(
+		entity_indexes=np.arange(positions.shape[0]),
+		positions=positions
+	)
+	return spatial_index
+
+
+class QueryCountingUniformGridSpatialIndex(UniformGridSpatialIndex):
+
+	def __init__(self, **kwargs):
+		super().__init__(**kwargs)
+
+		self.query_radius_calls_total = 0
+
+	def query_radius(self, *, position: Tuple[float, ...], radius: float) -> np.ndarray:
+		self.query_radius_calls_total += 1
+		return super().query_radius(
+			position=position,
+			radius=radius
+		)
+
+
+class UniformGridSpatialIndexTest(unittest.TestCase):
+
+	def test_initialize(self):
+
+		spatial_index = UniformGridSpatialIndex(
+			dimensions_total=2,
+			cell_size=1.0
+		)
+
+		self.assertIsNotNone(spatial_index)
+		self.assertEqual(0, spatial_index.get_entities_total())
+		self.assertEqual(0, spatial_index.query_nearest(position=(0, 0), neighbors_total=3).shape[0])
+		self.assertEqual((0, 2), spatial_index.get_collision_pairs(maximum_distance=1.0).shape)
+
+	def test_invalid_cell_size(self):
+
+		with self.assertRaises(Exception):
+			UniformGridSpatialIndex(
+				dimensions_total=2,
+				cell_size=0
+			)
+
+	def test_collision_pairs_match_brute_force(self):
+
+		random_generator = np.random.default_rng(0)
+		positions = random_generator.uniform(-50, 50, (2000, 2))
+
+		for cell_size, maximum_distance in [(2.0, 2.0), (2.0, 1.0), (1.0, 2.5)]:
+			spatial_index = get_spatial_index(
+				positions=positions,
+				cell_size=cell_size
+			)
+			collision_pairs = spatial_index.get_collision_pairs(
+				maximum_distance=maximum_distance
+			)
+			self.assertEqual(get_brute_force_collision_pairs(positions=positions, maximum_distance=maximum_distance), set(map(tuple, collision_pairs.tolist())))
+			self.assertEqual(len(collision_pairs), len(set(map(tuple, collision_pairs.tolist()))))
+
+	def test_queries_match_brute_force(self):
+
+		random_generator = np.random.default_rng(1)
+		positions = random_generator.uniform(-20, 20, (1000, 3))
+		spatial_index = get_spatial_index(
+			positions=positions,
+			cell_size=3.0
+		)
+
+		for query_index in range(20):
+			position = random_generator.uniform(-25, 25, (3, ))
+			distances = np.sqrt(((positions - position) ** 2).sum(axis=1))
+
+			self.assertEqual(np.flatnonzero(distances <= 4.0).tolist(), spatial_index.query_radius(position=position, radius=4.0).tolist())
+			self.assertEqual(np.argsort(distances, kind="stable")[:5].tolist(), spatial_index.query_nearest(position=position, neighbors_total=5).tolist())
+
+			minimum_position = position - 5.0
+			maximum_position = position + (2.0, 7.0, 3.0)
+			is_within_box = ((positions >= minimum_position) & (positions <= maximum_position)).all(axis=1)
+			self.assertEqual(np.flatnonzero(is_within_box).tolist(), spatial_index.query_box(minimum_position=minimum_position, maximum_position=maximum_position).tolist())
+
+		self.assertEqual(1000, spatial_index.query_box(minimum_position=(-1000, -1000, -1000), maximum_position=(1000, 1000, 1000)).shape[0])
+
+	def test_incremental_moves_and_removal(self):
+
+		random_generator = np.random.default_rng(2)
+		positions = random_generator.uniform(0, 30, (500, 2))
+		spatial_index = get_spatial_index(
+			positions=positions,
+			cell_size=1.5
+		)
+
+		for step_index in range(10):
+			moved_entity_indexes = random_generator.choice(500, 100, replace=False)
+			positions[moved_entity_indexes] += random_generator.normal(0, 1.0, (100, 2))
+			spatial_index.set_positions(
+				entity_indexes=moved_entity_indexes,
+				positions=positions[moved_entity_indexes]
+			)
+
+		self.assertEqual(get_brute_force_collision_pairs(positions=positions, maximum_distance=1.5), set(map(tuple, spatial_index.get_collision_pairs(maximum_distance=1.5).tolist())))
+
+		removed_entity_indexes = np.arange(0, 500, 2)
+		spatial_index.remove_entities(
+			entity_indexes=removed_entity_indexes
+		)
+		spatial_index.remove_entities(
+			entity_indexes=removed_entity_indexes
+		)
+
+		self.assertEqual(250, spatial_index.get_entities_total())
+		remaining_entity_indexes = np.arange(1, 500, 2)
+		expected_collision_pairs = set((remaining_entity_indexes[first_index], remaining_entity_indexes[second_index]) for first_index, second_index in get_brute_force_collision_pairs(positions=positions[remaining_entity_indexes], maximum_distance=1.5))
+		self.assertEqual(expected_collision_pairs, set(map(tuple, spatial_index.get_collision_pairs(maximum_distance=1.5).tolist())))
+		self.assertEqual(remaining_entity_indexes.tolist(), spatial_index.query_box(minimum_position=(-100, -100), maximum_position=(100, 100)).tolist())
+
+	def test_nearest_matches_brute_force_when_sparse(self):
+
+		random_generator = np.random.default_rng(5)
+		positions = random_generator.uniform(-60, 60, (300, 2))
+		spatial_index = get_spatial_index(
+			positions=positions,
+			cell_size=1.0
+		)
+		removed_entity_indexes = random_generator.choice(300, 250, replace=False)
+		spatial_index.remove_entities(
+			entity_indexes=removed_entity_indexes
+		)
+		remaining_entity_indexes = np.setdiff1d(np.arange(300), removed_entity_indexes)
+
+		# queries inside, at the edge of and far outside the occupied cells
+		for position in [(0.0, 0.0), (59.5, -59.5), (500.0, 3.0), (-1000.0, -1000.0)] + [tuple(position) for position in random_generator.uniform(-80, 80, (20, 2))]:
+			distances = np.sqrt(((positions[remaining_entity_indexes] - position) ** 2).sum(axis=1))
+			for neighbors_total in [1, 3, 50, 60]:
+				self.assertEqual(remaining_entity_indexes[np.argsort(distances, kind="stable")[:neighbors_total]].tolist(), spatial_index.query_nearest(position=position, neighbors_total=neighbors_total).tolist())
+
+		spatial_index.remove_entities(
+			entity_indexes=remaining_entity_indexes
+		)
+
+		self.assertEqual(0, spatial_index.query_nearest(position=(0, 0), neighbors_total=3).shape[0])
+
+		spatial_index.set_positions(
+			entity_indexes=np.array([7]),
+			positions=np.array([[200.0, 200.0]])
+		)
+
+		self.assertEqual([7], spatial_index.query_nearest(position=(0, 0), neighbors_total=3).tolist())
+
+	def test_collision_pairs_benchmark(self):
+
+		# constant density, so a linear algorithm takes about 100 times longer for 100 times the entities where a quadratic one would take 10000 times longer
+		random_generator = np.random.default_rng(3)
+		seconds_per_entities_total = {}  # type: Dict[int, float]
+		for entities_total in [1000, 10000, 100000]:
+			world_size = np.sqrt(entities_total) * 2.0
+			positions = random_generator.uniform(0, world_size, (entities_total, 2))
+			moved_positions = positions + random_generator.normal(0, 0.1, positions.shape)
+			# the fastest of a few runs, so that a single pause does not decide the ratio
+			for run_index in range(3):
+				start_time = time.perf_counter()
+				spatial_index = get_spatial_index(
+					positions=positions,
+					cell_size=1.0
+				)
+				collision_pairs = spatial_index.get_collision_pairs(
+					maximum_distance=1.0
+				)
+				spatial_index.set_positions(
+					entity_indexes=np.arange(entities_total),
+					positions=moved_positions
+				)
+				spatial_index.get_collision_pairs(
+					maximum_distance=1.0
+				)
+				seconds_per_entities_total[entities_total] = min(seconds_per_entities_total.get(entities_total, float("inf")), time.perf_counter() - start_time)
+			print(f"{entities_total} entities: {collision_pairs.shape[0]} pairs in {seconds_per_entities_total[entities_total]:.3f} seconds")
+
+		self.assertLess(seconds_per_entities_total[100000], seconds_per_entities_total[1000] * 100 * 4)
+
+	def test_client_interest_updates_only_query_changed_clients(self):
+
+		random_generator = np.random.default_rng(4)
+		positions = random_generator.uniform(0, 50, (400, 2))
+		spatial_index = QueryCountingUniformGridSpatialIndex(
+			dimensions_total=2,
+			cell_size=2.0
+		)
+		spatial_index.set_positions(
+			entity_indexes=np.arange(400),
+			positions=positions
+		)
+		client_interest_manager = ClientInterestManager(
+			spatial_index=spatial_index,
+			maximum_incremental_moved_entities_total=40
+		)
+		client_positions = random_generator.uniform(0, 50, (10, 2))
+		for client_index in range(10):
+			client_interest_manager.set_client_interest(
+				client_uuid=str(client_index),
+				position=client_positions[client_index],
+				radius=8.0
+			)
+		is_present = np.ones((400, ), dtype=np.bool_)
+
+		def assert_visible_entity_indexes_match_brute_force():
+			client_interest_updates = client_interest_manager.update()
+			self.assertEqual([str(client_index) for client_index in range(10)], [client_interest_update.get_client_uuid() for client_interest_update in client_interest_updates])
+			for client_index, client_interest_update in enumerate(client_interest_updates):
+				distances_squared = ((positions - client_positions[client_index]) ** 2).sum(axis=1)
+				self.assertEqual(np.flatnonzero(is_present & (distances_squared <= 64.0)).tolist(), client_interest_update.get_visible_entity_indexes().tolist())
+				self.assertEqual(client_interest_update.get_visible_entity_indexes().tolist(), client_interest_manager.get_visible_entity_indexes(client_uuid=str(client_index)).tolist())
+
+		assert_visible_entity_indexes_match_brute_force()
+
+		self.assertEqual(10, spatial_index.query_radius_calls_total)
+
+		# nothing moved, so nothing is queried
+		assert_visible_entity_indexes_match_brute_force()
+
+		self.assertEqual(10, spatial_index.query_radius_calls_total)
+
+		for step_index in range(5):
+			moved_entity_indexes = random_generator.choice(np.flatnonzero(is_present), 30, replace=False)
+			positions[moved_entity_indexes] += random_generator.normal(0, 5.0, (30, 2))
+			spatial_index.set_positions(
+				entity_indexes=moved_entity_indexes,
+				positions=positions[moved_entity_indexes]
+			)
+			removed_entity_indexes = random_generator.choice(np.flatnonzero(is_present), 2, replace=False)
+			is_present[removed_entity_indexes] = False
+			spatial_index.remove_entities(
+				entity_indexes=removed_entity_indexes
+			)
+			client_positions[step_index] += 3.0
+			client_interest_manager.set_client_interest(
+				client_uuid=str(step_index),
+				position=client_positions[step_index],
+				radius=8.0
+			)
+
+			assert_visible_entity_indexes_match_brute_force()
+
+			# only the client that moved is queried again
+			self.assertEqual(10 + step_index + 1, spatial_index.query_radius_calls_total)
+
+		# past the incremental limit every client queries again
+		positions += 1.0
+		spatial_index.set_positions(
+			entity_indexes=np.flatnonzero(is_present),
+			positions=positions[is_present]
+		)
+
+		assert_visible_entity_indexes_match_brute_force()
+
+		self.assertEqual(25, spatial_index.query_radius_calls_total)
@@ -0,0 +1,69 @@
+from __future__ import annotations
+import unittest
+from typing import List, Tuple, Dict, Callable, Type, Set
+import time
+from src.austin_heller_repo.game_manager import TokenBucketRateLimiter
+
+
+class TokenBucketRateLimiterTest(unittest.TestCase):
+
+	def test_initialize(self):
+
+		token_bucket_rate_limiter = TokenBucketRateLimiter(
+			tokens_per_second=1,
+			maximum_tokens_total=1
+		)
+
+		self.assertIsNotNone(token_bucket_rate_limiter)
+
+	def test_burst_then_limited(self):
+
+		token_bucket_rate_limiter = TokenBucketRateLimiter(
+			tokens_per_second=10,
+			maximum_tokens_total=3
+		)
+
+		for index in range(3):
+			self.assertEqual(0, token_bucket_rate_limiter.try_acquire_token(
+				key="first"
+			))
+
+		retry_after_seconds = token_bucket_rate_limiter.try_acquire_token(
+			key="first"
+		)
+		self.assertGreater(retry_after_seconds, 0)
+		self.assertLessEqual(retry_after_seconds, 0.1)
+
+		self.assertEqual(0, token_bucket_rate_limiter.try_acquire_token(
+			key="second"
+		))
+
+		time.sleep(retry_after_seconds + 0.01)
+
+		self.assertEqual(0, token_bucket_rate_limiter.try_acquire_token(
+			key="first"
+		))
+
+	def test_remove_key(self):
+
+		token_bucket_rate_limiter = TokenBucketRateLimiter(
+			tokens_per_second=0.1,
+			maximum_tokens_total=1
+		)
+
+		self.assertEqual(0, token_bucket_rate_limiter.try_acquire_token(
+			key="first"
+		))
+		self.assertGreater(token_bucket_rate_limiter.try_acquire_token(
+			key="first"
+		), 0)
+		self.assertEqual(1, token_bucket_rate_limiter.get_keys_total())
+
+		token_bucket_rate_limiter.remove_key(
+			key="first"
+		)
+
+		self.assertEqual(0, token_bucket_rate_limiter.get_keys_total())
+		self.assertEqual(0, token_bucket_rate_limiter.try_acquire_token(
+			key="first"
+		))
@@ -0,0 +1,70 @@
+from __future__ import annotations
+import unittest
+from typing import List, Tuple, Dict, Callable, Type, Set
+import time
+from austin_heller_repo.threading import Semaphore
+from src.austin_heller_repo.game_manager import UnorderedResponseSender, AuthenticationTimeoutErrorGameManagerClientServerMessage, ServerBusyErrorGameManagerClientServerMessage, AuthenticateClientResponseGameManagerClientServerMessage, ClientServerMessage
+
+
+class UnorderedAuthenticationTimeoutErrorGameManagerClientServerMessage(AuthenticationTimeoutErrorGameManagerClientServerMessage, is_ordered=False):
+	pass
+
+
+class UnorderedResponseSenderTest(unittest.TestCase):
+
+	def test_only_opted_out_client_server_messages_are_unordered(self):
+
+		self.assertTrue(AuthenticationTimeoutErrorGameManagerClientServerMessage(
+			destination_uuid="destination"
+		).is_ordered())
+		self.assertTrue(ServerBusyErrorGameManagerClientServerMessage(
+			retry_after_milliseconds=1000,
+			destination_uuid="destination"
+		).is_ordered())
+		self.assertTrue(AuthenticateClientResponseGameManagerClientServerMessage(
+			is_successful=True,
+			destination_uuid="destination"
+		).is_ordered())
+
+		unordered_client_server_message = UnorderedAuthenticationTimeoutErrorGameManagerClientServerMessage(
+			destination_uuid="destination"
+		)
+
+		self.assertFalse(unordered_client_server_message.is_ordered())
+		self.assertEqual(AuthenticationTimeoutErrorGameManagerClientServerMessage.get_client_server_message_type(), unordered_client_server_message.get_client_server_message_type())
+		self.assertEqual("destination", unordered_client_server_message.get_destination_uuid())
+
+	def test_slow_send_does_not_block_other_workers(self):
+
+		sent_destination_uuids = []  # type: List[str]
+		sent_destination_uuids_semaphore = Semaphore()
+
+		def send_response(client_server_message: ClientServerMessage):
+			if client_server_message.get_destination_uuid() == "slow":
+				time.sleep(0.5)
+			sent_destination_uuids_semaphore.acquire()
+			sent_destination_uuids.append(client_server_message.get_destination_uuid())
+			sent_destination_uuids_semaphore.release()
+
+		unordered_response_sender = UnorderedResponseSender(
+			worker_threads_total=2,
+			send_response=send_response
+		)
+		unordered_response_sender.start()
+
+		for destination_uuid in ["slow", "first", "second", "third"]:
+			unordered_response_sender.send(
+				client_server_message=UnorderedAuthenticationTimeoutErrorGameManagerClientServerMessage(
+					destination_uuid=destination_uuid
+				)
+			)
+
+		time.sleep(0.2)
+
+		self.assertEqual(["first", "second", "third"], sent_destination_uuids)
+
+		time.sleep(0.5)
+
+		self.assertEqual(["first", "second", "third", "slow"], sent_destination_uuids)
+
+		unordered_response_sender.dispose()